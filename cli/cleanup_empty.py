@@ -5,8 +5,10 @@
 파일 정리/이동 후 남은 빈 폴더들을 정리합니다.
 """
 
+import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Set, Optional, Tuple
 
@@ -34,35 +36,10 @@ SYSTEM_FILES = {
     '.gitignore',
 }
 
-
-def is_effectively_empty(folder: Path, ignore_system_files: bool = True) -> bool:
-    """
-    폴더가 실질적으로 비어있는지 확인
-
-    Args:
-        folder: 확인할 폴더
-        ignore_system_files: True면 시스템 파일만 있어도 비어있다고 판단
-
-    Returns:
-        비어있으면 True
-    """
-    try:
-        contents = list(folder.iterdir())
-
-        if not contents:
-            return True
-
-        if ignore_system_files:
-            # 시스템 파일만 있는지 확인
-            non_system = [
-                item for item in contents
-                if item.name not in SYSTEM_FILES
-            ]
-            return len(non_system) == 0
-
-        return False
-    except PermissionError:
-        return False
+# 삭제 작업을 한 번에 제출하는 최대 개수
+_RMDIR_BATCH_SIZE = 1024
+# 이보다 적으면 스레드 풀 없이 순차 삭제
+_MIN_FOLDERS_FOR_POOL = 32
 
 
 def find_empty_folders(
@@ -86,34 +63,31 @@ def find_empty_folders(
     if exclude is None:
         exclude = DEFAULT_EXCLUDE.copy()
 
+    target_dir = Path(target_dir)
     empty_folders = []
 
-    def scan_folder(folder: Path, depth: int = 0):
-        """재귀적으로 폴더 스캔"""
-        try:
-            for item in folder.iterdir():
-                try:
-                    if not item.is_dir():
-                        continue
-                except (PermissionError, OSError):
-                    continue
-
-                # 제외 폴더 확인
-                if item.name in exclude:
-                    continue
+    # 제외 폴더는 dirnames에서 바로 빼서 하위로 내려가지 않음, 읽을 수 없는 폴더는 os.walk가 건너뜀
+    for dirpath, dirnames, filenames in os.walk(target_dir, followlinks=False):
+        folder = Path(dirpath)
+        depth = len(folder.relative_to(target_dir).parts)
 
-                # 하위 폴더 먼저 처리 (재귀)
-                if recursive:
-                    scan_folder(item, depth + 1)
+        # 제외 폴더도 하위 폴더로 존재하면 비어있지 않은 것으로 판단하므로 가지치기 전에 확인
+        has_subdirs = bool(dirnames)
+        if recursive or depth == 0:
+            dirnames[:] = [d for d in dirnames if d not in exclude]
+        else:
+            dirnames[:] = []
 
-                # 빈 폴더 확인
-                if is_effectively_empty(item, ignore_system_files):
-                    empty_folders.append((item, depth))
+        if depth == 0 or has_subdirs:
+            continue
 
-        except (PermissionError, OSError):
-            pass
+        if ignore_system_files:
+            is_empty = all(name in SYSTEM_FILES for name in filenames)
+        else:
+            is_empty = not filenames
 
-    scan_folder(target_dir)
+        if is_empty:
+            empty_folders.append((folder, depth - 1))
 
     # 깊은 폴더부터 정렬 (삭제 시 상위 폴더도 빈 폴더가 될 수 있음)
     empty_folders.sort(key=lambda x: (-x[1], str(x[0])))
@@ -121,6 +95,30 @@ def find_empty_folders(
     return [f[0] for f in empty_folders]
 
 
+def _remove_empty_folder(folder: Path) -> Optional[str]:
+    """
+    시스템 파일을 지운 뒤 폴더 삭제
+
+    Args:
+        folder: 삭제할 빈 폴더
+
+    Returns:
+        실패 시 오류 메시지, 성공 시 None
+    """
+    try:
+        # 시스템 파일 먼저 삭제
+        for item in folder.iterdir():
+            if item.name in SYSTEM_FILES:
+                item.unlink()
+
+        # 폴더 삭제
+        folder.rmdir()
+        return None
+
+    except Exception as e:
+        return f"{folder}: {e}"
+
+
 def cleanup_empty_folders(
     target_dir: Path,
     exclude: Optional[Set[str]] = None,
@@ -175,24 +173,23 @@ def cleanup_empty_folders(
 
     # 실제 삭제
     print("\n삭제 중...")
-    success = 0
-    failed = 0
     errors = []
 
-    for folder in empty_folders:
-        try:
-            # 시스템 파일 먼저 삭제
-            for item in folder.iterdir():
-                if item.name in SYSTEM_FILES:
-                    item.unlink()
-
-            # 폴더 삭제
-            folder.rmdir()
-            success += 1
-
-        except Exception as e:
-            failed += 1
-            errors.append(f"{folder}: {e}")
+    # 후보는 모두 하위 폴더가 없는 폴더라 서로 겹치지 않으므로 병렬로 삭제해도 안전
+    if len(empty_folders) < _MIN_FOLDERS_FOR_POOL:
+        results = map(_remove_empty_folder, empty_folders)
+        errors = [err for err in results if err is not None]
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            for start in range(0, len(empty_folders), _RMDIR_BATCH_SIZE):
+                batch = empty_folders[start:start + _RMDIR_BATCH_SIZE]
+                errors.extend(
+                    err for err in executor.map(_remove_empty_folder, batch)
+                    if err is not None
+                )
+
+    failed = len(errors)
+    success = len(empty_folders) - failed
 
     print(f"\n완료: 삭제 {success}개, 실패 {failed}개")
 
@@ -91,7 +91,7 @@ def organize_folders(
             dest.parent.mkdir(parents=True, exist_ok=True)
 
             # 폴더 이동
-            shutil.move(str(source), str(dest))
+            shutil.move(source, dest)
             print(f"  OK: {source.name} -> {group_name}/")
             success += 1
 
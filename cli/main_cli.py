@@ -108,7 +108,7 @@ def _read_file_content(file_info) -> str:
     """파일 내용 미리보기 읽기"""
     content_preview = ""
     try:
-        ext = file_info.path.suffix.lower()
+        ext = file_info.suffix_lower
         if ext in {'.txt', '.md', '.py', '.js', '.json', '.csv', '.log', '.rst'}:
             with open(file_info.path, 'r', encoding='utf-8', errors='ignore') as f:
                 content_preview = f.read(2000)
@@ -155,89 +155,43 @@ def _classify_with_llm(organizer, files, llm_classifier, config, include_year, i
     ]
 
     results = []
-    total = len(files)
     batch_size = 20  # 배치당 파일 수
 
-    print(f"   LLM 분류 진행 중... (배치 크기: {batch_size})")
-
-    # 배치 처리 가능 여부 확인
-    provider = llm_classifier.provider
-    use_batch = hasattr(provider, 'classify_files_batch')
-
-    if use_batch and total > 1:
-        # 배치 처리
-        for batch_start in range(0, total, batch_size):
-            batch_end = min(batch_start + batch_size, total)
-            batch_files = files[batch_start:batch_end]
-
-            print(f"   배치 처리: {batch_start + 1}-{batch_end}/{total}")
-
-            # 배치 데이터 준비
-            batch_data = []
-            for file_info in batch_files:
-                content_preview = _read_file_content(file_info)
-                batch_data.append({
-                    "filename": file_info.path.name,
-                    "content_preview": content_preview
-                })
-
-            # 배치 분류 호출
-            batch_results = provider.classify_files_batch(batch_data, available_categories)
-
-            # 결과 매핑
-            for i, file_info in enumerate(batch_files):
-                if i < len(batch_results):
-                    llm_result = batch_results[i]
-                    category = llm_result.get("category", "기타")
-                    confidence = llm_result.get("confidence", 0.5)
-                else:
-                    category = "기타"
-                    confidence = 0.1
-
-                file_date = datetime.fromtimestamp(file_info.modified_time)
-
-                result = ClassificationResult(
-                    file_info=file_info,
-                    category=category,
-                    subcategory=None,
-                    year=file_date.year if include_year else None,
-                    month=file_date.month if include_month else None,
-                    confidence=confidence,
-                    keywords=["llm_classified"]
-                )
-                results.append(result)
+    # 배치를 지원하는 제공자는 batch_size개씩 한 요청으로, 아니면 파일별 요청을 동시에 보냄
+    if llm_classifier.provider.supports_batch:
+        print(f"   LLM 분류 진행 중... (배치 크기: {batch_size})")
     else:
-        # 개별 처리 (폴백)
-        for i, file_info in enumerate(files):
-            if (i + 1) % 10 == 0 or i == 0:
-                print(f"   진행: {i + 1}/{total}")
-
-            content_preview = _read_file_content(file_info)
-
-            llm_result = llm_classifier.classify_file(
-                filename=file_info.path.name,
-                content_preview=content_preview,
-                available_categories=available_categories
-            )
-
-            category = llm_result.get("category", "기타")
-            confidence = llm_result.get("confidence", 0.5)
-
-            file_date = datetime.fromtimestamp(file_info.modified_time)
+        print("   LLM 분류 진행 중... (동시 요청 최대 10개)")
 
-            result = ClassificationResult(
-                file_info=file_info,
-                category=category,
-                subcategory=None,
-                year=file_date.year if include_year else None,
-                month=file_date.month if include_month else None,
-                confidence=confidence,
-                keywords=["llm_classified"]
-            )
-            results.append(result)
+    items = [
+        {"filename": file_info.path.name, "content_preview": _read_file_content(file_info)}
+        for file_info in files
+    ]
+    llm_results = llm_classifier.classify_files(items, available_categories, batch_size=batch_size)
+
+    for file_info, llm_result in zip(files, llm_results):
+        category = llm_result.get("category", "기타")
+        confidence = llm_result.get("confidence", 0.5)
+
+        file_date = datetime.fromtimestamp(file_info.modified_time)
+
+        result = ClassificationResult(
+            file_info=file_info,
+            category=category,
+            subcategory=None,
+            year=file_date.year if include_year else None,
+            month=file_date.month if include_month else None,
+            confidence=confidence,
+            keywords=["llm_classified"]
+        )
+        results.append(result)
 
     print(f"   LLM 분류 완료: {len(results)}개 파일")
 
+    stats = llm_classifier.get_stats()
+    print(f"   (확장자 규칙 {stats['rule']}개, 캐시 {stats['cache']}개, LLM 요청 {stats['llm']}개)")
+    organizer.logger.info("LLM 분류 경로 통계", details=stats)
+
     return results
 
 
@@ -335,7 +289,7 @@ def run_organizer(
         # 분류 대상 파일만 필터링
         classify_files = [
             f for f in files
-            if f.path.suffix.lower() in classify_extensions
+            if f.suffix_lower in classify_extensions
         ]
         print(f"   분류 대상: {len(classify_files):,}개 (문서/이미지)")
 
@@ -344,8 +298,8 @@ def run_organizer(
             if llm_classifier:
                 # 문서 파일과 이미지 파일 분리
                 doc_extensions = {'.pdf', '.doc', '.docx', '.hwp', '.hwpx', '.txt', '.md', '.ppt', '.pptx', '.xls', '.xlsx'}
-                doc_files = [f for f in classify_files if f.path.suffix.lower() in doc_extensions]
-                other_files = [f for f in classify_files if f.path.suffix.lower() not in doc_extensions]
+                doc_files = [f for f in classify_files if f.suffix_lower in doc_extensions]
+                other_files = [f for f in classify_files if f.suffix_lower not in doc_extensions]
 
                 print(f"   문서 파일 (LLM 분류): {len(doc_files)}개")
                 print(f"   기타 파일 (기본 분류): {len(other_files)}개")
@@ -412,8 +366,9 @@ def run_organizer(
 
             if not execute:
                 # 드라이 런 보고서
-                report = organizer.get_dry_run_report()
-                print(report)
+                sys.stdout.writelines(
+                    line + "\n" for line in organizer.iter_dry_run_report()
+                )
             else:
                 results = organizer.execute(dry_run=False)
                 report = organizer.get_execution_report(results)
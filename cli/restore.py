@@ -19,6 +19,8 @@ def parse_log_file(log_path: Path) -> List[Tuple[str, str]]:
     """
     JSON 로그 파일에서 이동 기록 파싱
 
+    한 줄에 항목 하나인 .jsonl 로그와 이전 버전의 .json 로그 모두 지원
+
     Returns:
         [(원본경로, 현재경로), ...] 리스트
     """
@@ -27,11 +29,23 @@ def parse_log_file(log_path: Path) -> List[Tuple[str, str]]:
     print(f"로그 파일 읽는 중: {log_path}")
 
     with open(log_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+        if log_path.suffix == '.jsonl':
+            entries = []
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 중단된 세션의 마지막 줄 등 깨진 줄은 무시
+                    continue
+                # 세션 시작/종료 정보 줄은 로그 항목이 아님
+                if 'action' in record:
+                    entries.append(record)
+        else:
+            entries = json.load(f)['entries']
 
-    print(f"총 {data['total_entries']:,}개 로그 항목")
+    print(f"총 {len(entries):,}개 로그 항목")
 
-    for entry in data['entries']:
+    for entry in entries:
         action = entry.get('action', '')
 
         # "이동 완료: 원본 -> 대상" 형식 파싱
@@ -99,7 +113,7 @@ def restore_files(
                 original.parent.mkdir(parents=True, exist_ok=True)
 
                 # 파일 이동 (현재 -> 원본)
-                shutil.move(str(current), str(original))
+                shutil.move(current, original)
                 results['success'] += 1
 
             except Exception as e:
@@ -142,7 +156,8 @@ def find_log_files(log_dir: Optional[Path] = None) -> List[Path]:
     if not log_dir.exists():
         return []
 
-    return sorted(log_dir.glob("organizer_*.json"), reverse=True)
+    logs = list(log_dir.glob("organizer_*.jsonl")) + list(log_dir.glob("organizer_*.json"))
+    return sorted(logs, key=lambda p: p.name, reverse=True)
 
 
 def main():
@@ -8,8 +8,10 @@ tkinter 기반 그래픽 인터페이스
 import sys
 import threading
 import queue
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, Set
+from types import SimpleNamespace
+from typing import Dict, Optional, Set
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 
@@ -35,7 +37,7 @@ class FileOrganizerGUI:
     }
 
     # 분류 대상 확장자
-    DEFAULT_CLASSIFY_EXT = {
+    DEFAULT_CLASSIFY_EXT = frozenset({
         # 문서
         '.pdf', '.doc', '.docx', '.hwp', '.hwpx',
         '.xls', '.xlsx', '.xlsm', '.csv',
@@ -45,7 +47,13 @@ class FileOrganizerGUI:
         '.svg', '.webp', '.tiff', '.tif',
         # 압축
         '.zip', '.rar', '.7z', '.tar', '.gz',
-    }
+    })
+
+    # 로그 창 최대 줄 수
+    LOG_MAX_LINES = 10000
+
+    # 틱당 처리할 최대 로그 메시지 수 (나머지는 다음 틱에 처리)
+    LOG_DRAIN_LIMIT = 256
 
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -75,8 +83,9 @@ class FileOrganizerGUI:
 
         # 작업 상태
         self.is_running = False
-        self.message_queue = queue.Queue()
+        self.message_queue = queue.SimpleQueue()
         self.preview_operations = []  # 미리보기 작업 저장
+        self._preview_win: Optional[tk.Toplevel] = None  # 재사용하는 미리보기 창
 
         self._create_widgets()
         self._start_message_handler()
@@ -221,8 +230,9 @@ class FileOrganizerGUI:
 
     def _update_excluded_display(self):
         """제외 폴더 표시 업데이트"""
-        display = ", ".join(sorted(self._excluded_set))
-        self.excluded_dirs.set(display)
+        # 목록이 바뀔 때만 정렬/결합하고 미리보기 요약에서도 재사용
+        self._excluded_joined = ", ".join(sorted(self._excluded_set))
+        self.excluded_dirs.set(self._excluded_joined)
 
     def _add_excluded_dir(self):
         """제외 폴더 추가"""
@@ -539,6 +549,60 @@ class FileOrganizerGUI:
             model=model
         )
 
+    def _snapshot_settings(self) -> SimpleNamespace:
+        """
+        작업 스레드에서 쓸 설정값을 메인 스레드에서 한 번에 읽어 둠
+
+        작업 중에는 Tk 변수를 다시 읽지 않음 (.get()마다 Tcl 호출이 필요하고
+        작업 스레드에서 Tk에 접근하는 것도 피하기 위함)
+
+        Returns:
+            설정값 네임스페이스
+        """
+        return SimpleNamespace(
+            target=Path(self.target_dir.get()),
+            archive=Path(self.archive_dir.get()),
+            dry_run=self.dry_run.get(),
+            include_duplicates=self.include_duplicates.get(),
+            include_classify=self.include_classify.get(),
+            include_year=self.include_year.get(),
+            include_month=self.include_month.get(),
+            cleanup_empty=self.cleanup_empty.get(),
+            excluded_dirs=frozenset(self._excluded_set),
+            llm_config=self._get_llm_config(),
+        )
+
+    def _assign_target_paths(self, classifications, organized_archive: Path, settings: SimpleNamespace):
+        """
+        분류 결과별 이동 대상 경로 지정
+
+        (카테고리, 연도, 월) 조합별 폴더 경로는 한 번만 만들고 파일명만 붙임
+
+        Args:
+            classifications: ClassificationResult 리스트
+            organized_archive: 정리 폴더 경로
+            settings: _snapshot_settings() 결과
+        """
+        include_year = settings.include_year
+        include_month = settings.include_month
+        dir_cache: Dict[tuple, Path] = {}
+
+        for result in classifications:
+            year = result.year if include_year and result.year else None
+            month = result.month if include_month and result.month else None
+            key = (result.category, year, month)
+
+            target_dir = dir_cache.get(key)
+            if target_dir is None:
+                target_dir = organized_archive / result.category
+                if year:
+                    target_dir = target_dir / str(year)
+                if month:
+                    target_dir = target_dir / f"{month:02d}"
+                dir_cache[key] = target_dir
+
+            result.target_path = target_dir / result.file_info.path.name
+
     def _show_preview(self):
         """미리보기 창 표시"""
         if self.is_running:
@@ -555,14 +619,15 @@ class FileOrganizerGUI:
         self.run_button.config(state="disabled")
         self.status_var.set("미리보기 생성 중...")
 
-        thread = threading.Thread(target=self._collect_preview, daemon=True)
+        settings = self._snapshot_settings()
+        thread = threading.Thread(target=self._collect_preview, args=(settings,), daemon=True)
         thread.start()
 
-    def _collect_preview(self):
+    def _collect_preview(self, settings: SimpleNamespace):
         """미리보기 데이터 수집"""
         try:
-            target = Path(self.target_dir.get())
-            archive = Path(self.archive_dir.get())
+            target = settings.target
+            archive = settings.archive
 
             # 설정 생성
             config = OrganizerConfig(
@@ -571,47 +636,40 @@ class FileOrganizerGUI:
                 dry_run=True,
                 use_recycle_bin=False,
             )
-            config.excluded_dirs = self._excluded_set.copy()
+            config.excluded_dirs = settings.excluded_dirs
 
             # LLM 설정
-            llm_config = self._get_llm_config()
+            llm_config = settings.llm_config
 
             organizer = FileOrganizer(config, llm_config=llm_config)
 
-            # 파일 스캔
-            files = organizer.scan_directories()
-
-            # 중복 파일 정보를 먼저 수집
-            duplicates = []
-            if self.include_duplicates.get():
-                duplicates = organizer.find_duplicates()
-
-            # 분류 정보 수집 (중복 제외 후 진행)
-            classifications = []
-            if self.include_classify.get():
-                classify_files = [
-                    f for f in files
-                    if f.path.suffix.lower() in self.DEFAULT_CLASSIFY_EXT
-                ]
-
-                if classify_files:
-                    classifications = organizer.classify_files(
-                        classify_files, by_content=True, by_date=True, exclude_duplicates=True, keep_strategy="newest"
-                    )
+            try:
+                # 파일 스캔
+                files = organizer.scan_directories()
+
+                # 중복 파일 정보를 먼저 수집
+                duplicates = []
+                if settings.include_duplicates:
+                    duplicates = organizer.find_duplicates()
 
-                    for result in classifications:
-                        path_parts = [config.organized_archive, result.category]
-                        if self.include_year.get() and result.year:
-                            path_parts.append(str(result.year))
-                        if self.include_month.get() and result.month:
-                            path_parts.append(f"{result.month:02d}")
-                        target_dir = Path(*[str(p) for p in path_parts])
-                        result.target_path = target_dir / result.file_info.path.name
+                # 분류 정보 수집 (중복 제외 후 진행)
+                classifications = []
+                if settings.include_classify:
+                    ext_set = self.DEFAULT_CLASSIFY_EXT
+                    classify_files = [f for f in files if f.suffix_lower in ext_set]
+
+                    if classify_files:
+                        classifications = organizer.classify_files(
+                            classify_files, by_content=True, by_date=True, exclude_duplicates=True, keep_strategy="newest"
+                        )
+                        self._assign_target_paths(classifications, config.organized_archive, settings)
 
-            # 미리보기 창 표시
-            self.root.after(0, lambda: self._show_preview_window(
-                files, classifications, duplicates, config
-            ))
+                # 미리보기 창 표시
+                self.root.after(0, lambda: self._show_preview_window(
+                    files, classifications, duplicates, config
+                ))
+            finally:
+                organizer.finalize()
 
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("오류", f"미리보기 생성 실패:\n{e}"))
@@ -620,38 +678,132 @@ class FileOrganizerGUI:
             self.root.after(0, lambda: self.run_button.config(state="normal"))
             self.root.after(0, lambda: self.status_var.set("준비"))
 
-    def _show_preview_window(self, files, classifications, duplicates, config):
-        """미리보기 창 생성 및 표시"""
+    def _build_preview_window(self):
+        """미리보기 창 위젯 생성 (최초 1회만 생성 후 재사용)"""
         preview_window = tk.Toplevel(self.root)
         preview_window.title("파일 정리 미리보기")
         preview_window.geometry("900x600")
+        # 닫기 버튼은 창을 숨기기만 하고 위젯은 다음 미리보기에서 재사용
+        preview_window.protocol("WM_DELETE_WINDOW", preview_window.withdraw)
+        preview_window.bind("<Destroy>", self._on_preview_destroy)
 
         # 탭 생성
         notebook = ttk.Notebook(preview_window)
         notebook.pack(fill="both", expand=True, padx=5, pady=5)
 
         # 탭1: 분류 미리보기
-        if classifications:
-            class_frame = ttk.Frame(notebook)
-            notebook.add(class_frame, text=f"분류 예정 파일 ({len(classifications)}개)")
+        class_frame = ttk.Frame(notebook)
+        notebook.add(class_frame, text="분류 예정 파일")
 
-            tree = ttk.Treeview(
-                class_frame,
-                columns=("파일명", "현재위치", "이동예정경로", "카테고리"),
-                height=20
-            )
-            tree.column("#0", width=0, stretch=tk.NO)
-            tree.column("파일명", width=150)
-            tree.column("현재위치", width=250)
-            tree.column("이동예정경로", width=250)
-            tree.column("카테고리", width=100)
-
-            tree.heading("#0", text="")
-            tree.heading("파일명", text="파일명")
-            tree.heading("현재위치", text="현재 위치")
-            tree.heading("이동예정경로", text="이동 예정 경로")
-            tree.heading("카테고리", text="카테고리")
+        tree = ttk.Treeview(
+            class_frame,
+            columns=("파일명", "현재위치", "이동예정경로", "카테고리"),
+            height=20
+        )
+        # 열 설정은 생성 시 한 번만 (값 열은 창 크기에 맞춰 늘어남)
+        tree.column("#0", width=0, minwidth=0, stretch=tk.NO)
+        tree.column("파일명", width=150, minwidth=80)
+        tree.column("현재위치", width=250, minwidth=100)
+        tree.column("이동예정경로", width=250, minwidth=100)
+        tree.column("카테고리", width=100, minwidth=60)
+        tree.tag_configure("odd", background="#f7f7f7")
+        tree.tag_configure("even", background="#ffffff")
+
+        tree.heading("#0", text="")
+        tree.heading("파일명", text="파일명")
+        tree.heading("현재위치", text="현재 위치")
+        tree.heading("이동예정경로", text="이동 예정 경로")
+        tree.heading("카테고리", text="카테고리")
+
+        # 통계 라벨은 트리보다 먼저 하단에 배치
+        class_stats = ttk.Label(class_frame, relief="sunken")
+        class_stats.pack(side="bottom", fill="x", padx=5, pady=(0, 5))
+
+        scrollbar = ttk.Scrollbar(class_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+
+        tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        scrollbar.pack(side="right", fill="y", pady=5)
+
+        self._preview_class_frame = class_frame
+        self._preview_tree_class = tree
+        self._preview_class_stats = class_stats
+
+        # 탭2: 중복 파일
+        dup_frame = ttk.Frame(notebook)
+        notebook.add(dup_frame, text="중복 파일")
+
+        tree = ttk.Treeview(
+            dup_frame,
+            columns=("파일명", "위치", "크기"),
+            height=20
+        )
+        tree.column("#0", width=30, minwidth=30, stretch=tk.NO)
+        tree.column("파일명", width=200, minwidth=80)
+        tree.column("위치", width=350, minwidth=100)
+        tree.column("크기", width=80, minwidth=60)
+        tree.tag_configure("odd", background="#f7f7f7")
+        tree.tag_configure("even", background="#ffffff")
+
+        tree.heading("#0", text="그룹")
+        tree.heading("파일명", text="파일명")
+        tree.heading("위치", text="위치")
+        tree.heading("크기", text="크기")
+
+        dup_stats = ttk.Label(dup_frame, relief="sunken")
+        dup_stats.pack(side="bottom", fill="x", padx=5, pady=(0, 5))
+
+        scrollbar = ttk.Scrollbar(dup_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscroll=scrollbar.set)
+
+        tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        scrollbar.pack(side="right", fill="y", pady=5)
+
+        self._preview_dup_frame = dup_frame
+        self._preview_tree_dup = tree
+        self._preview_dup_stats = dup_stats
+
+        # 탭3: 종합 통계
+        stats_frame = ttk.Frame(notebook)
+        notebook.add(stats_frame, text="종합 통계")
+
+        text_widget = scrolledtext.ScrolledText(stats_frame, wrap=tk.WORD, height=25)
+        text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        text_widget.config(state="disabled")
+
+        self._preview_stats_frame = stats_frame
+        self._preview_summary_text = text_widget
+        self._preview_notebook = notebook
+        self._preview_win = preview_window
+
+    def _on_preview_destroy(self, event):
+        """미리보기 창이 실제로 파괴되면 캐시 해제"""
+        # 자식 위젯의 <Destroy> 이벤트도 전달되므로 창 자신인지 확인
+        if event.widget is self._preview_win:
+            self._preview_win = None
+
+    def _show_preview_window(self, files, classifications, duplicates, config):
+        """미리보기 창 표시 (기존 창이 있으면 데이터만 갱신)"""
+        if self._preview_win is None or not self._preview_win.winfo_exists():
+            self._build_preview_window()
+        else:
+            self._preview_win.deiconify()
+            self._preview_win.lift()
+
+        notebook = self._preview_notebook
 
+        # 절약 가능 용량은 한 번만 계산 (그룹 내 파일은 모두 같은 크기)
+        total_dup_size = sum(group.wasted_space for group in duplicates)
+
+        # 탭1: 분류 미리보기
+        tree = self._preview_tree_class
+        tree.delete(*tree.get_children())
+        notebook.tab(
+            self._preview_class_frame,
+            text=f"분류 예정 파일 ({len(classifications)}개)",
+            state="normal" if classifications else "hidden"
+        )
+        if classifications:
             for idx, result in enumerate(classifications[:100]):
                 file_info = result.file_info
                 target_path = result.target_path if hasattr(result, 'target_path') else "미정"
@@ -660,67 +812,38 @@ class FileOrganizerGUI:
                     str(file_info.path.parent),
                     str(target_path.parent) if target_path != "미정" else "미정",
                     result.category
-                ))
-
-            scrollbar = ttk.Scrollbar(class_frame, orient="vertical", command=tree.yview)
-            tree.configure(yscroll=scrollbar.set)
-
-            tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-            scrollbar.pack(side="right", fill="y", pady=5)
+                ), tags=("odd" if idx % 2 else "even",))
 
             # 통계
-            stats_text = f"분류될 파일: {len(classifications)}개"
-            ttk.Label(class_frame, text=stats_text, relief="sunken").pack(fill="x", padx=5, pady=(0, 5))
+            self._preview_class_stats.config(text=f"분류될 파일: {len(classifications)}개")
 
         # 탭2: 중복 파일
+        tree = self._preview_tree_dup
+        tree.delete(*tree.get_children())
+        notebook.tab(
+            self._preview_dup_frame,
+            text=f"중복 파일 ({len(duplicates)}개 그룹)",
+            state="normal" if duplicates else "hidden"
+        )
         if duplicates:
-            dup_frame = ttk.Frame(notebook)
-            notebook.add(dup_frame, text=f"중복 파일 ({len(duplicates)}개 그룹)")
-
-            tree = ttk.Treeview(
-                dup_frame,
-                columns=("파일명", "위치", "크기"),
-                height=20
-            )
-            tree.column("#0", width=30, stretch=tk.NO)
-            tree.column("파일명", width=200)
-            tree.column("위치", width=350)
-            tree.column("크기", width=80)
-
-            tree.heading("#0", text="그룹")
-            tree.heading("파일명", text="파일명")
-            tree.heading("위치", text="위치")
-            tree.heading("크기", text="크기")
-
             for group_idx, group in enumerate(duplicates[:50]):
-                parent = tree.insert("", "end", text=f"G{group_idx+1}", values=("", "", ""))
+                # 그룹 단위로 줄무늬 태그 지정
+                tags = ("odd" if group_idx % 2 else "even",)
+                parent = tree.insert("", "end", text=f"G{group_idx+1}", values=("", "", ""), tags=tags)
                 for file_info in group.files[:10]:
                     size_mb = file_info.size / (1024 * 1024)
                     tree.insert(parent, "end", text="", values=(
                         file_info.path.name,
                         str(file_info.path.parent),
                         f"{size_mb:.1f} MB"
-                    ))
-
-            scrollbar = ttk.Scrollbar(dup_frame, orient="vertical", command=tree.yview)
-            tree.configure(yscroll=scrollbar.set)
-
-            tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-            scrollbar.pack(side="right", fill="y", pady=5)
+                    ), tags=tags)
 
             # 통계
-            total_dup_size = sum(
-                min(f.size for f in group.files) * (len(group.files) - 1)
-                for group in duplicates
-            )
             size_mb = total_dup_size / (1024 * 1024)
             stats_text = f"중복 그룹: {len(duplicates)}개 | 절약 가능: {size_mb:.1f} MB"
-            ttk.Label(dup_frame, text=stats_text, relief="sunken").pack(fill="x", padx=5, pady=(0, 5))
+            self._preview_dup_stats.config(text=stats_text)
 
         # 탭3: 종합 통계
-        stats_frame = ttk.Frame(notebook)
-        notebook.add(stats_frame, text="종합 통계")
-
         summary_text = f"""
 파일 정리 미리보기 요약
 
@@ -744,10 +867,6 @@ class FileOrganizerGUI:
 - 중복 그룹: {len(duplicates)}개
 """
         if duplicates:
-            total_dup_size = sum(
-                min(f.size for f in group.files) * (len(group.files) - 1)
-                for group in duplicates
-            )
             size_mb = total_dup_size / (1024 * 1024)
             summary_text += f"- 절약 가능: {size_mb:.1f} MB\n"
 
@@ -755,26 +874,49 @@ class FileOrganizerGUI:
 【설정】
 - 대상 폴더: {self.target_dir.get()}
 - 저장 폴더: {self.archive_dir.get()}
-- 제외 폴더: {', '.join(sorted(self._excluded_set))}
+- 제외 폴더: {self._excluded_joined}
 """
 
-        text_widget = scrolledtext.ScrolledText(stats_frame, wrap=tk.WORD, height=25)
-        text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+        text_widget = self._preview_summary_text
+        text_widget.config(state="normal")
+        text_widget.delete("1.0", "end")
         text_widget.insert("1.0", summary_text)
         text_widget.config(state="disabled")
 
+        # 내용이 있는 첫 탭을 선택
+        if classifications:
+            notebook.select(self._preview_class_frame)
+        elif duplicates:
+            notebook.select(self._preview_dup_frame)
+        else:
+            notebook.select(self._preview_stats_frame)
+
     def _start_message_handler(self):
         """메시지 핸들러 시작"""
         def process_messages():
+            # 쌓인 메시지를 모아 틱(100ms)당 한 번만 위젯 갱신
+            lines = []
+            message_queue = self.message_queue
             try:
-                while True:
-                    msg = self.message_queue.get_nowait()
-                    self.log_text.config(state="normal")
-                    self.log_text.insert("end", msg + "\n")
-                    self.log_text.see("end")
-                    self.log_text.config(state="disabled")
+                for _ in range(self.LOG_DRAIN_LIMIT):
+                    lines.append(message_queue.get_nowait())
             except queue.Empty:
                 pass
+
+            if lines:
+                log_text = self.log_text
+                log_text.config(state="normal")
+                log_text.insert("end", "\n".join(lines) + "\n")
+
+                # 최대 줄 수를 넘으면 오래된 앞쪽 절반 삭제 (위젯 메모리 제한)
+                line_count = int(log_text.index("end-1c").split(".")[0])
+                if line_count > self.LOG_MAX_LINES:
+                    cut = line_count - self.LOG_MAX_LINES // 2
+                    log_text.delete("1.0", f"{cut}.0")
+
+                log_text.see("end")
+                log_text.config(state="disabled")
+
             self.root.after(100, process_messages)
 
         self.root.after(100, process_messages)
@@ -811,15 +953,16 @@ class FileOrganizerGUI:
         self.status_var.set("실행 중...")
 
         # 백그라운드 스레드에서 실행
-        thread = threading.Thread(target=self._run_in_background, daemon=True)
+        settings = self._snapshot_settings()
+        thread = threading.Thread(target=self._run_in_background, args=(settings,), daemon=True)
         thread.start()
 
-    def _run_in_background(self):
+    def _run_in_background(self, settings: SimpleNamespace):
         """백그라운드 실행"""
         try:
-            target = Path(self.target_dir.get())
-            archive = Path(self.archive_dir.get())
-            dry_run = self.dry_run.get()
+            target = settings.target
+            archive = settings.archive
+            dry_run = settings.dry_run
 
             self._log("=" * 50)
             self._log(f"파일 정리 시작 {'(미리보기)' if dry_run else '(실제 실행)'}")
@@ -834,10 +977,10 @@ class FileOrganizerGUI:
                 dry_run=dry_run,
                 use_recycle_bin=False,
             )
-            config.excluded_dirs = self._excluded_set.copy()
+            config.excluded_dirs = settings.excluded_dirs
 
             # LLM 설정
-            llm_config = self._get_llm_config()
+            llm_config = settings.llm_config
 
             organizer = FileOrganizer(config, llm_config=llm_config)
 
@@ -848,9 +991,11 @@ class FileOrganizerGUI:
                 self._log(f"  스캔된 파일: {len(files):,}개")
 
                 # 2. 중복 파일
-                if self.include_duplicates.get():
+                if settings.include_duplicates:
                     self._log("\n[2단계] 중복 파일 탐지...")
-                    duplicates = organizer.find_duplicates()
+                    duplicates = organizer.find_duplicates(
+                        parallel=True, should_stop=lambda: not self.is_running
+                    )
                     if duplicates:
                         summary = organizer.duplicate_finder.get_summary(duplicates)
                         self._log(f"  중복 그룹: {summary['duplicate_groups']}개")
@@ -864,16 +1009,13 @@ class FileOrganizerGUI:
                 self._log(f"  버전 그룹: {len(versions)}개")
 
                 # 4. 분류
-                if self.include_classify.get():
+                if settings.include_classify:
                     self._log("\n[4단계] 문서/이미지 분류...")
-                    classify_files = [
-                        f for f in files
-                        if f.path.suffix.lower() in self.DEFAULT_CLASSIFY_EXT
-                    ]
+                    ext_set = self.DEFAULT_CLASSIFY_EXT
+                    classify_files = [f for f in files if f.suffix_lower in ext_set]
                     self._log(f"  분류 대상: {len(classify_files):,}개")
 
-                    # LLM 사용 여부 표시
-                    llm_config = self._get_llm_config()
+                    # LLM 사용 여부 표시 (위에서 만든 설정 재사용)
                     if llm_config and llm_config.provider != "none":
                         self._log(f"  📡 LLM 분류 활성화: {llm_config.provider}")
                         self._log(f"  ⚠️ LLM 분류는 시간이 오래 걸릴 수 있습니다...")
@@ -884,15 +1026,7 @@ class FileOrganizerGUI:
                         classifications = organizer.classify_files(
                             classify_files, by_content=True, by_date=True, exclude_duplicates=True, keep_strategy="newest"
                         )
-
-                        for result in classifications:
-                            path_parts = [config.organized_archive, result.category]
-                            if self.include_year.get() and result.year:
-                                path_parts.append(str(result.year))
-                            if self.include_month.get() and result.month:
-                                path_parts.append(f"{result.month:02d}")
-                            target_dir = Path(*[str(p) for p in path_parts])
-                            result.target_path = target_dir / result.file_info.path.name
+                        self._assign_target_paths(classifications, config.organized_archive, settings)
 
                         organizer._classifications = classifications
 
@@ -903,9 +1037,9 @@ class FileOrganizerGUI:
                 # 5. 계획
                 self._log("\n[5단계] 정리 계획...")
                 operations = organizer.plan_cleanup(
-                    duplicates=self.include_duplicates.get(),
+                    duplicates=settings.include_duplicates,
                     versions=False,
-                    organize=self.include_classify.get(),
+                    organize=settings.include_classify,
                     keep_strategy="newest"
                 )
                 self._log(f"  계획된 작업: {len(operations):,}개")
@@ -914,14 +1048,15 @@ class FileOrganizerGUI:
                 if operations:
                     self._log(f"\n[6단계] 실행...")
                     if dry_run:
-                        report = organizer.get_dry_run_report()
-                        for line in report.split('\n')[:30]:
-                            self._log(line)
+                        # 보고서 앞 30줄만 만들어 한 번에 전달 (작업 항목은 여러 줄이므로 줄 단위로 자름)
+                        lines = chain.from_iterable(
+                            item.split('\n') for item in organizer.iter_dry_run_report()
+                        )
+                        head = islice(lines, 30)
+                        self._log("\n".join(head))
                     else:
                         results = organizer.execute(dry_run=False)
-                        report = organizer.get_execution_report(results)
-                        for line in report.split('\n'):
-                            self._log(line)
+                        self._log(organizer.get_execution_report(results))
                 else:
                     self._log("\n처리할 작업이 없습니다.")
 
@@ -929,7 +1064,7 @@ class FileOrganizerGUI:
                 organizer.finalize()
 
             # 빈 폴더 정리
-            if self.cleanup_empty.get() and not dry_run:
+            if settings.cleanup_empty and not dry_run:
                 self._log("\n[7단계] 빈 폴더 정리...")
                 success, failed, _ = cleanup_empty_folders(
                     target, dry_run=False
@@ -16,7 +16,7 @@
     python main.py --cleanup-empty [대상폴더] [--execute]
 
 기능:
-    1. 중복 파일 처리 (SHA256 해싱)
+    1. 중복 파일 처리 (xxh3/BLAKE3/SHA256 해싱)
     2. 버전 파일 그룹화
     3. 문서/이미지 주제별 분류
     4. 빈 폴더 정리
@@ -131,6 +131,17 @@ def main():
         action="store_true",
         help="월별 하위 폴더 생성 (기본: 연도까지만)"
     )
+    parser.add_argument(
+        "--verify-sha256",
+        action="store_true",
+        help="중복 파일을 SHA256으로 한 번 더 확인 (해시 충돌 방지)"
+    )
+    parser.add_argument(
+        "--hash-algorithm",
+        choices=["auto", "xxh3_128", "xxh64", "blake3", "sha256"],
+        default="auto",
+        help="중복 판정용 해시 (기본: auto, 설치된 가장 빠른 해시)"
+    )
     parser.add_argument(
         "--llm",
         type=str,
@@ -221,6 +232,8 @@ def main():
         archive_base=archive_base,
         dry_run=True
     )
+    config.verify_sha256 = args.verify_sha256
+    config.hash_algorithm = args.hash_algorithm
 
     if args.execute and not args.yes:
         print("\n" + "!" * 60)
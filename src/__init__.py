@@ -10,12 +10,27 @@
 - FileMover: 안전한 파일 이동
 """
 
+from importlib import import_module
+
 from .config import OrganizerConfig
-from .organizer import FileOrganizer
-from .duplicate_finder import DuplicateFinder
-from .version_manager import VersionManager
-from .classifier import FileClassifier
-from .file_mover import FileMover
+
+# 무거운 하위 모듈은 처음 접근할 때 import (python -m src.cli --help 등이 빨라짐)
+_LAZY_EXPORTS = {
+    'FileOrganizer': '.organizer',
+    'DuplicateFinder': '.duplicate_finder',
+    'VersionManager': '.version_manager',
+    'FileClassifier': '.classifier',
+    'FileMover': '.file_mover',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'OrganizerConfig',
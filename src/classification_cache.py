@@ -0,0 +1,172 @@
+"""
+분류 결과 캐시 모듈: LLM 분류 결과를 메모리(LRU)와 JSONL 파일에 저장하여
+같은 파일을 다시 분류할 때 LLM 호출 생략
+
+(모델, 파일명, 내용 미리보기, 카테고리 목록)의 SHA-256을 키로 사용하고,
+저장 시각이 TTL을 넘은 항목은 무효로 처리
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# 캐시 파일 이름 (로그 폴더 아래에 저장)
+CACHE_FILENAME = "llm_cache.jsonl"
+
+
+class ClassificationCache:
+    """메모리 LRU + 추가 전용 JSONL 파일 기반 분류 결과 캐시"""
+
+    # 불러올 때 무효 줄(만료/중복/깨진 줄)이 이 수 이상이고 유효 항목보다 많으면 파일 재작성
+    COMPACT_MIN_DEAD_LINES = 1024
+
+    def __init__(self, path: Path = None, max_entries: int = 4096,
+                 ttl_sec: float = 30 * 24 * 3600):
+        """
+        Args:
+            path: 캐시 파일 경로 (None이면 파일에 저장하지 않고 메모리에만 유지)
+            max_entries: 메모리에 유지할 최대 항목 수
+            ttl_sec: 항목 유효 시간 (초)
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        # 키 -> (저장 시각, 결과), 최근 사용한 항목이 뒤쪽
+        self._mem: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._fh = None
+        # 스레드 풀 분류(classify_files_parallel)에서 동시에 접근
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def make_key(model: str, filename: str, content_preview: str,
+                 categories: List[str]) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            model: 모델 이름
+            filename: 파일명
+            content_preview: 내용 미리보기 (앞 1000자만 사용)
+            categories: 카테고리 목록 (순서 무관)
+
+        Returns:
+            SHA-256 hex 문자열
+        """
+        raw = f"{model}|{filename}|{content_preview[:1000]}|{','.join(sorted(categories))}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _load(self):
+        """파일에서 유효한 항목 읽기 (같은 키는 나중 줄이 우선, 최신 max_entries개만 유지)"""
+        if self.path is None:
+            return
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except OSError:
+            return
+
+        cutoff = time.time() - self.ttl_sec
+        total_lines = 0
+        with f:
+            for line in f:
+                total_lines += 1
+                try:
+                    record = json.loads(line)
+                    key, ts, result = record["key"], record["ts"], record["result"]
+                except (ValueError, KeyError, TypeError):
+                    # 중단된 쓰기 등으로 깨진 줄은 무시
+                    continue
+                if ts < cutoff:
+                    continue
+                self._mem[key] = (ts, result)
+                self._mem.move_to_end(key)
+                if len(self._mem) > self.max_entries:
+                    self._mem.popitem(last=False)
+
+        dead_lines = total_lines - len(self._mem)
+        if dead_lines >= self.COMPACT_MIN_DEAD_LINES and dead_lines > len(self._mem):
+            self._compact()
+
+    def _compact(self):
+        """유효한 항목만 임시 파일에 다시 쓴 뒤 캐시 파일과 교체"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".llm_cache_", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                for key, (ts, result) in self._mem.items():
+                    f.write(json.dumps({"key": key, "ts": ts, "result": result},
+                                       ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError, ValueError):
+            # 재작성 실패 시 기존 파일을 그대로 사용
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 분류 결과 조회
+
+        Args:
+            key: make_key로 만든 키
+
+        Returns:
+            분류 결과 딕셔너리 사본 또는 None (없음/만료)
+        """
+        with self._lock:
+            item = self._mem.get(key)
+            if item is None:
+                return None
+
+            ts, result = item
+            if time.time() - ts > self.ttl_sec:
+                del self._mem[key]
+                return None
+
+            self._mem.move_to_end(key)
+            return dict(result)
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """
+        분류 결과 저장 (메모리 + 파일 끝에 한 줄 추가)
+
+        Args:
+            key: make_key로 만든 키
+            result: 분류 결과 딕셔너리
+        """
+        ts = time.time()
+        with self._lock:
+            self._mem[key] = (ts, dict(result))
+            self._mem.move_to_end(key)
+            if len(self._mem) > self.max_entries:
+                self._mem.popitem(last=False)
+
+            if self.path is None:
+                return
+            try:
+                if self._fh is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._fh = open(self.path, 'a', encoding='utf-8')
+                self._fh.write(json.dumps({"key": key, "ts": ts, "result": result},
+                                          ensure_ascii=False) + "\n")
+                self._fh.flush()
+            except (OSError, TypeError, ValueError):
+                # 파일 저장 실패는 메모리 캐시만으로 계속 진행
+                pass
+
+    def close(self):
+        """캐시 파일 닫기"""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
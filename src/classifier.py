@@ -112,7 +112,8 @@ class TextAnalyzer:
 class FileClassifier:
     """파일 분류 클래스"""
 
-    def __init__(self, config: OrganizerConfig, llm_config: Optional[LLMConfig] = None):
+    def __init__(self, config: OrganizerConfig, llm_config: Optional[LLMConfig] = None,
+                 logger=None):
         self.config = config
         self.text_analyzer = TextAnalyzer()
         self.categories = DEFAULT_CATEGORIES.copy()
@@ -121,7 +122,8 @@ class FileClassifier:
         self.llm_classifier = None
         if llm_config and llm_config.provider != "none":
             try:
-                self.llm_classifier = LLMClassifier(llm_config)
+                self.llm_classifier = LLMClassifier(llm_config, logger=logger,
+                                                    log_dir=config.archive_base / "logs")
                 if self.llm_classifier.is_available():
                     print(f"✓ LLM 분류기 활성화: {llm_config.provider}")
                 else:
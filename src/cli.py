@@ -3,17 +3,41 @@ CLI 인터페이스 모듈: 명령줄 인터페이스 및 사용자 상호작용
 """
 
 import argparse
+import os
+import stat
 import sys
+import time
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict
-from datetime import datetime
+from typing import TYPE_CHECKING, List, Optional, Dict
 
 from .config import OrganizerConfig
-from .duplicate_finder import DuplicateFinder, DuplicateGroup, FileInfo
-from .version_manager import VersionManager, VersionGroup, format_version_report
-from .classifier import FileClassifier, ClassificationResult, format_classification_report
-from .file_mover import FileMover, MoveOperation
-from .logger import FileOrganizerLogger, create_session_logger
+
+# 스캔/해시/분류 모듈은 실제로 쓰는 시점에 import (--help, 인자 오류 시 로딩 비용 없음)
+if TYPE_CHECKING:
+    from .duplicate_finder import DuplicateGroup
+    from .version_manager import VersionManager, VersionGroup
+    from .file_mover import FileMover, MoveOperation
+
+
+class _LazyLogger:
+    """
+    처음 사용할 때 세션 로거를 만드는 래퍼
+
+    처리할 작업이 없으면 로그 폴더와 로그 파일을 만들지 않음
+    """
+
+    def __init__(self, log_dir: Path):
+        self._log_dir = log_dir
+        self._real = None
+
+    def __getattr__(self, name):
+        # __getattr__은 인스턴스에 없는 속성(로거 메서드)에 대해서만 호출됨
+        if self._real is None:
+            from .logger import create_session_logger
+            self._real = create_session_logger(self._log_dir)
+        return getattr(self._real, name)
 
 
 def print_banner():
@@ -34,13 +58,15 @@ def print_section(title: str):
     print('='*60)
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SIZE_SCALES = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+
 def format_size(size_bytes: int) -> str:
     """바이트를 읽기 쉬운 형식으로 변환"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} PB"
+    # 비트 길이로 단위를 바로 결정 (1024로 반복해서 나누지 않음)
+    idx = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / _SIZE_SCALES[idx]:.2f} {_SIZE_UNITS[idx]}"
 
 
 def prompt_user(message: str, choices: List[str] = None, default: str = None) -> str:
@@ -58,29 +84,33 @@ def prompt_user(message: str, choices: List[str] = None, default: str = None) ->
     if choices:
         choice_str = "/".join(choices)
         if default:
-            message = f"{message} [{choice_str}] (기본: {default}): "
+            full_message = f"{message} [{choice_str}] (기본: {default}): "
         else:
-            message = f"{message} [{choice_str}]: "
+            full_message = f"{message} [{choice_str}]: "
     elif default:
-        message = f"{message} (기본: {default}): "
+        full_message = f"{message} (기본: {default}): "
     else:
-        message = f"{message}: "
+        full_message = f"{message}: "
 
-    response = input(message).strip()
+    lowered_choices = frozenset(c.lower() for c in choices) if choices else None
 
-    if not response and default:
-        return default
+    # 잘못된 입력이면 같은 프롬프트로 다시 질문
+    while True:
+        response = input(full_message).strip()
 
-    if choices and response.lower() not in [c.lower() for c in choices]:
-        print(f"  잘못된 선택입니다. {choices} 중에서 선택하세요.")
-        return prompt_user(message.split('[')[0].strip(), choices, default)
+        if not response and default:
+            return default
 
-    return response
+        if lowered_choices is not None and response.lower() not in lowered_choices:
+            print(f"  잘못된 선택입니다. {choices} 중에서 선택하세요.")
+            continue
 
+        return response
 
-def interactive_duplicate_review(duplicates: List[DuplicateGroup],
-                                  mover: FileMover,
-                                  config: OrganizerConfig) -> List[MoveOperation]:
+
+def interactive_duplicate_review(duplicates: List["DuplicateGroup"],
+                                  mover: "FileMover",
+                                  config: OrganizerConfig) -> List["MoveOperation"]:
     """
     중복 파일 대화형 검토
 
@@ -92,6 +122,8 @@ def interactive_duplicate_review(duplicates: List[DuplicateGroup],
     Returns:
         계획된 작업 리스트
     """
+    from .file_mover import MoveAction, MoveOperation
+
     operations = []
 
     print_section("중복 파일 검토")
@@ -116,23 +148,27 @@ def interactive_duplicate_review(duplicates: List[DuplicateGroup],
 
     # 개별 검토
     for i, group in enumerate(duplicates):
-        print(f"\n{'─'*50}")
-        print(f"그룹 {i+1}/{len(duplicates)}")
-        print(f"해시: {group.hash[:16]}...")
-        print(f"파일 수: {group.count}개")
-        print(f"낭비 공간: {format_size(group.wasted_space)}")
-        print("")
+        # 그룹 헤더와 파일 목록을 모아서 한 번에 출력
+        buf = [
+            f"\n{'─'*50}\n",
+            f"그룹 {i+1}/{len(duplicates)}\n",
+            f"해시: {group.hash[:16]}...\n",
+            f"파일 수: {group.count}개\n",
+            f"낭비 공간: {format_size(group.wasted_space)}\n",
+            "\n",
+        ]
 
         # 파일 목록 표시
         sorted_files = sorted(group.files, key=lambda f: f.modified_time, reverse=True)
         for j, file_info in enumerate(sorted_files):
-            modified = datetime.fromtimestamp(file_info.modified_time)
             marker = "[최신]" if j == 0 else ""
-            print(f"  {j+1}. {file_info.path.name} {marker}")
-            print(f"     경로: {file_info.path.parent}")
-            print(f"     수정일: {modified.strftime('%Y-%m-%d %H:%M')}")
-            print(f"     크기: {format_size(file_info.size)}")
-            print("")
+            buf.append(f"  {j+1}. {file_info.path.name} {marker}\n")
+            buf.append(f"     경로: {file_info.path.parent}\n")
+            buf.append(f"     수정일: {time.strftime('%Y-%m-%d %H:%M', time.localtime(file_info.modified_time))}\n")
+            buf.append(f"     크기: {format_size(file_info.size)}\n")
+            buf.append("\n")
+
+        sys.stdout.writelines(buf)
 
         choice = prompt_user(
             "작업을 선택하세요\n"
@@ -164,7 +200,6 @@ def interactive_duplicate_review(duplicates: List[DuplicateGroup],
         for j, file_info in enumerate(sorted_files):
             if j != keep_idx:
                 dest = config.duplicates_archive / file_info.path.name
-                from .file_mover import MoveAction
                 op = MoveOperation(
                     source=file_info.path,
                     destination=dest,
@@ -179,9 +214,9 @@ def interactive_duplicate_review(duplicates: List[DuplicateGroup],
     return operations
 
 
-def interactive_version_review(groups: List[VersionGroup],
-                                manager: VersionManager,
-                                config: OrganizerConfig) -> List[MoveOperation]:
+def interactive_version_review(groups: List["VersionGroup"],
+                                manager: "VersionManager",
+                                config: OrganizerConfig) -> List["MoveOperation"]:
     """
     버전 파일 대화형 검토
 
@@ -213,6 +248,7 @@ def interactive_version_review(groups: List[VersionGroup],
 
     if mode.lower() == "r":
         # 보고서 출력
+        from .version_manager import format_version_report
         report = format_version_report(groups, manager)
         print(report)
         return operations
@@ -224,11 +260,10 @@ def interactive_version_review(groups: List[VersionGroup],
     archive_paths = []
 
     for group in groups:
-        analysis = manager.analyze_version_group(group)
-        if analysis['recommended_keep']:
-            keep_paths.append(Path(analysis['recommended_keep']))
-        for path in analysis['recommended_archive']:
-            archive_paths.append(Path(path))
+        keep, archive = manager.recommend_keep(group)
+        if keep is not None:
+            keep_paths.append(keep.path)
+        archive_paths.extend(f.path for f in archive)
 
     print(f"\n  보존: {len(keep_paths)}개 파일")
     print(f"  아카이브: {len(archive_paths)}개 파일")
@@ -237,8 +272,9 @@ def interactive_version_review(groups: List[VersionGroup],
     return mover.plan_version_cleanup(keep_paths, archive_paths)
 
 
-def run_cli():
-    """CLI 메인 함수"""
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 파서 생성 (최초 1회만 생성)"""
     parser = argparse.ArgumentParser(
         description="로컬 파일 지능형 정리 도구",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -352,12 +388,37 @@ def run_cli():
         help="병렬 처리 활성화"
     )
 
+    parser.add_argument(
+        "--verify-sha256",
+        action="store_true",
+        help="중복 파일을 SHA256으로 한 번 더 확인 (해시 충돌 방지)"
+    )
+
+    parser.add_argument(
+        "--hash-algorithm",
+        choices=["auto", "xxh3_128", "xxh64", "blake3", "sha256"],
+        default="auto",
+        help="중복 판정용 해시 (기본: auto, 설치된 가장 빠른 해시)"
+    )
+
+    parser.add_argument(
+        "--no-content-similarity",
+        action="store_true",
+        help="버전 탐지에서 ssdeep 내용 비교 생략 (파일명만 비교, 파일을 읽지 않음)"
+    )
+
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
         help="최소 출력"
     )
 
+    return parser
+
+
+def run_cli():
+    """CLI 메인 함수"""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # 작업 모드 확인
@@ -368,17 +429,34 @@ def run_cli():
         sys.exit(1)
 
     # 설정 초기화
-    target_dirs = [Path(p).resolve() for p in args.target]
-    for path in target_dirs:
-        if not path.exists():
-            print(f"오류: 대상 경로가 존재하지 않습니다: {path}")
+    # 대상마다 stat 한 번으로 존재 여부와 폴더 여부를 함께 확인
+    target_dirs = []
+    for p in args.target:
+        path = Path(p).expanduser()
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            print(f"오류: 대상 경로가 존재하지 않습니다: {path.resolve()}")
+            sys.exit(1)
+        except OSError as e:
+            print(f"오류: 대상 경로를 확인할 수 없습니다: {path} ({e.strerror or e})")
+            sys.exit(1)
+        if not stat.S_ISDIR(st.st_mode):
+            print(f"오류: 대상 경로가 폴더가 아닙니다: {path.resolve()}")
             sys.exit(1)
+        target_dirs.append(path.resolve())
+
+    from .duplicate_finder import DuplicateFinder
+    from .file_mover import FileMover
 
     config = OrganizerConfig(
         target_directories=target_dirs,
         dry_run=not args.execute,
         use_recycle_bin=args.use_recycle_bin,
         min_file_size=args.min_size,
+        verify_sha256=args.verify_sha256,
+        hash_algorithm=args.hash_algorithm,
+        enable_content_similarity=not args.no_content_similarity,
     )
 
     if args.archive:
@@ -394,26 +472,31 @@ def run_cli():
         print(f"드라이 런: {'예' if config.dry_run else '아니오 (실제 실행)'}")
         print("")
 
-    # 로거 초기화
-    logger = create_session_logger(config.archive_base / "logs")
+    # 로거 초기화 (실제 로그 파일은 처음 기록할 때 생성)
+    logger = _LazyLogger(config.archive_base / "logs")
 
     # FileMover 초기화
     mover = FileMover(config, logger)
 
     # 작업 실행
-    all_operations: List[MoveOperation] = []
+    all_operations: List["MoveOperation"] = []
 
     try:
+        # 모든 작업 모드가 같은 스캔 결과를 사용 (디렉토리는 한 번만 스캔)
+        finder = DuplicateFinder(config)
+        print("📁 파일 스캔 중...")
+        all_files = list(chain.from_iterable(
+            finder.iter_scan_directory(directory) for directory in target_dirs
+        ))
+
         # 중복 파일 탐지
         if args.find_duplicates or args.all:
             print_section("중복 파일 탐지")
 
-            finder = DuplicateFinder(config)
-
             if args.parallel:
-                duplicates = finder.find_duplicates_parallel(target_dirs)
+                duplicates = finder.find_duplicates_parallel(target_dirs, files=all_files)
             else:
-                duplicates = finder.find_duplicates(target_dirs)
+                duplicates = finder.find_duplicates(target_dirs, files=all_files)
 
             if duplicates:
                 summary = finder.get_summary(duplicates)
@@ -435,11 +518,7 @@ def run_cli():
         # 버전 파일 탐지
         if args.find_versions or args.all:
             print_section("버전 파일 탐지")
-
-            finder = DuplicateFinder(config)
-            all_files = []
-            for directory in target_dirs:
-                all_files.extend(finder.scan_directory(directory))
+            from .version_manager import VersionManager, format_version_report
 
             version_mgr = VersionManager(config)
             version_groups = version_mgr.find_version_groups(all_files)
@@ -463,11 +542,7 @@ def run_cli():
         # 파일 분류
         if args.classify or args.all:
             print_section("파일 분류")
-
-            finder = DuplicateFinder(config)
-            all_files = []
-            for directory in target_dirs:
-                all_files.extend(finder.scan_directory(directory))
+            from .classifier import FileClassifier, format_classification_report
 
             classifier = FileClassifier(config)
 
@@ -490,7 +565,8 @@ def run_cli():
             # 분류 결과에 따른 이동 작업
             ops = mover.plan_classification_organize(results, config.organized_archive)
             all_operations.extend(ops)
-            logger.info(f"파일 분류 계획: {len(ops)}개 작업")
+            if ops:
+                logger.info(f"파일 분류 계획: {len(ops)}개 작업")
 
         # 작업 실행
         if all_operations:
@@ -498,8 +574,9 @@ def run_cli():
 
             if config.dry_run:
                 print("\n🔍 드라이 런 모드 - 미리보기")
-                report = mover.get_dry_run_report(all_operations)
-                print(report)
+                sys.stdout.writelines(
+                    line + "\n" for line in mover.iter_dry_run_report(all_operations)
+                )
             else:
                 confirm = prompt_user(
                     f"\n{len(all_operations)}개 파일을 처리하시겠습니까?",
@@ -527,12 +604,13 @@ def run_cli():
         raise
 
     finally:
-        # 로그 저장
-        logger.finalize()
-        log_paths = logger.get_log_paths()
-        print(f"\n📝 로그 저장 위치:")
-        print(f"   텍스트: {log_paths['text_log']}")
-        print(f"   JSON: {log_paths['json_log']}")
+        # 로그 저장 (기록한 내용이 있을 때만)
+        if logger._real is not None:
+            logger.finalize()
+            log_paths = logger.get_log_paths()
+            print(f"\n📝 로그 저장 위치:")
+            print(f"   텍스트: {log_paths['text_log']}")
+            print(f"   JSON: {log_paths['json_log']}")
 
 
 def main():
@@ -2,15 +2,52 @@
 설정 모듈: 애플리케이션 전역 설정 및 상수 정의
 """
 
+import fnmatch
+import os
+import re
 from pathlib import Path
-from typing import List, Set
+from typing import AbstractSet, FrozenSet, List, Optional, Pattern
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+# 기본 확장자/제외 목록 (읽기 전용이므로 인스턴스마다 새로 만들지 않고 공유)
+# 설정을 바꿀 때는 속성을 통째로 교체 (예: config.excluded_dirs = {...})
+_DEFAULT_TEXT_EXTENSIONS = frozenset({
+    '.txt', '.md', '.py', '.js', '.java', '.c', '.cpp', '.h',
+    '.html', '.css', '.json', '.xml', '.yaml', '.yml', '.ini',
+    '.cfg', '.conf', '.log', '.csv', '.rst', '.tex'
+})
+
+_DEFAULT_DOCUMENT_EXTENSIONS = frozenset({
+    '.doc', '.docx', '.pdf', '.ppt', '.pptx', '.xls', '.xlsx',
+    '.odt', '.ods', '.odp', '.rtf'
+})
+
+_DEFAULT_IMAGE_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp',
+    '.ico', '.tiff', '.raw'
+})
+
+_DEFAULT_EXCLUDED_DIRS = frozenset({
+    '.git', '.svn', '__pycache__', 'node_modules', '.venv',
+    'venv', '.idea', '.vscode', '_OrganizedFiles', '$RECYCLE.BIN',
+    'System Volume Information'
+})
+
+_DEFAULT_EXCLUDED_PATTERNS = frozenset({
+    '*.tmp', '*.temp', '~*', 'desktop.ini', 'Thumbs.db', '.DS_Store'
+})
+
+
+@dataclass(slots=True)
 class OrganizerConfig:
-    """파일 정리 도구 설정 클래스"""
+    """
+    파일 정리 도구 설정 클래스
+
+    slots=True이므로 선언된 필드 외의 속성은 추가할 수 없음
+    (프로세스 풀로 넘길 때 pickle 크기와 인스턴스 메모리 감소)
+    """
 
     # 정리 대상 폴더들
     target_directories: List[Path] = field(default_factory=list)
@@ -31,35 +68,19 @@ class OrganizerConfig:
     use_recycle_bin: bool = False
 
     # 분석할 텍스트 파일 확장자
-    text_extensions: Set[str] = field(default_factory=lambda: {
-        '.txt', '.md', '.py', '.js', '.java', '.c', '.cpp', '.h',
-        '.html', '.css', '.json', '.xml', '.yaml', '.yml', '.ini',
-        '.cfg', '.conf', '.log', '.csv', '.rst', '.tex'
-    })
+    text_extensions: FrozenSet[str] = _DEFAULT_TEXT_EXTENSIONS
 
     # 문서 파일 확장자
-    document_extensions: Set[str] = field(default_factory=lambda: {
-        '.doc', '.docx', '.pdf', '.ppt', '.pptx', '.xls', '.xlsx',
-        '.odt', '.ods', '.odp', '.rtf'
-    })
+    document_extensions: FrozenSet[str] = _DEFAULT_DOCUMENT_EXTENSIONS
 
     # 이미지 파일 확장자
-    image_extensions: Set[str] = field(default_factory=lambda: {
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp',
-        '.ico', '.tiff', '.raw'
-    })
+    image_extensions: FrozenSet[str] = _DEFAULT_IMAGE_EXTENSIONS
 
     # 제외할 폴더 이름들
-    excluded_dirs: Set[str] = field(default_factory=lambda: {
-        '.git', '.svn', '__pycache__', 'node_modules', '.venv',
-        'venv', '.idea', '.vscode', '_OrganizedFiles', '$RECYCLE.BIN',
-        'System Volume Information'
-    })
+    excluded_dirs: FrozenSet[str] = _DEFAULT_EXCLUDED_DIRS
 
     # 제외할 파일 패턴들
-    excluded_patterns: Set[str] = field(default_factory=lambda: {
-        '*.tmp', '*.temp', '~*', 'desktop.ini', 'Thumbs.db', '.DS_Store'
-    })
+    excluded_patterns: FrozenSet[str] = _DEFAULT_EXCLUDED_PATTERNS
 
     # 최소 파일 크기 (바이트) - 이보다 작은 파일은 중복 검사에서 제외
     min_file_size: int = 1
@@ -69,6 +90,40 @@ class OrganizerConfig:
 
     # 내용 유사도 임계값 (0 ~ 100, ssdeep 퍼지 해싱용)
     content_similarity_threshold: int = 75
+    # 내용 유사도(ssdeep) 기반 버전 탐지 사용 여부 (끄면 파일 내용을 읽지 않고 파일명만 비교)
+    enable_content_similarity: bool = True
+
+    # 스캔 시 Linux statx(AT_STATX_DONT_SYNC) 사용 여부
+    # (NFS/SMB 등 네트워크 파일시스템에서 유리, 로컬 디스크에서는 os.stat이 더 빠름)
+    use_statx: bool = False
+
+    # 스캔 방식: "serial" (기본) 또는 "threaded" (폴더 단위 stat을 스레드 풀에서 처리)
+    scan_backend: str = "serial"
+    scan_workers: int = 8
+
+    # 병렬 해시 계산 워커 프로세스 수 (0이면 CPU 수, 최대 8)
+    # HDD는 탐색 경합 때문에 2~4, SSD는 8 정도가 적당
+    hash_workers: int = 0
+
+    # 파일 이동/복사를 동시에 실행할 스레드 수 (1이면 순차 실행)
+    # SSD나 네트워크 드라이브에서는 4~8 정도로 올리면 I/O 대기가 겹쳐 빨라짐
+    move_workers: int = 1
+
+    # 실행 진행 상황 갱신 간격 (초, 한 줄을 \r로 덮어씀)
+    progress_interval_sec: float = 0.5
+
+    # 중복 판정용 전체 내용 해시: "auto" (xxh3_128 > blake3 > sha256 중 설치된 것),
+    # "xxh3_128", "xxh64", "blake3", "sha256" (설치되지 않은 알고리즘은 auto로 처리)
+    hash_algorithm: str = "auto"
+
+    # 고속 해시로 찾은 중복 파일을 SHA256으로 재확인할지 여부
+    verify_sha256: bool = False
+
+    # 실행 간 해시 캐시 사용 여부 및 위치 (None이면 ~/.file_organizer/hashes.sqlite)
+    use_hash_cache: bool = True
+    hash_cache_path: Optional[Path] = None
+    # ssdeep 퍼지 해시 캐시 위치 (None이면 ~/.file_organizer/fuzzy_hashes.sqlite)
+    fuzzy_hash_cache_path: Optional[Path] = None
 
     # 로그 파일 경로
     log_file: Path = field(default=None)
@@ -78,6 +133,10 @@ class OrganizerConfig:
     llm_content_preview_length: int = 2000  # 2000자
     llm_batch_size_limit: int = 50  # LLM 자동 분류 최대 파일 수
 
+    # excluded_patterns를 하나로 합쳐 컴파일한 정규식 (패턴 목록이 교체되면 다시 컴파일)
+    _excluded_re: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _excluded_re_source: Optional[AbstractSet[str]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """초기화 후 처리"""
         if self.duplicates_archive is None:
@@ -87,6 +146,35 @@ class OrganizerConfig:
         if self.log_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.log_file = self.archive_base / "logs" / f"organizer_{timestamp}.log"
+        self._compile_excluded_patterns()
+
+    def _compile_excluded_patterns(self):
+        """제외 패턴들을 fnmatch.translate로 변환하여 하나의 정규식으로 컴파일"""
+        patterns = self.excluded_patterns
+        self._excluded_re_source = patterns
+        if not patterns:
+            self._excluded_re = None
+            return
+        # fnmatch.fnmatch와 같게 대소문자 규칙은 os.path.normcase를 따름
+        self._excluded_re = re.compile('|'.join(
+            f'(?:{fnmatch.translate(os.path.normcase(pattern))})' for pattern in patterns
+        ))
+
+    def is_excluded(self, name: str) -> bool:
+        """
+        파일 이름이 제외 패턴에 해당하는지 확인
+
+        Args:
+            name: 파일 이름
+
+        Returns:
+            제외 대상이면 True
+        """
+        if self.excluded_patterns is not self._excluded_re_source:
+            self._compile_excluded_patterns()
+        if self._excluded_re is None:
+            return False
+        return self._excluded_re.match(os.path.normcase(name)) is not None
 
 
 # 주제 분류를 위한 기본 카테고리 키워드
@@ -2,30 +2,60 @@
 YAML 설정 파일 로더
 """
 
+import copy
+import os
+from functools import lru_cache
+
 import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any
 from .config import OrganizerConfig
 from .llm_classifier import LLMConfig
 
+# libyaml C 확장이 있으면 사용 (순수 파이썬 로더보다 수 배 빠름)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _cached_load(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    YAML 파일 파싱 (경로와 수정 시간이 같으면 재사용)
+
+    Args:
+        path_str: YAML 파일 경로
+        mtime_ns: 파일 수정 시간 (파일이 바뀌면 캐시 키가 달라짐)
+
+    Returns:
+        설정 딕셔너리
+    """
+    with open(path_str, 'r', encoding='utf-8') as f:
+        config_data = yaml.load(f, Loader=_YamlLoader)
+
+    return config_data or {}
+
 
 def load_yaml_config(config_path: Path) -> Dict[str, Any]:
     """
     YAML 설정 파일 로드
 
+    같은 파일을 여러 옵션 함수에서 읽으므로 파싱 결과를 캐시하고 사본을 반환
+
     Args:
         config_path: YAML 파일 경로
 
     Returns:
         설정 딕셔너리
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}") from None
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config_data = yaml.safe_load(f)
-
-    return config_data or {}
+    # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 사본 반환
+    return copy.deepcopy(_cached_load(str(config_path), st.st_mtime_ns))
 
 
 def expand_path(path_str: str) -> Path:
@@ -67,11 +97,11 @@ def create_config_from_yaml(yaml_path: Path) -> OrganizerConfig:
 
     # 제외 폴더
     if 'excluded_folders' in data:
-        config.excluded_dirs = set(data['excluded_folders'])
+        config.excluded_dirs = frozenset(data['excluded_folders'])
 
     # 제외 패턴
     if 'excluded_patterns' in data:
-        config.excluded_patterns = set(data['excluded_patterns'])
+        config.excluded_patterns = frozenset(data['excluded_patterns'])
 
     # LLM 설정
     if 'llm' in data:
@@ -1,18 +1,193 @@
 """
-중복 파일 식별 모듈: SHA256 해싱을 사용하여 파일 내용 기반 중복 파일 탐지
+중복 파일 식별 모듈: 고속 해싱(xxh3/BLAKE3, 없으면 SHA256)을 사용하여 파일 내용 기반 중복 파일 탐지
 """
 
 import hashlib
+import mmap
 import os
+import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, InitVar
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import fnmatch
+from itertools import chain, repeat
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from .config import OrganizerConfig
 
+# xxhash, blake3는 선택적 의존성 (없으면 hashlib 사용)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+from .fast_stat import fast_stat, is_statx_available
+from .hash_cache import HashCache
+
+
+# 전체 해시 계산 시 읽기 청크 크기
+_HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# 이 크기 이상인 파일은 mmap으로 페이지 캐시를 직접 해싱 (작은 파일은 read가 더 빠름)
+_MMAP_MIN_SIZE = 128 * 1024
+
+# 1차 필터링용 앞부분 해시 크기
+_PREFIX_SIZE = 64 * 1024
+
+_O_RDONLY_BINARY = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+# 이보다 후보 파일이 적으면 프로세스 풀 시작 비용이 더 커서 현재 프로세스에서 계산
+_MIN_FILES_FOR_POOL = 64
+
+# 크기 표시 단위 (1024배씩)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _read_prefix(path, size: int) -> bytes:
+    """파일 앞부분을 버퍼 없이 한 번의 read로 읽기"""
+    fd = os.open(path, _O_RDONLY_BINARY)
+    try:
+        if hasattr(os, 'pread'):
+            return os.pread(fd, size, 0)
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _content_hash_name(algorithm: str = "auto") -> str:
+    """
+    실제로 사용할 전체 내용 해시 알고리즘 이름 (영구 캐시 구분용)
+
+    Args:
+        algorithm: 설정값 ('auto'이거나 설치되지 않은/알 수 없는 알고리즘이면 자동 선택)
+
+    Returns:
+        알고리즘 이름
+    """
+    if algorithm in _HASHER_FACTORIES:
+        return algorithm
+    if XXHASH_AVAILABLE:
+        return "xxh3_128"
+    if BLAKE3_AVAILABLE:
+        return "blake3"
+    return "sha256"
+
+
+def _new_content_hasher():
+    """
+    전체 내용 해시 객체 생성
+
+    중복 판정은 암호학적 안전성이 필요 없는 비교이므로 xxh3_128 > BLAKE3 > SHA256
+    순으로 사용 가능한 가장 빠른 해시를 선택 (SHA256은 SHA-NI 지원 CPU에서 blake2b보다 빠름)
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    return hashlib.sha256()
+
+
+# 알고리즘 이름 -> 해시 객체 생성 함수 (설치된 라이브러리만)
+_HASHER_FACTORIES: Dict[str, Callable] = {"sha256": hashlib.sha256}
+if XXHASH_AVAILABLE:
+    _HASHER_FACTORIES["xxh3_128"] = xxhash.xxh3_128
+    _HASHER_FACTORIES["xxh64"] = xxhash.xxh64
+if BLAKE3_AVAILABLE:
+    _HASHER_FACTORIES["blake3"] = blake3.blake3
+
+
+def _hash_file(path, hasher_factory=_new_content_hasher) -> Optional[bytes]:
+    """
+    파일 전체 해시 digest 계산
+
+    Args:
+        path: 파일 경로
+        hasher_factory: 해시 객체 생성 함수
+
+    Returns:
+        digest 바이트 또는 None (오류 시)
+    """
+    try:
+        hasher = hasher_factory()
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE and _hash_mmap(f, hasher):
+                return hasher.digest()
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.digest()
+    except OSError:
+        return None
+
+
+def _hash_mmap(f, hasher) -> bool:
+    """
+    파일을 mmap으로 매핑하여 사용자 공간 복사 없이 해싱
+
+    Args:
+        f: 바이너리 모드로 열린 파일 객체
+        hasher: 해시 객체
+
+    Returns:
+        성공 여부 (False면 호출 측에서 read 방식으로 처리)
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # 32비트 주소 공간 부족, 특수 파일 등
+        return False
+
+    with mm:
+        # Linux: 순차 접근 힌트로 미리 읽기(readahead) 확대
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            if hasattr(mmap, 'MADV_WILLNEED'):
+                mm.madvise(mmap.MADV_WILLNEED)
+        hasher.update(mm)
+    return True
+
+
+def _stat_paths(paths: List[str], stat_func) -> List[Tuple[str, Optional[os.stat_result]]]:
+    """
+    스레드 풀 워커: 한 폴더의 파일들을 한 번에 stat
+
+    Args:
+        paths: 파일 경로 문자열 리스트
+        stat_func: stat 함수 (os.stat 또는 fast_stat)
+
+    Returns:
+        (경로, stat 결과 또는 None) 리스트
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append((path, stat_func(path)))
+        except OSError:
+            results.append((path, None))
+    return results
+
+
+def _hash_worker(path: str, algorithm: str = "auto") -> Tuple[str, Optional[bytes]]:
+    """
+    프로세스 풀 워커: 파일 전체 해시 계산
+
+    피클링 가능하도록 모듈 최상위 함수로 정의
+
+    Args:
+        path: 파일 경로 문자열
+        algorithm: 해시 알고리즘 이름 (_content_hash_name으로 확정한 값)
+
+    Returns:
+        (경로, digest 바이트 또는 None)
+    """
+    return path, _hash_file(path, _HASHER_FACTORIES.get(algorithm, _new_content_hasher))
+
 
 @dataclass
 class FileInfo:
@@ -22,14 +197,36 @@ class FileInfo:
     hash: Optional[str] = None
     modified_time: float = 0.0
     created_time: float = 0.0
-
-    def __post_init__(self):
+    # 소문자 확장자 (분류/버전 탐지 등에서 재사용)
+    suffix_lower: str = field(default="", init=False, repr=False, compare=False)
+    # 하드링크 판별용 (장치, inode) - 알 수 없으면 0
+    device: int = field(default=0, init=False, repr=False, compare=False)
+    inode: int = field(default=0, init=False, repr=False, compare=False)
+    # 스캔 중 이미 얻은 stat 결과 (있으면 stat 재호출 생략)
+    stat_result: InitVar[Optional[os.stat_result]] = None
+
+    def __post_init__(self, stat_result: Optional[os.stat_result]):
         """파일 메타데이터 초기화"""
-        if self.path.exists():
-            stat = self.path.stat()
-            self.size = stat.st_size
-            self.modified_time = stat.st_mtime
-            self.created_time = stat.st_ctime
+        self.suffix_lower = self.path.suffix.lower()
+        if stat_result is None:
+            try:
+                stat_result = self.path.stat()
+            except OSError:
+                return
+        self.size = stat_result.st_size
+        self.modified_time = stat_result.st_mtime
+        self.created_time = stat_result.st_ctime
+        self.device = getattr(stat_result, 'st_dev', 0) or 0
+        self.inode = getattr(stat_result, 'st_ino', 0) or 0
+
+
+# 중복 보존 전략 -> (정렬 키, 내림차순 여부), 정렬 후 첫 번째 파일을 보존
+KEEP_STRATEGY_SORT_KEYS = {
+    "newest": (attrgetter("modified_time"), True),
+    "oldest": (attrgetter("modified_time"), False),
+    "largest": (attrgetter("size"), True),
+    "smallest": (attrgetter("size"), False),
+}
 
 
 @dataclass
@@ -38,11 +235,40 @@ class DuplicateGroup:
     hash: str
     files: List[FileInfo] = field(default_factory=list)
     total_size: int = 0
+    # 보존 전략별로 고른 보존 파일 (파일이 추가되면 비움)
+    _keep_cache: Dict[str, FileInfo] = field(default_factory=dict, init=False,
+                                             repr=False, compare=False)
 
     def add_file(self, file_info: FileInfo):
         """파일 추가"""
         self.files.append(file_info)
         self.total_size += file_info.size
+        self._keep_cache.clear()
+
+    def get_keep_file(self, keep_strategy: str = "newest") -> Optional[FileInfo]:
+        """
+        보존 전략에 따라 남길 파일 (알 수 없는 전략은 newest)
+
+        정렬 대신 max/min 한 번으로 고름. 값이 같으면 먼저 추가된 파일이므로
+        안정 정렬 후 첫 번째 파일과 같음
+
+        Args:
+            keep_strategy: 보존 전략 ('newest', 'oldest', 'largest', 'smallest')
+
+        Returns:
+            보존할 FileInfo (빈 그룹이면 None)
+        """
+        if not self.files:
+            return None
+
+        keep = self._keep_cache.get(keep_strategy)
+        if keep is None:
+            sort_key, reverse = KEEP_STRATEGY_SORT_KEYS.get(
+                keep_strategy, KEEP_STRATEGY_SORT_KEYS["newest"]
+            )
+            keep = (max if reverse else min)(self.files, key=sort_key)
+            self._keep_cache[keep_strategy] = keep
+        return keep
 
     @property
     def wasted_space(self) -> int:
@@ -63,7 +289,45 @@ class DuplicateFinder:
     def __init__(self, config: OrganizerConfig):
         self.config = config
         self._size_groups: Dict[int, List[Path]] = defaultdict(list)
-        self._hash_cache: Dict[Path, str] = {}
+        # digest는 hex 문자열 대신 바이트로 보관 (메모리 절반)
+        self._hash_cache: Dict[Path, bytes] = {}
+        # 실행 간 유지되는 SQLite 해시 캐시 (처음 필요할 때 열림)
+        self._persistent_cache: Optional[HashCache] = None
+        self._persistent_cache_failed = False
+        # 설정한 해시 알고리즘 (설치되지 않았으면 자동 선택)
+        self._hash_algorithm = _content_hash_name(config.hash_algorithm)
+        self._hasher_factory = _HASHER_FACTORIES[self._hash_algorithm]
+
+    def _get_persistent_cache(self) -> Optional[HashCache]:
+        """영구 해시 캐시 반환 (비활성화되었거나 열 수 없으면 None)"""
+        if self._persistent_cache is not None:
+            return self._persistent_cache
+        if not self.config.use_hash_cache or self._persistent_cache_failed:
+            return None
+
+        try:
+            self._persistent_cache = HashCache(self.config.hash_cache_path, self._hash_algorithm)
+        except (sqlite3.Error, OSError):
+            # 캐시를 쓸 수 없어도 해시 계산 자체는 계속 진행
+            self._persistent_cache_failed = True
+        return self._persistent_cache
+
+    def _flush_persistent_cache(self):
+        """영구 해시 캐시에 대기 중인 항목 기록"""
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.flush()
+            except sqlite3.Error:
+                pass
+
+    def close(self):
+        """영구 해시 캐시 기록 후 닫기 (다음 실행에서 변경 없는 파일은 다시 읽지 않음)"""
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.close()
+            except sqlite3.Error:
+                pass
+            self._persistent_cache = None
 
     def _should_exclude(self, path: Path) -> bool:
         """파일/폴더 제외 여부 확인"""
@@ -73,73 +337,213 @@ class DuplicateFinder:
                 return True
 
         # 파일 패턴 체크
-        for pattern in self.config.excluded_patterns:
-            if fnmatch.fnmatch(path.name, pattern):
-                return True
+        return self.config.is_excluded(path.name)
 
-        return False
+    def _is_excluded_name(self, name: str, excluded_names: FrozenSet[str] = None) -> bool:
+        """파일 이름만으로 제외 여부 확인 (상위 폴더는 스캔 중 이미 걸러짐)"""
+        if excluded_names is None:
+            excluded_names = self.config.excluded_dirs
+        if name in excluded_names:
+            return True
+
+        return self.config.is_excluded(name)
 
-    def _calculate_hash(self, file_path: Path, chunk_size: int = 65536) -> Optional[str]:
+    def _calculate_hash(self, file_path: Path) -> Optional[bytes]:
         """
-        파일의 SHA256 해시 계산
+        파일의 전체 내용 해시 계산 (config.hash_algorithm, 기본은 xxh3_128 / BLAKE3 / SHA256 중 자동)
 
         Args:
             file_path: 파일 경로
-            chunk_size: 읽기 청크 크기 (기본 64KB)
 
         Returns:
-            SHA256 해시 문자열 또는 None (오류 시)
+            digest 바이트 또는 None (오류 시)
         """
         # 캐시 확인
         if file_path in self._hash_cache:
             return self._hash_cache[file_path]
 
-        try:
-            sha256_hash = hashlib.sha256()
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(chunk_size), b''):
-                    sha256_hash.update(chunk)
+        # 영구 캐시: 파일이 바뀌지 않았으면 stat 한 번으로 해시 재사용
+        cache = self._get_persistent_cache()
+        if cache is not None:
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                return None
+            digest = cache.get(stat_result)
+            if digest is not None:
+                self._hash_cache[file_path] = digest
+                return digest
+
+        digest = _hash_file(file_path, self._hasher_factory)
+        if digest is not None:
+            self._hash_cache[file_path] = digest
+            if cache is not None:
+                cache.put(stat_result, digest)
+        return digest
 
-            hash_value = sha256_hash.hexdigest()
-            self._hash_cache[file_path] = hash_value
-            return hash_value
+    @staticmethod
+    def _add_to_group(hash_groups: Dict[bytes, DuplicateGroup], digest: bytes, file_info: FileInfo):
+        """digest별 그룹에 파일 추가 (표시용 hex 문자열은 그룹당 한 번만 생성)"""
+        group = hash_groups.get(digest)
+        if group is None:
+            group = hash_groups[digest] = DuplicateGroup(hash=digest.hex())
+        file_info.hash = group.hash
+        group.add_file(file_info)
+
+    def _verify_sha256(self, duplicates: List[DuplicateGroup]) -> List[DuplicateGroup]:
+        """
+        고속 해시로 찾은 중복 그룹을 SHA256으로 재확인 (해시 충돌 방지)
 
-        except (IOError, OSError, PermissionError) as e:
-            return None
+        Args:
+            duplicates: 중복 그룹 리스트
 
-    def _calculate_partial_hash(self, file_path: Path, sample_size: int = 4096) -> Optional[str]:
+        Returns:
+            SHA256까지 일치하는 파일만 남긴 중복 그룹 리스트
+        """
+        print("🔐 SHA256 재확인 중...")
+        verified: List[DuplicateGroup] = []
+
+        for group in duplicates:
+            sha_groups: Dict[bytes, DuplicateGroup] = {}
+            for file_info in group.files:
+                digest = _hash_file(file_info.path, hashlib.sha256)
+                if digest is not None:
+                    self._add_to_group(sha_groups, digest, file_info)
+            verified.extend(g for g in sha_groups.values() if g.count > 1)
+
+        return verified
+
+    def _calculate_partial_hash(self, file_path: Path, sample_size: int = _PREFIX_SIZE) -> Optional[bytes]:
         """
         파일의 부분 해시 계산 (빠른 사전 필터링용)
-        파일의 시작, 중간, 끝 부분만 해싱
+        파일의 앞부분(기본 64KB)만 비암호화 해시로 해싱
+
+        대부분의 서로 다른 파일은 첫 블록에서 이미 달라지므로
+        전체 해시는 크기와 앞부분 해시가 모두 같은 파일에만 계산
 
         Args:
             file_path: 파일 경로
-            sample_size: 각 부분에서 읽을 바이트 수
+            sample_size: 앞에서부터 읽을 바이트 수
 
         Returns:
-            부분 해시 문자열 또는 None
+            부분 해시 digest 또는 None
         """
         try:
-            file_size = file_path.stat().st_size
-            sha256_hash = hashlib.sha256()
+            data = _read_prefix(file_path, sample_size)
+        except OSError:
+            return None
+
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh64_digest(data)
+        return hashlib.blake2b(data, digest_size=16).digest()
 
-            with open(file_path, 'rb') as f:
-                # 시작 부분
-                sha256_hash.update(f.read(sample_size))
+    @staticmethod
+    def _collapse_hardlinks(candidates: Dict[int, List[FileInfo]]
+                            ) -> Tuple[Dict[int, List[FileInfo]], Dict[Path, List[FileInfo]]]:
+        """
+        같은 (장치, inode)를 가리키는 하드링크를 대표 파일 하나로 줄임
 
-                if file_size > sample_size * 3:
-                    # 중간 부분
-                    f.seek(file_size // 2)
-                    sha256_hash.update(f.read(sample_size))
+        하드링크는 내용이 항상 같으므로 대표 파일만 읽고 나머지는 같은 해시로 처리한다.
 
-                    # 끝 부분
-                    f.seek(-sample_size, 2)
-                    sha256_hash.update(f.read(sample_size))
+        Args:
+            candidates: 크기별 후보 파일 딕셔너리
 
-            return sha256_hash.hexdigest()
+        Returns:
+            (대표 파일만 남긴 후보 딕셔너리, 대표 경로 -> 나머지 하드링크 리스트)
+        """
+        collapsed: Dict[int, List[FileInfo]] = {}
+        linked: Dict[Path, List[FileInfo]] = {}
 
-        except (IOError, OSError, PermissionError):
-            return None
+        for size, files in candidates.items():
+            representatives: Dict[Tuple[int, int], FileInfo] = {}
+            kept: List[FileInfo] = []
+            for file_info in files:
+                if not file_info.inode:
+                    kept.append(file_info)
+                    continue
+                key = (file_info.device, file_info.inode)
+                first = representatives.get(key)
+                if first is None:
+                    representatives[key] = file_info
+                    kept.append(file_info)
+                else:
+                    linked.setdefault(first.path, []).append(file_info)
+            collapsed[size] = kept
+
+        return collapsed, linked
+
+    def _group_by_partial_hash(self, candidates: Dict[int, List[FileInfo]],
+                               linked: Optional[Dict[Path, List[FileInfo]]] = None
+                               ) -> Dict[Tuple[int, bytes], List[FileInfo]]:
+        """
+        크기가 같은 후보들을 앞부분 해시로 다시 그룹화
+
+        Args:
+            candidates: 크기별 후보 파일 딕셔너리
+            linked: 대표 경로 -> 나머지 하드링크 (그룹 크기 계산에 포함)
+
+        Returns:
+            (크기, 부분 해시)가 같은 파일이 2개 이상인 그룹 딕셔너리
+        """
+        linked = linked or {}
+        partial_hash_groups: Dict[Tuple[int, bytes], List[FileInfo]] = defaultdict(list)
+
+        for size, files in candidates.items():
+            # 하드링크만으로 이루어진 그룹은 읽지 않아도 중복이지만 그룹 키(해시)가 필요하므로 유지
+            if len(files) == 1 and files[0].path not in linked:
+                continue
+            for file_info in files:
+                partial_hash = self._calculate_partial_hash(file_info.path)
+                if partial_hash is not None:
+                    partial_hash_groups[(size, partial_hash)].append(file_info)
+
+        return {
+            k: v for k, v in partial_hash_groups.items()
+            if len(v) + sum(len(linked.get(f.path, ())) for f in v) > 1
+        }
+
+    def _excluded_names(self) -> FrozenSet[str]:
+        """스캔 시작 시 한 번 만드는 제외 폴더 이름 집합"""
+        return frozenset(os.fspath(name) for name in self.config.excluded_dirs)
+
+    def _iter_file_entries(self, directory: Path,
+                           excluded_names: FrozenSet[str] = None) -> Iterator[List[os.DirEntry]]:
+        """
+        제외 폴더를 건너뛰며 폴더 단위로 파일 DirEntry 목록 생성
+
+        Args:
+            directory: 스캔할 디렉토리 경로
+            excluded_names: 제외 폴더 이름 집합 (None이면 config에서 생성)
+
+        Yields:
+            한 폴더에 있는 (제외 패턴에 해당하지 않는) 파일 DirEntry 리스트
+        """
+        if excluded_names is None:
+            excluded_names = self._excluded_names()
+        is_excluded_name = self._is_excluded_name
+
+        # os.scandir의 DirEntry는 readdir 결과의 파일 종류를 캐시하므로
+        # 폴더/파일 판별에 추가 stat 호출이 필요 없음
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            entries = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # 제외 폴더는 하위로 내려가기 전에 제외 (하위 stat 호출 없음)
+                                if entry.name not in excluded_names:
+                                    stack.append(entry.path)
+                            elif entry.is_file() and not is_excluded_name(entry.name, excluded_names):
+                                entries.append(entry)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            if entries:
+                yield entries
 
     def scan_directory(self, directory: Path) -> List[FileInfo]:
         """
@@ -151,41 +555,121 @@ class DuplicateFinder:
         Returns:
             FileInfo 객체 리스트
         """
-        files = []
+        return list(self.iter_scan_directory(directory))
 
-        try:
-            for item in directory.rglob('*'):
-                if item.is_file() and not self._should_exclude(item):
-                    try:
-                        size = item.stat().st_size
-                        if size >= self.config.min_file_size:
-                            files.append(FileInfo(path=item, size=size))
-                    except (OSError, PermissionError):
-                        continue
-        except (OSError, PermissionError):
-            pass
+    def iter_scan_directory(self, directory: Path) -> Iterator[FileInfo]:
+        """
+        디렉토리를 재귀적으로 스캔하며 파일 정보를 하나씩 생성
+
+        전체 스캔이 끝나기 전에 앞쪽 폴더의 파일부터 처리할 수 있음
+
+        Args:
+            directory: 스캔할 디렉토리 경로
+
+        Yields:
+            FileInfo 객체
+        """
+        min_size = self.config.min_file_size
+        use_statx = self.config.use_statx and is_statx_available()
+        excluded_names = self._excluded_names()
+
+        # 대상 폴더 자체가 제외 폴더 안에 있으면 스캔하지 않음
+        if any(part in excluded_names for part in directory.parts):
+            return
+
+        if self.config.scan_backend == "threaded":
+            yield from self._scan_directory_threaded(directory, use_statx, excluded_names)
+            return
+
+        for entries in self._iter_file_entries(directory, excluded_names):
+            for entry in entries:
+                try:
+                    stat = fast_stat(entry.path) if use_statx else entry.stat()
+                except OSError:
+                    continue
+                if stat.st_size >= min_size:
+                    yield FileInfo(
+                        path=Path(entry.path),
+                        size=stat.st_size,
+                        stat_result=stat
+                    )
+
+    def _scan_directory_threaded(self, directory: Path, use_statx: bool,
+                                 excluded_names: FrozenSet[str]) -> List[FileInfo]:
+        """
+        폴더 단위로 stat 호출을 스레드 풀에 묶어 제출하는 스캔
+
+        stat은 GIL을 해제하므로 다음 폴더를 읽는 동안 커널 stat 처리가 겹쳐 진행됨
+        (NFS/SMB 등 지연이 큰 파일시스템에서 유리)
+
+        Args:
+            directory: 스캔할 디렉토리 경로
+            use_statx: statx 사용 여부
+            excluded_names: 제외 폴더 이름 집합
+
+        Returns:
+            FileInfo 객체 리스트
+        """
+        files = []
+        min_size = self.config.min_file_size
+        stat_func = fast_stat if use_statx else os.stat
+
+        with ThreadPoolExecutor(max_workers=self.config.scan_workers) as executor:
+            futures = [
+                executor.submit(_stat_paths, [entry.path for entry in entries], stat_func)
+                for entries in self._iter_file_entries(directory, excluded_names)
+            ]
+
+            for future in futures:
+                for path, stat in future.result():
+                    if stat is not None and stat.st_size >= min_size:
+                        files.append(FileInfo(
+                            path=Path(path),
+                            size=stat.st_size,
+                            stat_result=stat
+                        ))
 
         return files
 
-    def find_duplicates(self, directories: List[Path] = None) -> List[DuplicateGroup]:
+    def _collect_files(self, directories: Optional[List[Path]],
+                       files: Optional[List[FileInfo]]) -> List[FileInfo]:
         """
-        지정된 디렉토리들에서 중복 파일 탐지
+        이미 스캔한 파일 목록이 있으면 그대로 쓰고, 없으면 디렉토리 스캔
 
         Args:
             directories: 스캔할 디렉토리 리스트 (None이면 config에서 가져옴)
+            files: 미리 스캔한 FileInfo 리스트
 
         Returns:
-            DuplicateGroup 리스트
+            FileInfo 리스트
         """
+        if files is not None:
+            return files
+
         if directories is None:
             directories = self.config.target_directories
 
-        # 1단계: 모든 파일 스캔 및 크기별 그룹화
         print("📁 파일 스캔 중...")
-        all_files: List[FileInfo] = []
-        for directory in directories:
-            if directory.exists() and directory.is_dir():
-                all_files.extend(self.scan_directory(directory))
+        return list(chain.from_iterable(
+            self.iter_scan_directory(directory)
+            for directory in directories
+            if directory.is_dir()
+        ))
+
+    def find_duplicates(self, directories: List[Path] = None,
+                        files: List[FileInfo] = None) -> List[DuplicateGroup]:
+        """
+        지정된 디렉토리들에서 중복 파일 탐지
+
+        Args:
+            directories: 스캔할 디렉토리 리스트 (None이면 config에서 가져옴)
+            files: 미리 스캔한 FileInfo 리스트 (있으면 디렉토리를 다시 스캔하지 않음)
+
+        Returns:
+            DuplicateGroup 리스트
+        """
+        # 1단계: 모든 파일 스캔 및 크기별 그룹화
+        all_files = self._collect_files(directories, files)
 
         print(f"   총 {len(all_files):,}개 파일 발견")
 
@@ -200,39 +684,36 @@ class DuplicateFinder:
         print(f"   중복 후보: {candidate_count:,}개 파일 ({len(candidates):,}개 크기 그룹)")
 
         # 2단계: 부분 해시로 추가 필터링 (대용량 파일 최적화)
-        print("🔍 해시 계산 중...")
-        partial_hash_groups: Dict[Tuple[int, str], List[FileInfo]] = defaultdict(list)
-
-        for size, files in candidates.items():
-            for file_info in files:
-                partial_hash = self._calculate_partial_hash(file_info.path)
-                if partial_hash:
-                    partial_hash_groups[(size, partial_hash)].append(file_info)
-
         # 부분 해시도 같은 파일만 전체 해시 계산
-        final_candidates = {k: v for k, v in partial_hash_groups.items() if len(v) > 1}
+        print("🔍 해시 계산 중...")
+        candidates, linked = self._collapse_hardlinks(candidates)
+        final_candidates = self._group_by_partial_hash(candidates, linked)
 
         # 3단계: 전체 해시 계산 및 최종 중복 그룹 생성
-        hash_groups: Dict[str, DuplicateGroup] = {}
+        hash_groups: Dict[bytes, DuplicateGroup] = {}
         total_to_hash = sum(len(files) for files in final_candidates.values())
         hashed_count = 0
 
         for (size, partial_hash), files in final_candidates.items():
             for file_info in files:
                 full_hash = self._calculate_hash(file_info.path)
-                if full_hash:
-                    file_info.hash = full_hash
-                    if full_hash not in hash_groups:
-                        hash_groups[full_hash] = DuplicateGroup(hash=full_hash)
-                    hash_groups[full_hash].add_file(file_info)
+                if full_hash is not None:
+                    self._add_to_group(hash_groups, full_hash, file_info)
+                    for sibling in linked.get(file_info.path, ()):
+                        self._add_to_group(hash_groups, full_hash, sibling)
 
                 hashed_count += 1
                 if hashed_count % 100 == 0:
                     print(f"   진행: {hashed_count:,}/{total_to_hash:,}")
 
+        self._flush_persistent_cache()
+
         # 실제 중복인 그룹만 반환 (2개 이상 파일)
         duplicates = [group for group in hash_groups.values() if group.count > 1]
 
+        if self.config.verify_sha256:
+            duplicates = self._verify_sha256(duplicates)
+
         # 낭비 공간 기준으로 정렬
         duplicates.sort(key=lambda g: g.wasted_space, reverse=True)
 
@@ -242,27 +723,32 @@ class DuplicateFinder:
 
         return duplicates
 
+    def _get_hash_workers(self) -> int:
+        """해시 계산 워커 프로세스 수 (config.hash_workers가 0이면 CPU 수, 최대 8)"""
+        if self.config.hash_workers > 0:
+            return self.config.hash_workers
+        return min(os.cpu_count() or 1, 8)
+
     def find_duplicates_parallel(self, directories: List[Path] = None,
-                                  max_workers: int = 4) -> List[DuplicateGroup]:
+                                  max_workers: int = None,
+                                  should_stop: Callable[[], bool] = None,
+                                  files: List[FileInfo] = None) -> List[DuplicateGroup]:
         """
         병렬 처리로 중복 파일 탐지 (대규모 디렉토리용)
 
+        전체 해시 계산을 프로세스 풀로 분산하여 GIL 없이 여러 코어를 사용
+
         Args:
             directories: 스캔할 디렉토리 리스트
-            max_workers: 최대 워커 스레드 수
+            max_workers: 최대 워커 프로세스 수 (None이면 config.hash_workers)
+            should_stop: 중단 여부를 반환하는 함수 (True면 남은 해시 작업 취소)
+            files: 미리 스캔한 FileInfo 리스트 (있으면 디렉토리를 다시 스캔하지 않음)
 
         Returns:
             DuplicateGroup 리스트
         """
-        if directories is None:
-            directories = self.config.target_directories
-
         # 파일 스캔
-        print("📁 파일 스캔 중...")
-        all_files: List[FileInfo] = []
-        for directory in directories:
-            if directory.exists() and directory.is_dir():
-                all_files.extend(self.scan_directory(directory))
+        all_files = self._collect_files(directories, files)
 
         print(f"   총 {len(all_files):,}개 파일 발견")
 
@@ -271,36 +757,81 @@ class DuplicateFinder:
         for file_info in all_files:
             size_groups[file_info.size].append(file_info)
 
-        candidates = [(size, files) for size, files in size_groups.items() if len(files) > 1]
+        candidates = {size: files for size, files in size_groups.items() if len(files) > 1}
         print(f"   중복 후보 그룹: {len(candidates):,}개")
 
+        # 앞부분 해시가 같은 파일만 전체 해시 대상으로 남김
+        candidates, linked = self._collapse_hardlinks(candidates)
+        final_candidates = self._group_by_partial_hash(candidates, linked)
+
         # 병렬 해시 계산
         print("🔍 병렬 해시 계산 중...")
-        hash_groups: Dict[str, DuplicateGroup] = {}
-
-        def process_file(file_info: FileInfo) -> Tuple[FileInfo, Optional[str]]:
-            full_hash = self._calculate_hash(file_info.path)
-            return file_info, full_hash
-
-        files_to_hash = [f for _, files in candidates for f in files]
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_file, f): f for f in files_to_hash}
-            completed = 0
-
-            for future in as_completed(futures):
-                file_info, full_hash = future.result()
-                if full_hash:
-                    file_info.hash = full_hash
-                    if full_hash not in hash_groups:
-                        hash_groups[full_hash] = DuplicateGroup(hash=full_hash)
-                    hash_groups[full_hash].add_file(file_info)
+        hash_groups: Dict[bytes, DuplicateGroup] = {}
+
+        # 크기 그룹 순서대로 제출하여 같은 그룹이 비슷한 시점에 완료되도록 함
+        files_to_hash = [f for files in final_candidates.values() for f in files]
+        by_path = {str(f.path): f for f in files_to_hash}
+
+        if max_workers is None:
+            max_workers = self._get_hash_workers()
+
+        # 영구 캐시에 있는 파일은 워커로 보내지 않음
+        cache = self._get_persistent_cache()
+        cached_results: List[Tuple[str, bytes]] = []
+        paths_to_hash: List[str] = []
+        stats_to_store: Dict[str, os.stat_result] = {}
+
+        for path in by_path:
+            if cache is not None:
+                try:
+                    stat_result = os.stat(path)
+                except OSError:
+                    continue
+                digest = cache.get(stat_result)
+                if digest is not None:
+                    cached_results.append((path, digest))
+                    continue
+                stats_to_store[path] = stat_result
+            paths_to_hash.append(path)
+
+        algorithms = repeat(self._hash_algorithm)
+        if len(paths_to_hash) < _MIN_FILES_FOR_POOL or max_workers <= 1:
+            hashed = map(_hash_worker, paths_to_hash, algorithms)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+            chunksize = max(1, len(paths_to_hash) // (4 * max_workers))
+            hashed = executor.map(_hash_worker, paths_to_hash, algorithms, chunksize=chunksize)
+
+        completed = 0
+        try:
+            for path, full_hash in chain(cached_results, hashed):
+                if should_stop is not None and should_stop():
+                    print("   ⏹ 해시 계산 중단")
+                    break
+
+                if full_hash is not None:
+                    file_info = by_path[path]
+                    self._hash_cache[file_info.path] = full_hash
+                    if path in stats_to_store:
+                        cache.put(stats_to_store[path], full_hash)
+                    self._add_to_group(hash_groups, full_hash, file_info)
+                    for sibling in linked.get(file_info.path, ()):
+                        self._add_to_group(hash_groups, full_hash, sibling)
 
                 completed += 1
                 if completed % 100 == 0:
                     print(f"   진행: {completed:,}/{len(files_to_hash):,}")
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._flush_persistent_cache()
 
         duplicates = [group for group in hash_groups.values() if group.count > 1]
+
+        if self.config.verify_sha256:
+            duplicates = self._verify_sha256(duplicates)
+
         duplicates.sort(key=lambda g: g.wasted_space, reverse=True)
 
         return duplicates
@@ -308,11 +839,9 @@ class DuplicateFinder:
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """바이트를 읽기 쉬운 형식으로 변환"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.2f} PB"
+        # 비트 길이로 단위를 바로 결정 (1024로 반복해서 나누지 않음)
+        idx = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
     def get_summary(self, duplicates: List[DuplicateGroup]) -> Dict:
         """
@@ -0,0 +1,153 @@
+"""
+빠른 메타데이터 조회 모듈: Linux statx(AT_STATX_DONT_SYNC)로 필요한 필드만 요청
+
+스캔 중에는 파일 종류, 크기, 수정 시간, inode만 필요하므로 statx에 해당 필드만
+요청하고 원격/네트워크 파일시스템의 동기화도 생략한다.
+Linux가 아니거나 statx를 쓸 수 없으면 os.stat으로 대체한다.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+from functools import lru_cache
+from typing import NamedTuple, Optional, Callable
+
+
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+
+_STATX_TYPE = 0x0001
+_STATX_MODE = 0x0002
+_STATX_MTIME = 0x0040
+_STATX_CTIME = 0x0080
+_STATX_INO = 0x0100
+_STATX_SIZE = 0x0200
+_STATX_MASK = _STATX_TYPE | _STATX_MODE | _STATX_MTIME | _STATX_CTIME | _STATX_INO | _STATX_SIZE
+
+_NS_PER_SEC = 1_000_000_000
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """struct statx (linux/stat.h, 256 bytes)"""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+class StatInfo(NamedTuple):
+    """스캔에 필요한 최소 메타데이터 (os.stat_result와 같은 속성 이름 사용)"""
+    st_mode: int
+    st_size: int
+    st_mtime_ns: int
+    st_ctime_ns: int
+    st_ino: int = 0
+    st_dev: int = 0
+
+    @property
+    def st_mtime(self) -> float:
+        return self.st_mtime_ns / _NS_PER_SEC
+
+    @property
+    def st_ctime(self) -> float:
+        return self.st_ctime_ns / _NS_PER_SEC
+
+
+@lru_cache(maxsize=None)
+def _load_statx() -> Optional[Callable]:
+    """
+    libc의 statx 함수 로드 (최초 1회만 확인)
+
+    Returns:
+        statx 함수 또는 None (Linux가 아니거나 glibc/커널이 지원하지 않는 경우)
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        # glibc 2.28 미만
+        return None
+
+    statx.argtypes = [
+        ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+        ctypes.c_uint, ctypes.POINTER(_Statx),
+    ]
+    statx.restype = ctypes.c_int
+
+    # 커널 4.11 미만이면 ENOSYS
+    buf = _Statx()
+    if statx(_AT_FDCWD, b"/", _AT_STATX_DONT_SYNC, _STATX_MASK, ctypes.byref(buf)) != 0:
+        return None
+
+    return statx
+
+
+def is_statx_available() -> bool:
+    """statx 사용 가능 여부"""
+    return _load_statx() is not None
+
+
+def fast_stat(path) -> StatInfo:
+    """
+    파일 메타데이터 조회 (심볼릭 링크는 따라감, os.stat과 동일)
+
+    Args:
+        path: 파일 경로 (str 또는 Path)
+
+    Returns:
+        StatInfo
+
+    Raises:
+        OSError: 조회 실패 시
+    """
+    statx = _load_statx()
+    if statx is None:
+        st = os.stat(path)
+        return StatInfo(st.st_mode, st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_dev)
+
+    buf = _Statx()
+    if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC,
+             _STATX_MASK, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), str(path))
+
+    mtime, ctime = buf.stx_mtime, buf.stx_ctime
+    return StatInfo(
+        buf.stx_mode,
+        buf.stx_size,
+        mtime.tv_sec * _NS_PER_SEC + mtime.tv_nsec,
+        ctime.tv_sec * _NS_PER_SEC + ctime.tv_nsec,
+        buf.stx_ino,
+        os.makedev(buf.stx_dev_major, buf.stx_dev_minor),
+    )
@@ -3,18 +3,242 @@
 """
 
 import os
+import sys
 import shutil
-import platform
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 
 from .config import OrganizerConfig
-from .duplicate_finder import FileInfo, DuplicateGroup
+from .duplicate_finder import FileInfo, DuplicateGroup, KEEP_STRATEGY_SORT_KEYS
 from .classifier import ClassificationResult
 
+# fcntl은 POSIX 전용 (Windows에서는 없음)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 휴지통 이동 (선택 의존성, 없으면 아카이브 폴더로 대체)
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
+
+# 플랫폼/기능 확인은 모듈 로드 시 한 번만
+_USE_KERNEL_COPY = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+# 폴더 fd 기준 rename(renameat) 지원 여부 (POSIX에서 os.rename은 os.replace와 같이 덮어씀)
+_USE_DIR_FD_RENAME = hasattr(os, 'O_DIRECTORY') and os.rename in os.supports_dir_fd
+_DIR_FD_FLAGS = getattr(os, 'O_PATH', os.O_RDONLY) | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+# linux/fs.h: _IOW(0x94, 9, int) - btrfs/xfs 등에서 copy-on-write 복제
+_FICLONE = 0x40049409
+
+# sendfile 1회 호출당 최대 전송 크기
+_SENDFILE_CHUNK = 1 << 30
+
+
+def _kernel_copy(src: Path, dst: Path):
+    """
+    파일 내용을 커널 안에서 복사 (Linux 전용)
+
+    FICLONE(reflink, 메타데이터만 복제) → copy_file_range(파일시스템 내부 복사,
+    NFS 등은 서버 쪽 복사) → sendfile(사용자 공간 버퍼 없이 복사) → 일반 복사 순으로 시도
+
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(out_fd, _FICLONE, in_fd)
+                return
+            except OSError:
+                # 다른 파일시스템이거나 reflink 미지원
+                pass
+
+        size = os.fstat(in_fd).st_size
+        offset = 0
+
+        if _HAS_COPY_FILE_RANGE:
+            try:
+                while offset < size:
+                    copied = os.copy_file_range(
+                        in_fd, out_fd, min(size - offset, _SENDFILE_CHUNK), offset, offset
+                    )
+                    if copied == 0:
+                        break
+                    offset += copied
+                if offset >= size:
+                    return
+            except OSError:
+                # ENOSYS/EXDEV 등 시작도 못 했으면 다음 방법으로, 도중 실패는 그대로 전달
+                if offset:
+                    raise
+            # copy_file_range는 파일 위치를 옮기지 않으므로 이어서 쓸 위치 지정
+            os.lseek(out_fd, offset, os.SEEK_SET)
+
+        start = offset
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, min(size - offset, _SENDFILE_CHUNK))
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # 복사 도중 실패하면 그대로 오류 전달, 시작도 못 했으면 일반 복사로 대체
+            if offset:
+                raise
+
+        fsrc.seek(start)
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+
+
+def _fast_copy(src: Path, dst: Path):
+    """
+    파일 복사 (내용 + 메타데이터, shutil.copy2와 같은 결과)
+
+    Linux에서는 커널 안에서 복사하고, 그 외 플랫폼은 shutil.copy2 사용
+
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+    """
+    if not _USE_KERNEL_COPY:
+        shutil.copy2(src, dst)
+        return
+
+    try:
+        _kernel_copy(src, dst)
+        shutil.copystat(src, dst)
+    except BaseException:
+        # 불완전한 대상 파일 정리
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
+
+
+class _DirFdCache:
+    """
+    대상 폴더 경로 -> 열린 폴더 fd (실행 단위로 재사용)
+
+    여러 파일이 같은 대상 폴더로 모이므로 폴더를 한 번만 열어 두고 renameat에
+    fd와 파일 이름만 넘겨, 이동마다 커널이 대상 경로를 다시 해석하지 않도록 함.
+    원본 폴더는 수가 제한 없이 많을 수 있어 캐시하지 않고, 대상 폴더도 max_entries개까지만
+    열어 둠 (다른 스레드가 쓰는 중일 수 있으므로 밀어내며 닫지 않고, 가득 차면 None)
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: 동시에 열어 둘 최대 폴더 fd 수 (RLIMIT_NOFILE 소진 방지)
+        """
+        self._fds: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, directory: Path) -> Optional[int]:
+        """
+        폴더 fd (최초 1회만 open, 실패하거나 캐시가 가득 차면 None)
+
+        Args:
+            directory: 폴더 경로
+        """
+        fd = self._fds.get(directory)
+        if fd is not None:
+            return fd
+
+        with self._lock:
+            fd = self._fds.get(directory)
+            if fd is None:
+                if len(self._fds) >= self.max_entries:
+                    return None
+                try:
+                    fd = os.open(directory, _DIR_FD_FLAGS)
+                except OSError:
+                    return None
+                self._fds[directory] = fd
+        return fd
+
+    def close(self):
+        """열어 둔 fd 모두 닫기"""
+        with self._lock:
+            for fd in self._fds.values():
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._fds.clear()
+
+
+def _replace(src: Path, dst: Path, dir_fds: Optional[_DirFdCache] = None):
+    """
+    os.replace (dir_fds가 있으면 대상은 열어 둔 폴더 fd 기준 이름으로, 원본은 경로로 전달)
+
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+        dir_fds: 대상 폴더 fd 캐시
+    """
+    if dir_fds is not None:
+        dst_dir_fd = dir_fds.get(dst.parent)
+        if dst_dir_fd is not None:
+            os.rename(src, dst.name, dst_dir_fd=dst_dir_fd)
+            return
+    os.replace(src, dst)
+
+
+def _fast_move(src: Path, dst: Path, dst_device: Optional[int] = None,
+               dir_fds: Optional[_DirFdCache] = None):
+    """
+    파일 이동
+
+    같은 장치면 replace(O(1)), 다른 장치면 Linux에서는 커널 복사 후 원본 삭제,
+    그 외 플랫폼이나 심볼릭 링크는 shutil.move 사용
+
+    Args:
+        src: 원본 파일 경로
+        dst: 대상 파일 경로
+        dst_device: 대상 폴더의 st_dev (None이면 직접 조회)
+        dir_fds: 같은 장치 이동에 쓸 대상 폴더 fd 캐시
+    """
+    try:
+        if dst_device is None:
+            dst_device = os.stat(dst.parent).st_dev
+        same_device = os.stat(src).st_dev == dst_device
+    except OSError:
+        same_device = False
+
+    if same_device:
+        try:
+            _replace(src, dst, dir_fds)
+            return
+        except OSError:
+            # 권한 문제 등은 아래 복사 후 삭제 방식으로 한 번 더 시도
+            pass
+
+    # 심볼릭 링크는 대상 내용을 복사하지 않고 링크 자체를 다시 만들도록 shutil.move 사용
+    if not _USE_KERNEL_COPY or os.path.islink(src):
+        shutil.move(src, dst)
+        return
+
+    _fast_copy(src, dst)
+    os.unlink(src)
+
 
 class MoveAction(Enum):
     """파일 이동 액션 유형"""
@@ -24,7 +248,7 @@ class MoveAction(Enum):
     RECYCLE = "recycle"
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveOperation:
     """파일 이동 작업 정보"""
     source: Path
@@ -34,6 +258,114 @@ class MoveOperation:
     status: str = "pending"  # pending, success, failed, skipped
     error_message: str = ""
     size: int = 0
+    # destination.parent (실행 중 여러 번 쓰이므로 한 번만 계산, destination과 같이 갱신)
+    _dest_parent: Path = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._dest_parent = self.destination.parent
+
+
+# 실행 시 한 번에 스레드 풀에 넣는 작업 수 (스트리밍 실행에서 메모리 상한)
+_EXECUTE_BATCH_SIZE = 1024
+
+# 계획 단계 stat 병렬 조회 (네트워크 드라이브 등 왕복 지연이 큰 저장소용)
+_STAT_WORKERS = 32
+_MIN_PATHS_FOR_STAT_POOL = 64
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """stat 결과 (없거나 조회 실패 시 None)"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stat_many(paths: List[Path]) -> List[Optional[os.stat_result]]:
+    """
+    여러 경로를 stat (경로가 많으면 스레드 풀로 동시에 조회)
+
+    stat은 I/O 대기 중 GIL을 놓으므로 스레드로도 왕복 지연을 겹칠 수 있음
+
+    Args:
+        paths: 조회할 경로 리스트
+
+    Returns:
+        paths와 같은 순서의 stat 결과 리스트 (실패한 항목은 None)
+    """
+    if len(paths) < _MIN_PATHS_FOR_STAT_POOL:
+        return [_stat_or_none(p) for p in paths]
+
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as executor:
+        return list(executor.map(_stat_or_none, paths))
+
+
+class _UniqueNameAllocator:
+    """
+    대상 폴더별로 기존 파일 이름을 한 번만 읽어 두고 충돌 없는 경로를 배정
+
+    이름마다 exists()로 확인하는 대신 폴더당 scandir 한 번으로 이름 집합을 만들고,
+    배정한 이름도 집합에 추가하여 같은 계획 안에서 대상이 겹치지 않도록 함
+    """
+
+    def __init__(self):
+        # 폴더 경로 -> (이름 집합, scandir 성공 여부)
+        self._dirs: Dict[Path, Tuple[Set[str], bool]] = {}
+
+    def _names_in(self, parent: Path) -> Tuple[Set[str], bool]:
+        """폴더의 기존 이름 집합 (최초 1회만 읽음)"""
+        cached = self._dirs.get(parent)
+        if cached is None:
+            try:
+                with os.scandir(parent) as it:
+                    cached = ({os.path.normcase(entry.name) for entry in it}, True)
+            except (FileNotFoundError, NotADirectoryError):
+                # 아직 없는 폴더: 기존 파일 없음
+                cached = (set(), True)
+            except OSError:
+                # 목록을 읽을 수 없으면 이름마다 exists()로 확인
+                cached = (set(), False)
+            self._dirs[parent] = cached
+        return cached
+
+    def allocate(self, path: Path) -> Path:
+        """
+        고유 경로 배정 (배정한 이름은 예약됨)
+
+        Args:
+            path: 원하는 경로
+
+        Returns:
+            기존 파일/이미 배정한 경로와 겹치지 않는 경로
+        """
+        parent = path.parent
+        names, scanned = self._names_in(parent)
+
+        candidate = path
+        stem, suffix = path.stem, path.suffix
+        counter = 1
+        while True:
+            key = os.path.normcase(candidate.name)
+            if key not in names and (scanned or not candidate.exists()):
+                names.add(key)
+                return candidate
+            candidate = parent / f"{stem}_{counter}{suffix}"
+            counter += 1
+
+
+# 크기 표시 단위 (1024배씩)
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# 보고서에 표시할 액션 이름
+_ACTION_LABELS = {
+    MoveAction.MOVE: "📦 이동",
+    MoveAction.COPY: "📋 복사",
+    MoveAction.ARCHIVE: "📁 아카이브",
+    MoveAction.RECYCLE: "🗑️ 휴지통",
+}
+
+# 드라이 런 보고서의 작업 하나 (마지막 줄바꿈은 작업 사이 빈 줄)
+_OP_TPL = "  원본: {src}\n  대상: {dst}\n  크기: {size} | 사유: {reason}\n"
 
 
 class FileMover:
@@ -44,6 +376,41 @@ class FileMover:
         self.logger = logger
         self.operations: List[MoveOperation] = []
         self._move_history: List[MoveOperation] = []
+        # 대상 폴더 -> st_dev (같은 폴더로 가는 파일마다 stat하지 않도록)
+        self._dev_cache: Dict[Path, int] = {}
+        # 이미 생성을 확인한 대상 폴더 (같은 폴더에 대해 mkdir 반복 방지)
+        self._ensured_dirs: Set[Path] = set()
+        # 실행 중 rename에 쓸 대상 폴더 fd (실행이 끝나면 닫음)
+        self._dir_fds = _DirFdCache() if _USE_DIR_FD_RENAME else None
+        # 작업 종류 -> 실행 함수
+        self._dispatch = {
+            MoveAction.MOVE: self._do_move_op,
+            MoveAction.ARCHIVE: self._do_move_op,
+            MoveAction.COPY: self._do_copy_op,
+            MoveAction.RECYCLE: self._do_recycle_op,
+        }
+
+        if config.use_recycle_bin and send2trash is None:
+            self._log("send2trash 미설치, 휴지통 대신 아카이브 폴더로 이동합니다.", "WARNING")
+
+    def _destination_device(self, directory: Path) -> Optional[int]:
+        """
+        대상 폴더의 장치 번호 (폴더별로 한 번만 조회)
+
+        Args:
+            directory: 대상 폴더
+
+        Returns:
+            st_dev 또는 None (조회 실패)
+        """
+        device = self._dev_cache.get(directory)
+        if device is None:
+            try:
+                device = os.stat(directory).st_dev
+            except OSError:
+                return None
+            self._dev_cache[directory] = device
+        return device
 
     def _log(self, message: str, level: str = "INFO"):
         """로깅 헬퍼"""
@@ -61,23 +428,33 @@ class FileMover:
         Returns:
             성공 여부
         """
+        if path in self._ensured_dirs:
+            return True
+
         try:
             path.mkdir(parents=True, exist_ok=True)
-            return True
         except (OSError, PermissionError) as e:
             self._log(f"디렉토리 생성 실패: {path} - {e}", "ERROR")
             return False
 
-    def _get_unique_path(self, path: Path) -> Path:
+        # 워커 스레드가 같은 폴더를 동시에 추가해도 결과는 같으므로 잠금 불필요
+        self._ensured_dirs.add(path)
+        return True
+
+    def _get_unique_path(self, path: Path, allocator: _UniqueNameAllocator = None) -> Path:
         """
         충돌 방지를 위한 고유 경로 생성
 
         Args:
             path: 원본 경로
+            allocator: 계획 단위 이름 배정기 (있으면 stat 없이 메모리에서 확인하고 예약)
 
         Returns:
             고유한 경로
         """
+        if allocator is not None:
+            return allocator.allocate(path)
+
         if not path.exists():
             return path
 
@@ -103,27 +480,12 @@ class FileMover:
         Returns:
             성공 여부
         """
-        try:
-            # Windows
-            if platform.system() == "Windows":
-                try:
-                    from send2trash import send2trash
-                    send2trash(str(file_path))
-                    return True
-                except ImportError:
-                    # send2trash가 없으면 아카이브 폴더로 대체
-                    self._log("send2trash 미설치, 아카이브 폴더로 이동합니다.", "WARNING")
-                    return False
-
-            # macOS/Linux
-            else:
-                try:
-                    from send2trash import send2trash
-                    send2trash(str(file_path))
-                    return True
-                except ImportError:
-                    return False
+        if send2trash is None:
+            return False
 
+        try:
+            send2trash(os.fspath(file_path))
+            return True
         except Exception as e:
             self._log(f"휴지통 이동 실패: {file_path} - {e}", "ERROR")
             return False
@@ -141,17 +503,15 @@ class FileMover:
             이동 작업 리스트
         """
         operations = []
+        allocator = _UniqueNameAllocator()
+        # 알 수 없는 전략은 최신 파일 보존
+        sort_key, reverse = KEEP_STRATEGY_SORT_KEYS.get(
+            keep_strategy, KEEP_STRATEGY_SORT_KEYS["newest"]
+        )
 
         for group in duplicates:
-            # 보존할 파일 선택
-            files = sorted(group.files, key=lambda f: f.modified_time, reverse=True)
-
-            if keep_strategy == "oldest":
-                files = sorted(group.files, key=lambda f: f.modified_time)
-            elif keep_strategy == "largest":
-                files = sorted(group.files, key=lambda f: f.size, reverse=True)
-            elif keep_strategy == "smallest":
-                files = sorted(group.files, key=lambda f: f.size)
+            # 보존할 파일 선택 (아카이브 이름 번호가 정렬 순서를 따르므로 전체 정렬 유지)
+            files = sorted(group.files, key=sort_key, reverse=reverse)
 
             # 첫 번째 파일 보존, 나머지 아카이브
             keep_file = files[0]
@@ -161,7 +521,7 @@ class FileMover:
                 # 아카이브 경로 생성
                 relative_path = file_info.path.name
                 archive_path = self.config.duplicates_archive / relative_path
-                archive_path = self._get_unique_path(archive_path)
+                archive_path = self._get_unique_path(archive_path, allocator)
 
                 action = MoveAction.RECYCLE if self.config.use_recycle_bin else MoveAction.ARCHIVE
 
@@ -189,33 +549,44 @@ class FileMover:
         Returns:
             이동 작업 리스트
         """
+        operations = list(self.iter_plan_classification_organize(results, base_path))
+        self.operations.extend(operations)
+        return operations
+
+    def iter_plan_classification_organize(self, results: Iterable[ClassificationResult],
+                                          base_path: Path = None) -> Iterator[MoveOperation]:
+        """
+        분류 결과에 따른 이동 작업을 하나씩 생성 (self.operations에는 추가하지 않음)
+
+        Args:
+            results: 분류 결과
+            base_path: 기준 경로 (None이면 config에서 가져옴)
+
+        Yields:
+            이동 작업
+        """
         if base_path is None:
             base_path = self.config.organized_archive
 
-        operations = []
+        allocator = _UniqueNameAllocator()
 
-        for result in results:
-            if result.target_path is None:
-                continue
-
-            # 원본과 대상이 같으면 스킵
-            if result.file_info.path == result.target_path:
-                continue
+        # 대상이 없거나 원본과 같은 결과는 미리 걸러냄
+        candidates = (
+            r for r in results
+            if r.target_path is not None and r.file_info.path != r.target_path
+        )
 
+        for result in candidates:
             # 고유 경로 확보
-            target_path = self._get_unique_path(result.target_path)
+            target_path = self._get_unique_path(result.target_path, allocator)
 
-            op = MoveOperation(
+            yield MoveOperation(
                 source=result.file_info.path,
                 destination=target_path,
                 action=MoveAction.MOVE,
                 reason=f"분류: {result.category}",
                 size=result.file_info.size
             )
-            operations.append(op)
-
-        self.operations.extend(operations)
-        return operations
 
     def plan_version_cleanup(self, keep_paths: List[Path],
                              archive_paths: List[Path]) -> List[MoveOperation]:
@@ -230,13 +601,16 @@ class FileMover:
             이동 작업 리스트
         """
         operations = []
+        allocator = _UniqueNameAllocator()
 
-        for file_path in archive_paths:
-            if not file_path.exists():
+        # stat 한 번으로 존재 확인과 크기 조회 (미리 동시에 조회)
+        archive_paths = list(archive_paths)
+        for file_path, st in zip(archive_paths, _stat_many(archive_paths)):
+            if st is None:
                 continue
 
             archive_dest = self.config.archive_base / "Versions" / file_path.name
-            archive_dest = self._get_unique_path(archive_dest)
+            archive_dest = self._get_unique_path(archive_dest, allocator)
 
             action = MoveAction.RECYCLE if self.config.use_recycle_bin else MoveAction.ARCHIVE
 
@@ -245,7 +619,7 @@ class FileMover:
                 destination=archive_dest,
                 action=action,
                 reason="이전 버전 파일",
-                size=file_path.stat().st_size if file_path.exists() else 0
+                size=st.st_size
             )
             operations.append(op)
 
@@ -280,86 +654,172 @@ class FileMover:
             "errors": [],
         }
 
-        for i, op in enumerate(operations):
-            if dry_run:
+        if dry_run:
+            for op in operations:
                 # 드라이 런: 실제 작업 없이 상태만 기록
                 op.status = "dry_run"
                 results["success"] += 1
                 results["space_freed"] += op.size
                 self._log(f"[DRY RUN] {op.action.value}: {op.source} -> {op.destination}")
-                continue
+            return results
 
-            try:
-                # 실제 작업 수행
-                if op.action == MoveAction.RECYCLE:
-                    if self._move_to_recycle_bin(op.source):
-                        op.status = "success"
+        self._execute_stream(operations, results, len(operations))
+        return results
+
+    def _execute_stream(self, operations: Iterable[MoveOperation], results: Dict,
+                        total: Optional[int]) -> int:
+        """
+        작업을 배치 단위로 실행하고 results에 집계
+
+        Args:
+            operations: 실행할 작업
+            results: 집계할 결과 딕셔너리 (직접 수정)
+            total: 전체 작업 수 (진행 표시용, 모르면 None)
+
+        Returns:
+            실행한 작업 수
+        """
+        workers = max(1, self.config.move_workers)
+        executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        # 스레드 풀 사용 시 배치 사이에서도 대상 경로가 겹치지 않도록 유지
+        reserved: Set[Path] = set()
+        done = 0
+        it = iter(operations)
+        # 진행 표시는 일정 시간마다 같은 줄에 덮어씀 (터미널 출력 대기 최소화)
+        interval = self.config.progress_interval_sec
+        last_progress = time.monotonic()
+        progress_shown = False
+
+        # 결과 집계와 이력 기록은 호출 스레드에서만 수행 (잠금 불필요, 작업 순서 유지)
+        try:
+            for batch in iter(lambda: list(islice(it, _EXECUTE_BATCH_SIZE)), []):
+                if executor is not None:
+                    # 같은 대상 경로로 동시에 이동하면 서로 덮어쓰므로 제출 전에 순차적으로 분리
+                    self._dedupe_destinations(batch, reserved)
+                    outcomes = executor.map(self._run_operation, batch)
+                else:
+                    outcomes = map(self._run_operation, batch)
+
+                for op, record_error in outcomes:
+                    done += 1
+                    if op.status == "success":
                         results["success"] += 1
-                        results["space_freed"] += op.size
-                    else:
-                        # 휴지통 실패시 아카이브로 대체
-                        op.action = MoveAction.ARCHIVE
-                        self._execute_move(op)
-                        if op.status == "success":
-                            results["success"] += 1
+                        if op.action in (MoveAction.RECYCLE, MoveAction.ARCHIVE):
                             results["space_freed"] += op.size
-                        else:
-                            results["failed"] += 1
+                    else:
+                        results["failed"] += 1
+                        if record_error:
                             results["errors"].append({
                                 "file": str(op.source),
                                 "error": op.error_message
                             })
 
-                elif op.action in (MoveAction.MOVE, MoveAction.ARCHIVE):
-                    self._execute_move(op)
-                    if op.status == "success":
-                        results["success"] += 1
-                        if op.action == MoveAction.ARCHIVE:
-                            results["space_freed"] += op.size
-                    else:
-                        results["failed"] += 1
-                        results["errors"].append({
-                            "file": str(op.source),
-                            "error": op.error_message
-                        })
+                    # 진행 상황 출력
+                    now = time.monotonic()
+                    if now - last_progress >= interval:
+                        self._write_progress(done, total)
+                        last_progress = now
+                        progress_shown = True
+
+                    # 이력 기록
+                    self._move_history.append(op)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            if progress_shown:
+                self._write_progress(done, total)
+                print(flush=True)
+            if self._dir_fds is not None:
+                self._dir_fds.close()
+            # 실행 사이에 폴더가 지워질 수 있으므로 실행 단위로만 유지
+            self._ensured_dirs.clear()
+
+        return done
 
-                elif op.action == MoveAction.COPY:
-                    self._execute_copy(op)
-                    if op.status == "success":
-                        results["success"] += 1
-                    else:
-                        results["failed"] += 1
+    @staticmethod
+    def _write_progress(done: int, total: Optional[int]):
+        """진행 상황을 현재 줄에 덮어쓰기 (print는 sys.stdout이 None이면 출력 생략)"""
+        if total is not None:
+            print(f"\r   진행: {done}/{total}", end='', flush=True)
+        else:
+            print(f"\r   진행: {done}", end='', flush=True)
+
+    def _run_operation(self, op: MoveOperation) -> Tuple[MoveOperation, bool]:
+        """
+        작업 하나 실행 (워커 스레드에서 호출될 수 있음)
 
-            except Exception as e:
-                op.status = "failed"
-                op.error_message = str(e)
-                results["failed"] += 1
-                results["errors"].append({
-                    "file": str(op.source),
-                    "error": str(e)
-                })
-                self._log(f"작업 실패: {op.source} - {e}", "ERROR")
+        Args:
+            op: 실행할 작업
 
-            # 진행 상황 출력
-            if (i + 1) % 50 == 0:
-                print(f"   진행: {i + 1}/{len(operations)}")
+        Returns:
+            (작업, 실패 시 오류 목록에 기록할지 여부)
+        """
+        handler = self._dispatch.get(op.action)
+        if handler is None:
+            return op, False
 
-            # 이력 기록
-            self._move_history.append(op)
+        try:
+            return op, handler(op)
+        except Exception as e:
+            op.status = "failed"
+            op.error_message = str(e)
+            self._log(f"작업 실패: {op.source} - {e}", "ERROR")
+            return op, True
+
+    def _do_move_op(self, op: MoveOperation) -> bool:
+        """MOVE/ARCHIVE 작업 실행 (반환값: 실패 시 오류 목록에 기록할지 여부)"""
+        self._execute_move(op)
+        return True
+
+    def _do_copy_op(self, op: MoveOperation) -> bool:
+        """COPY 작업 실행 (복사 실패는 오류 목록에 기록하지 않음)"""
+        self._execute_copy(op)
+        return False
+
+    def _do_recycle_op(self, op: MoveOperation) -> bool:
+        """RECYCLE 작업 실행 (휴지통 실패 시 아카이브로 대체)"""
+        if self._move_to_recycle_bin(op.source):
+            op.status = "success"
+        else:
+            op.action = MoveAction.ARCHIVE
+            self._execute_move(op)
+        return True
 
-        return results
+    def _dedupe_destinations(self, operations: List[MoveOperation], reserved: Set[Path] = None):
+        """
+        한 배치 안에서 대상 경로가 겹치는 작업에 새 이름 지정
+
+        Args:
+            operations: 실행할 작업 리스트 (destination을 직접 수정)
+            reserved: 이전 배치까지 배정된 대상 경로 (이 배치의 경로도 추가됨)
+        """
+        if reserved is None:
+            reserved = set()
+        for op in operations:
+            destination = op.destination
+            if destination in reserved:
+                stem, suffix, parent = destination.stem, destination.suffix, destination.parent
+                counter = 1
+                while destination in reserved or destination.exists():
+                    destination = parent / f"{stem}_{counter}{suffix}"
+                    counter += 1
+                op.destination = destination
+                op._dest_parent = parent
+            reserved.add(destination)
 
     def _execute_move(self, op: MoveOperation):
         """실제 파일 이동 수행"""
         try:
             # 대상 디렉토리 생성
-            if not self._ensure_directory(op.destination.parent):
+            if not self._ensure_directory(op._dest_parent):
                 op.status = "failed"
                 op.error_message = "대상 디렉토리 생성 실패"
                 return
 
             # 파일 이동
-            shutil.move(str(op.source), str(op.destination))
+            _fast_move(op.source, op.destination,
+                       self._destination_device(op._dest_parent),
+                       self._dir_fds)
             op.status = "success"
             self._log(f"이동 완료: {op.source} -> {op.destination}")
 
@@ -371,12 +831,12 @@ class FileMover:
     def _execute_copy(self, op: MoveOperation):
         """실제 파일 복사 수행"""
         try:
-            if not self._ensure_directory(op.destination.parent):
+            if not self._ensure_directory(op._dest_parent):
                 op.status = "failed"
                 op.error_message = "대상 디렉토리 생성 실패"
                 return
 
-            shutil.copy2(str(op.source), str(op.destination))
+            _fast_copy(op.source, op.destination)
             op.status = "success"
             self._log(f"복사 완료: {op.source} -> {op.destination}")
 
@@ -395,53 +855,60 @@ class FileMover:
         Returns:
             포맷된 보고서
         """
+        return "\n".join(self.iter_dry_run_report(operations))
+
+    def iter_dry_run_report(self, operations: List[MoveOperation] = None) -> Iterator[str]:
+        """
+        드라이 런 결과 보고서를 한 항목씩 생성
+
+        앞부분만 필요한 경우(GUI 로그 등) 전체 보고서 문자열을 만들지 않아도 됨
+
+        Args:
+            operations: 작업 리스트
+
+        Yields:
+            보고서 항목 ("\n"으로 이으면 전체 보고서, 작업 하나는 뒤 빈 줄까지 한 항목)
+        """
         if operations is None:
             operations = self.operations
 
-        lines = []
-        lines.append("=" * 70)
-        lines.append("🔍 드라이 런 (Dry Run) 미리보기")
-        lines.append("=" * 70)
-        lines.append(f"\n총 {len(operations)}개 파일 작업 예정\n")
+        yield "=" * 70
+        yield "🔍 드라이 런 (Dry Run) 미리보기"
+        yield "=" * 70
+        yield ""
+        yield f"총 {len(operations)}개 파일 작업 예정"
+        yield ""
 
         # 액션별 그룹화
-        by_action: Dict[MoveAction, List[MoveOperation]] = {}
+        by_action: Dict[MoveAction, List[MoveOperation]] = defaultdict(list)
         for op in operations:
-            if op.action not in by_action:
-                by_action[op.action] = []
             by_action[op.action].append(op)
 
         total_size = 0
 
         for action, ops in by_action.items():
-            action_name = {
-                MoveAction.MOVE: "📦 이동",
-                MoveAction.COPY: "📋 복사",
-                MoveAction.ARCHIVE: "📁 아카이브",
-                MoveAction.RECYCLE: "🗑️ 휴지통",
-            }.get(action, action.value)
+            action_name = _ACTION_LABELS.get(action, action.value)
 
-            lines.append(f"\n{action_name} ({len(ops)}개 파일)")
-            lines.append("-" * 60)
+            yield ""
+            yield f"{action_name} ({len(ops)}개 파일)"
+            yield "-" * 60
 
+            format_size = self._format_size
             for op in ops[:20]:  # 상위 20개만 표시
-                size_str = self._format_size(op.size)
-                lines.append(f"  원본: {op.source}")
-                lines.append(f"  대상: {op.destination}")
-                lines.append(f"  크기: {size_str} | 사유: {op.reason}")
-                lines.append("")
+                yield _OP_TPL.format(src=op.source, dst=op.destination,
+                                     size=format_size(op.size), reason=op.reason)
                 total_size += op.size
 
             if len(ops) > 20:
-                lines.append(f"  ... 외 {len(ops) - 20}개 파일")
+                yield f"  ... 외 {len(ops) - 20}개 파일"
 
-        lines.append("\n" + "=" * 70)
-        lines.append(f"예상 절약/이동 용량: {self._format_size(total_size)}")
-        lines.append("=" * 70)
-        lines.append("\n⚠️  이것은 미리보기입니다. 실제 파일은 변경되지 않았습니다.")
-        lines.append("    실제 실행하려면 --execute 옵션을 사용하세요.")
-
-        return "\n".join(lines)
+        yield ""
+        yield "=" * 70
+        yield f"예상 절약/이동 용량: {self._format_size(total_size)}"
+        yield "=" * 70
+        yield ""
+        yield "⚠️  이것은 미리보기입니다. 실제 파일은 변경되지 않았습니다."
+        yield "    실제 실행하려면 --execute 옵션을 사용하세요."
 
     def get_execution_report(self, results: Dict) -> str:
         """
@@ -480,15 +947,14 @@ class FileMover:
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """바이트를 읽기 쉬운 형식으로 변환"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.2f} PB"
+        # 비트 길이로 단위를 바로 결정 (1024로 반복해서 나누지 않음)
+        idx = min((max(int(size_bytes), 1).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
     def clear_operations(self):
         """대기 중인 작업 초기화"""
         self.operations = []
+        self._ensured_dirs.clear()
 
     def get_history(self) -> List[MoveOperation]:
         """실행 이력 반환"""
@@ -0,0 +1,121 @@
+"""
+해시 캐시 모듈: 파일 내용 해시를 SQLite에 저장하여 반복 실행 시 재해싱 생략
+
+(장치, inode)를 키로 크기와 수정 시간(ns)을 함께 저장하고,
+둘 중 하나라도 바뀌었거나 해시 알고리즘이 다르면 캐시를 무효로 처리
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# 기본 캐시 파일 위치
+DEFAULT_CACHE_PATH = Path.home() / ".file_organizer" / "hashes.sqlite"
+# ssdeep 퍼지 해시용 (내용 해시와 같은 inode 키를 쓰므로 별도 파일)
+DEFAULT_FUZZY_CACHE_PATH = Path.home() / ".file_organizer" / "fuzzy_hashes.sqlite"
+
+_INT64_LIMIT = 1 << 63
+
+
+def _to_sqlite_int(value: int) -> int:
+    """SQLite INTEGER(부호 있는 64비트) 범위로 변환 (inode/장치 번호는 부호 없는 64비트일 수 있음)"""
+    return value - (1 << 64) if value >= _INT64_LIMIT else value
+
+
+class HashCache:
+    """SQLite 기반 영구 파일 해시 캐시"""
+
+    def __init__(self, db_path: Path = None, algorithm: str = "", batch_size: int = 1024):
+        """
+        Args:
+            db_path: 캐시 DB 파일 경로 (None이면 ~/.file_organizer/hashes.sqlite)
+            algorithm: 해시 알고리즘 이름 (다른 알고리즘으로 저장된 값은 사용하지 않음)
+            batch_size: 이 개수만큼 쌓이면 한 번에 기록
+
+        Raises:
+            sqlite3.Error, OSError: DB를 열 수 없는 경우
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self.algorithm = algorithm
+        self.batch_size = batch_size
+        self._pending: List[Tuple] = []
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            " dev INTEGER, inode INTEGER, size INTEGER, mtime_ns INTEGER,"
+            " algo TEXT, digest BLOB, PRIMARY KEY (dev, inode))"
+        )
+        self._conn.commit()
+
+    def get(self, stat_result: os.stat_result) -> Optional[bytes]:
+        """
+        캐시된 해시 조회
+
+        Args:
+            stat_result: 현재 파일의 stat 결과
+
+        Returns:
+            digest 바이트 또는 None (캐시 없음/파일 변경됨)
+        """
+        if not stat_result.st_ino:
+            return None
+
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, algo, digest FROM hashes WHERE dev = ? AND inode = ?",
+            (_to_sqlite_int(stat_result.st_dev), _to_sqlite_int(stat_result.st_ino))
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        size, mtime_ns, algo, digest = row
+        if size != stat_result.st_size or mtime_ns != stat_result.st_mtime_ns or algo != self.algorithm:
+            return None
+        return digest
+
+    def put(self, stat_result: os.stat_result, digest: bytes):
+        """
+        해시 저장 (batch_size만큼 모이면 기록)
+
+        Args:
+            stat_result: 해싱 직전의 stat 결과
+            digest: 해시 digest
+        """
+        if not stat_result.st_ino:
+            return
+
+        self._pending.append((
+            _to_sqlite_int(stat_result.st_dev),
+            _to_sqlite_int(stat_result.st_ino),
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            self.algorithm,
+            digest,
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 항목 기록"""
+        if not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO hashes (dev, inode, size, mtime_ns, algo, digest)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            self._pending
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def close(self):
+        """기록 후 연결 종료"""
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
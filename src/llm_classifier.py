@@ -7,10 +7,35 @@ LLM 기반 파일 분류 모듈
 
 import os
 import json
-from typing import Optional, Dict, List, Any
+import time
+import random
+import atexit
+import asyncio
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from typing import Optional, Dict, List, Any, Tuple
 from pathlib import Path
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import lru_cache
+
+from .classification_cache import CACHE_FILENAME, ClassificationCache
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 
 
 @dataclass
@@ -22,10 +47,352 @@ class LLMConfig:
     base_url: Optional[str] = None  # Ollama 등을 위한 커스텀 URL
     max_tokens: int = 500
     temperature: float = 0.3
+    # 분류 결과 캐시 (같은 파일 재분류 시 LLM 호출 생략)
+    use_cache: bool = True
+    cache_path: Optional[Path] = None  # None이면 로그 폴더의 llm_cache.jsonl
+    cache_ttl_sec: float = 30 * 24 * 3600
+    # 일시적 오류(429, 503, 연결 끊김 등) 재시도: base * 2^n + 지터 (최대 retry_max_delay초)
+    max_retries: int = 5
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 30.0
+    # 클라이언트 측 요청 속도 제한 (분당 요청 수 / 분당 토큰 수, 0이면 제한 없음)
+    # 예: Claude tier 1은 50 RPM
+    rpm: int = 0
+    tpm: int = 0
+    # 확장자만으로 분류가 확실한 파일은 LLM 호출 생략
+    # {확장자: 카테고리 후보들} - 후보 중 사용 가능한 카테고리에 있는 첫 번째 사용
+    # None이면 DEFAULT_EXTENSION_RULES, 빈 딕셔너리면 사용 안 함
+    extension_rules: Optional[Dict[str, Tuple[str, ...]]] = None
+
+
+# 확장자 -> 카테고리 후보 (카테고리 이름 체계가 달라도 맞는 것을 고르도록 여러 개)
+_CODE_CATEGORIES = ("개발_프로젝트", "코드")
+_MEDIA_IMAGE_CATEGORIES = ("미디어", "이미지")
+_MEDIA_VIDEO_CATEGORIES = ("미디어", "영상")
+_MEDIA_AUDIO_CATEGORIES = ("미디어", "오디오")
+_ARCHIVE_CATEGORIES = ("압축파일",)
+_DESIGN_CATEGORIES = ("디자인",)
+
+DEFAULT_EXTENSION_RULES: Dict[str, Tuple[str, ...]] = {
+    **{ext: _CODE_CATEGORIES for ext in (
+        '.py', '.ipynb', '.js', '.ts', '.jsx', '.tsx', '.java', '.c', '.cpp', '.h',
+        '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.sh', '.ps1', '.sql')},
+    **{ext: _MEDIA_IMAGE_CATEGORIES for ext in (
+        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic', '.tiff')},
+    **{ext: _MEDIA_VIDEO_CATEGORIES for ext in (
+        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.webm')},
+    **{ext: _MEDIA_AUDIO_CATEGORIES for ext in (
+        '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a')},
+    **{ext: _ARCHIVE_CATEGORIES for ext in (
+        '.zip', '.rar', '.7z', '.tar', '.gz', '.bz2')},
+    **{ext: _DESIGN_CATEGORIES for ext in (
+        '.psd', '.ai', '.sketch', '.fig', '.xd')},
+}
+
+
+def _fallback_result(available_categories: List[str], reasoning: str,
+                     confidence: float = 0.1) -> Dict[str, Any]:
+    """LLM 호출 실패 시 기본 분류 결과"""
+    return {
+        "category": available_categories[0] if available_categories else "기타",
+        "confidence": confidence,
+        "reasoning": reasoning
+    }
+
+
+# 재시도할 HTTP 상태 코드 (529: Anthropic 과부하)
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+# 재시도할 예외 클래스 이름 (SDK를 import하지 않고 판별)
+_RETRY_ERROR_NAMES = frozenset({
+    "RateLimitError", "APIConnectionError", "APITimeoutError", "InternalServerError",  # anthropic/openai
+    "ResourceExhausted", "ServiceUnavailable", "TooManyRequests",  # google
+    "ConnectionError", "ConnectTimeout", "ReadTimeout", "Timeout",  # requests
+})
+
+# CLI 비정상 종료 중 재시도할 것 (stderr/stdout에 이 문구가 있을 때만, 소문자 비교)
+# 설치/인증/모델 이름 오류 등은 재시도해도 같으므로 바로 대체 결과로 넘어감
+_CLI_TRANSIENT_MARKERS = (
+    "429", "rate limit", "ratelimit", "too many requests", "resource_exhausted",
+    "500", "502", "503", "504", "unavailable", "overloaded", "internal error",
+    "timeout", "timed out", "deadline", "econnreset", "connection reset", "network",
+)
+
+
+class CLIError(subprocess.CalledProcessError):
+    """CLI 비정상 종료 (메시지는 stderr)"""
+
+    def __str__(self):
+        return (self.stderr or "").strip() or super().__str__()
+
+
+_JSON_CLOSERS = {'{': '}', '[': ']'}
+
+
+def _extract_first_json(text: str, opener: str = '{') -> Any:
+    """
+    텍스트에서 처음 완성되는 JSON 객체/배열 파싱
+
+    문자열 안의 괄호와 이스케이프를 구분하며 한 번만 훑으므로, 앞뒤에 설명문이 붙거나
+    JSON이 여러 개 출력되어도 첫 번째 것만 정확히 잘라냄
+
+    Args:
+        text: LLM 출력
+        opener: 찾을 시작 문자 ('{' 또는 '[')
+
+    Returns:
+        파싱된 JSON 값
+
+    Raises:
+        ValueError: 시작 문자가 없거나 닫히지 않았거나 파싱 불가
+    """
+    closer = _JSON_CLOSERS[opener]
+    start = text.find(opener)
+    if start < 0:
+        raise ValueError(f"JSON 응답을 찾을 수 없음: '{opener}' 없음")
+
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif c == '\\':
+                escape = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == opener:
+            depth += 1
+        elif c == closer:
+            depth -= 1
+            if depth == 0:
+                return _loads(text[start:i + 1])
+
+    raise ValueError("JSON 응답이 끝나지 않음")
+
+
+def _decode_first_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    스트리밍 중인 응답에서 첫 JSON 객체 파싱
+
+    Returns:
+        완성된 객체 또는 None (아직 닫히지 않았거나 파싱 불가)
+    """
+    try:
+        obj = _extract_first_json(text)
+    except ValueError:
+        return None
+    return obj if isinstance(obj, dict) else None
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 판별"""
+    if isinstance(exc, subprocess.CalledProcessError):
+        output = f"{exc.stderr or ''}\n{exc.output or ''}".lower()
+        return any(marker in output for marker in _CLI_TRANSIENT_MARKERS)
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        return status in _RETRY_STATUS_CODES
+    return type(exc).__name__ in _RETRY_ERROR_NAMES
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """응답의 Retry-After 헤더 (초 단위 값만, 없으면 None)"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기 (스레드/코루틴 양쪽에서 사용 가능)
+
+    분당 rate개씩 채워지고 최대 capacity개까지 쌓임. 토큰이 모자라면
+    채워질 때까지 대기하여 제공자 한도(429)에 걸리기 전에 속도를 맞춤
+    """
+
+    def __init__(self, rate_per_min: float, capacity: float = None):
+        """
+        Args:
+            rate_per_min: 분당 채워지는 토큰 수
+            capacity: 최대 토큰 수 (None이면 rate_per_min, 즉 1분치 버스트 허용)
+        """
+        self.rate = rate_per_min / 60.0
+        self.capacity = capacity or rate_per_min
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """
+        토큰 차감 시도
+
+        Returns:
+            0이면 차감 완료, 아니면 다시 시도하기까지 기다릴 초
+        """
+        # 한 번에 capacity보다 많이 요구하면 영원히 기다리게 되므로 상한 적용
+        tokens = min(tokens, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """토큰을 얻을 때까지 대기 (동기)"""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        """토큰을 얻을 때까지 대기 (비동기, 이벤트 루프를 막지 않음)"""
+        while True:
+            wait = self._reserve(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+def _close_at_exit(client):
+    """연결 풀을 가진 클라이언트를 종료 시 닫도록 등록"""
+    close = getattr(client, "close", None)
+    if callable(close):
+        atexit.register(close)
+    return client
+
+
+@lru_cache(maxsize=None)
+def _get_encoder(model: Optional[str]):
+    """
+    토큰 인코더 (모델별 1회 로드, 모르는 모델은 cl100k_base로 근사)
+
+    Returns:
+        tiktoken Encoding 또는 None (tiktoken 미설치)
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model or "")
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    텍스트를 토큰 수 기준으로 자르기
+
+    한글은 글자당 UTF-8 3바이트, 대략 1토큰 이상이라 글자 수로 자르면 토큰 수가 크게
+    늘어남. tiktoken이 없으면 UTF-8 바이트 예산(토큰당 4바이트)으로 근사
+
+    Args:
+        text: 원문
+        max_tokens: 최대 토큰 수
+        model: 인코더 선택용 모델 이름
+
+    Returns:
+        잘린 텍스트
+    """
+    encoder = _get_encoder(model)
+    if encoder is None:
+        data = text.encode('utf-8')
+        limit = max_tokens * 4
+        if len(data) <= limit:
+            return text
+        return data[:limit].decode('utf-8', errors='ignore')
+
+    # 아주 긴 입력의 인코딩 비용을 줄이기 위해 넉넉하게 먼저 자름
+    tokens = encoder.encode(text[:max_tokens * 16], disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text[:max_tokens * 16]
+    return encoder.decode(tokens[:max_tokens])
+
+
+@lru_cache(maxsize=8)
+def _number_categories(categories: tuple) -> str:
+    """
+    프롬프트용 번호 붙은 카테고리 목록 (같은 목록은 한 번만 만듦)
+
+    모델은 카테고리 이름 대신 번호만 답하므로 입력/출력 토큰이 줄고 검증도 간단해짐
+    """
+    return "\n".join(f"{i}) {c}" for i, c in enumerate(categories, 1))
+
+
+def _resolve_category(result: Any, available_categories: List[str]) -> Any:
+    """
+    응답의 카테고리 번호("id")를 카테고리 이름으로 변환
+
+    번호가 범위를 벗어나면 이름으로 답한 경우 그 이름을, 그것도 목록에 없으면
+    첫 번째 카테고리를 사용
+
+    Args:
+        result: 제공자가 반환한 분류 결과
+        available_categories: 프롬프트에 넣은 카테고리 목록 (번호 순서)
+
+    Returns:
+        "category"가 채워진 결과 (딕셔너리가 아니면 그대로)
+    """
+    if not isinstance(result, dict) or "id" not in result:
+        return result
+
+    cat_id = result.pop("id")
+    try:
+        index = int(cat_id) - 1
+    except (TypeError, ValueError):
+        index = -1
+
+    if 0 <= index < len(available_categories):
+        result["category"] = available_categories[index]
+    elif result.get("category") not in available_categories:
+        result["category"] = available_categories[0] if available_categories else "기타"
+    return result
 
 
 class LLMProvider(ABC):
     """LLM 제공자 추상 클래스"""
+
+    # 단일 파일 분류 프롬프트 (%s 순서: 파일명, 내용 미리보기, 카테고리 목록)
+    PROMPT_TEMPLATE = """다음 파일을 분류해주세요.
+
+파일명: %s
+내용 미리보기:
+%s
+
+사용 가능한 카테고리:
+%s
+
+JSON 형식으로 응답해주세요:
+{
+    "id": 가장 적합한 카테고리의 번호,
+    "confidence": 0.0-1.0 사이의 확신도,
+    "reasoning": "분류 이유 (한 문장)"
+}"""
+
+    # 프롬프트에 넣을 내용 미리보기 최대 토큰 수
+    PREVIEW_TOKENS = 300
+
+    def _build_prompt(self, filename: str, content_preview: str,
+                      available_categories: List[str]) -> str:
+        """분류 요청 프롬프트 (고정 부분은 PROMPT_TEMPLATE 재사용)"""
+        return self.PROMPT_TEMPLATE % (
+            filename,
+            _truncate_tokens(content_preview, self.PREVIEW_TOKENS, getattr(self, "model", None)),
+            _number_categories(tuple(available_categories)),
+        )
     
     @abstractmethod
     def classify_file(self, filename: str, content_preview: str, 
@@ -47,6 +414,152 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def classify_file_async(self, filename: str, content_preview: str,
+                                  available_categories: List[str]) -> Dict[str, Any]:
+        """
+        파일 분류 (비동기)
+
+        비동기 클라이언트가 없는 제공자는 동기 호출을 스레드에서 실행하여
+        여러 파일의 네트워크 대기를 겹침
+
+        Args/Returns: classify_file과 동일
+        """
+        return await asyncio.to_thread(
+            self.classify_file, filename, content_preview, available_categories
+        )
+
+    # 한 번의 요청으로 여러 파일을 분류하는 classify_files_batch 구현 여부
+    supports_batch = False
+
+    # 배치 한 번에 넣을 최대 파일 수
+    MAX_BATCH_FILES = 20
+
+    @staticmethod
+    def _make_batch_prompt(files: List[Dict], available_categories: List[str]) -> str:
+        """여러 파일 분류 요청 프롬프트 (최대 MAX_BATCH_FILES개)"""
+        file_list = "\n\n".join([
+            f"[파일 {i+1}]\n파일명: {f['filename']}\n내용: {_truncate_tokens(f['content_preview'], 150)}"
+            for i, f in enumerate(files[:LLMProvider.MAX_BATCH_FILES])
+        ])
+
+        return f"""다음 파일들을 분류해주세요.
+
+{file_list}
+
+사용 가능한 카테고리:
+{_number_categories(tuple(available_categories))}
+
+각 파일에 대해 파일 순서대로 JSON 배열로 응답해주세요 (id는 카테고리 번호):
+[{{"file": 파일 번호, "id": 카테고리 번호, "confidence": 0.0-1.0, "reasoning": "이유"}}, ...]"""
+
+    @staticmethod
+    def _parse_json_array(response_text: str) -> List[Dict[str, Any]]:
+        """응답에서 첫 JSON 배열만 파싱"""
+        return _extract_first_json(response_text, '[')
+
+    @staticmethod
+    def _batch_fallback(files: List[Dict], available_categories: List[str],
+                        error: Exception) -> List[Dict[str, Any]]:
+        """배치 실패 시 파일별 기본 결과"""
+        return [dict(_fallback_result(available_categories, f"배치 처리 실패: {str(error)}"),
+                     filename=f["filename"]) for f in files]
+
+    def classify_files_batch(self, files: List[Dict],
+                             available_categories: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 파일 분류 (기본 구현은 파일별로 classify_file 호출)
+
+        Args:
+            files: [{"filename": "...", "content_preview": "..."}] 리스트
+            available_categories: 사용 가능한 카테고리 목록
+
+        Returns:
+            files와 같은 순서의 분류 결과 리스트
+        """
+        return [
+            dict(self.classify_file(f["filename"], f["content_preview"], available_categories),
+                 filename=f["filename"])
+            for f in files
+        ]
+
+    # 재시도 경고를 남길 로거 (LLMClassifier가 설정, FileOrganizerLogger 또는 logging.Logger)
+    logger = None
+
+    # 요청 수 / 토큰 수 제한 (LLMClassifier가 LLMConfig.rpm/tpm에 따라 설정)
+    rpm_bucket: Optional[TokenBucket] = None
+    tpm_bucket: Optional[TokenBucket] = None
+
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """프롬프트 토큰 수 추정 (문자 4개당 1토큰)"""
+        return len(prompt) // 4 + 1
+
+    def _throttle(self, prompt: str):
+        """요청 전 속도 제한 대기 (동기)"""
+        if self.rpm_bucket is not None:
+            self.rpm_bucket.acquire(1)
+        if self.tpm_bucket is not None:
+            self.tpm_bucket.acquire(self._estimate_tokens(prompt))
+
+    async def _throttle_async(self, prompt: str):
+        """요청 전 속도 제한 대기 (비동기)"""
+        if self.rpm_bucket is not None:
+            await self.rpm_bucket.acquire_async(1)
+        if self.tpm_bucket is not None:
+            await self.tpm_bucket.acquire_async(self._estimate_tokens(prompt))
+
+    def _retry_delay(self, attempt: int, exc: BaseException) -> Optional[float]:
+        """
+        다음 재시도까지 대기 시간
+
+        Args:
+            attempt: 지금까지 실패한 횟수 - 1
+            exc: 발생한 예외
+
+        Returns:
+            대기 초 또는 None (재시도하지 않음)
+        """
+        if attempt >= self.config.max_retries or not _is_transient(exc):
+            return None
+
+        delay = _retry_after(exc)
+        if delay is None:
+            delay = self.config.retry_base_delay * (2 ** attempt) + random.random()
+        delay = min(delay, self.config.retry_max_delay)
+
+        if self.logger is not None:
+            self.logger.warning(
+                f"LLM 요청 재시도 {attempt + 1}/{self.config.max_retries} "
+                f"({delay:.1f}초 후): {type(exc).__name__}: {exc}"
+            )
+        return delay
+
+    def _with_retry(self, fn, *args, **kwargs):
+        """일시적 오류는 지수 백오프로 재시도하며 fn 호출"""
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def _with_retry_async(self, fn, *args, **kwargs):
+        """_with_retry의 비동기 버전 (fn은 코루틴 함수)"""
+        attempt = 0
+        while True:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
 
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude 제공자"""
@@ -55,35 +568,34 @@ class ClaudeProvider(LLMProvider):
         self.config = config
         self.api_key = config.api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = config.model or "claude-3-5-sonnet-20241022"
-        
+        # 동기 클라이언트 (첫 호출 때 만들고 이후 같은 연결 풀 재사용)
+        self._client = None
+        # (이벤트 루프, 비동기 클라이언트) - 클라이언트의 연결 풀은 만든 루프에 묶임
+        self._async_client = None
+
+    PROMPT_TEMPLATE = LLMProvider.PROMPT_TEMPLATE + """
+
+파일의 내용, 이름, 확장자를 종합적으로 고려하여 가장 적합한 카테고리를 선택하세요."""
+
+    def _get_client(self):
+        """동기 클라이언트 (최초 1회 생성)"""
+        if self._client is None:
+            import anthropic
+            self._client = _close_at_exit(anthropic.Anthropic(api_key=self.api_key))
+        return self._client
+
     def classify_file(self, filename: str, content_preview: str,
                      available_categories: List[str]) -> Dict[str, Any]:
         if not self.api_key:
             raise ValueError("Claude API 키가 필요합니다")
             
         try:
-            import anthropic
-            
-            client = anthropic.Anthropic(api_key=self.api_key)
-            
-            prompt = f"""다음 파일을 분류해주세요.
-
-파일명: {filename}
-내용 미리보기:
-{content_preview[:1000]}
-
-사용 가능한 카테고리: {', '.join(available_categories)}
-
-JSON 형식으로 응답해주세요:
-{{
-    "category": "가장 적합한 카테고리",
-    "confidence": 0.0-1.0 사이의 확신도,
-    "reasoning": "분류 이유 (한 문장)"
-}}
-
-파일의 내용, 이름, 확장자를 종합적으로 고려하여 가장 적합한 카테고리를 선택하세요."""
+            client = self._get_client()
+            prompt = self._build_prompt(filename, content_preview, available_categories)
+            self._throttle(prompt)
 
-            message = client.messages.create(
+            message = self._with_retry(
+                client.messages.create,
                 model=self.model,
                 max_tokens=self.config.max_tokens,
                 temperature=self.config.temperature,
@@ -91,7 +603,7 @@ JSON 형식으로 응답해주세요:
             )
             
             response_text = message.content[0].text
-            return json.loads(response_text)
+            return _loads(response_text)
             
         except Exception as e:
             return {
@@ -100,6 +612,61 @@ JSON 형식으로 응답해주세요:
                 "reasoning": f"LLM 오류: {str(e)}"
             }
 
+    async def classify_file_async(self, filename: str, content_preview: str,
+                                  available_categories: List[str]) -> Dict[str, Any]:
+        if not self.api_key:
+            raise ValueError("Claude API 키가 필요합니다")
+
+        try:
+            import anthropic
+
+            loop = asyncio.get_running_loop()
+            if self._async_client is None or self._async_client[0] is not loop:
+                self._async_client = (loop, anthropic.AsyncAnthropic(api_key=self.api_key))
+            client = self._async_client[1]
+
+            prompt = self._build_prompt(filename, content_preview, available_categories)
+            await self._throttle_async(prompt)
+
+            message = await self._with_retry_async(
+                client.messages.create,
+                model=self.model,
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return _loads(message.content[0].text)
+
+        except Exception as e:
+            return _fallback_result(available_categories, f"LLM 오류: {str(e)}")
+
+    supports_batch = True
+
+    def classify_files_batch(self, files: List[Dict],
+                             available_categories: List[str]) -> List[Dict[str, Any]]:
+        """여러 파일을 한 번의 요청으로 분류 (지시문 토큰과 왕복 지연을 파일 수만큼 나눔)"""
+        if not self.api_key:
+            raise ValueError("Claude API 키가 필요합니다")
+
+        files = files[:self.MAX_BATCH_FILES]
+        try:
+            client = self._get_client()
+            prompt = self._make_batch_prompt(files, available_categories)
+            self._throttle(prompt)
+
+            message = self._with_retry(
+                client.messages.create,
+                model=self.model,
+                # 파일 수만큼 응답이 길어짐
+                max_tokens=self.config.max_tokens * max(1, len(files)),
+                temperature=self.config.temperature,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return self._parse_json_array(message.content[0].text)
+
+        except Exception as e:
+            return self._batch_fallback(files, available_categories, e)
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT 제공자"""
@@ -108,33 +675,30 @@ class OpenAIProvider(LLMProvider):
         self.config = config
         self.api_key = config.api_key or os.getenv("OPENAI_API_KEY")
         self.model = config.model or "gpt-4o-mini"
-        
+        # 동기 클라이언트 (첫 호출 때 만들고 이후 같은 연결 풀 재사용)
+        self._client = None
+        # (이벤트 루프, 비동기 클라이언트) - 클라이언트의 연결 풀은 만든 루프에 묶임
+        self._async_client = None
+
+    def _get_client(self):
+        """동기 클라이언트 (최초 1회 생성)"""
+        if self._client is None:
+            import openai
+            self._client = _close_at_exit(openai.OpenAI(api_key=self.api_key))
+        return self._client
+
     def classify_file(self, filename: str, content_preview: str,
                      available_categories: List[str]) -> Dict[str, Any]:
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다")
             
         try:
-            import openai
-            
-            client = openai.OpenAI(api_key=self.api_key)
-            
-            prompt = f"""다음 파일을 분류해주세요.
-
-파일명: {filename}
-내용 미리보기:
-{content_preview[:1000]}
-
-사용 가능한 카테고리: {', '.join(available_categories)}
-
-JSON 형식으로 응답해주세요:
-{{
-    "category": "가장 적합한 카테고리",
-    "confidence": 0.0-1.0 사이의 확신도,
-    "reasoning": "분류 이유 (한 문장)"
-}}"""
+            client = self._get_client()
+            prompt = self._build_prompt(filename, content_preview, available_categories)
+            self._throttle(prompt)
 
-            response = client.chat.completions.create(
+            response = self._with_retry(
+                client.chat.completions.create,
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=self.config.max_tokens,
@@ -142,7 +706,7 @@ JSON 형식으로 응답해주세요:
                 response_format={"type": "json_object"}
             )
             
-            return json.loads(response.choices[0].message.content)
+            return _loads(response.choices[0].message.content)
             
         except Exception as e:
             return {
@@ -151,6 +715,65 @@ JSON 형식으로 응답해주세요:
                 "reasoning": f"LLM 오류: {str(e)}"
             }
 
+    async def classify_file_async(self, filename: str, content_preview: str,
+                                  available_categories: List[str]) -> Dict[str, Any]:
+        if not self.api_key:
+            raise ValueError("OpenAI API 키가 필요합니다")
+
+        try:
+            import openai
+
+            loop = asyncio.get_running_loop()
+            if self._async_client is None or self._async_client[0] is not loop:
+                self._async_client = (loop, openai.AsyncOpenAI(api_key=self.api_key))
+            client = self._async_client[1]
+
+            prompt = self._build_prompt(filename, content_preview, available_categories)
+            await self._throttle_async(prompt)
+
+            response = await self._with_retry_async(
+                client.chat.completions.create,
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=self.config.max_tokens,
+                temperature=self.config.temperature,
+                response_format={"type": "json_object"}
+            )
+            return _loads(response.choices[0].message.content)
+
+        except Exception as e:
+            return _fallback_result(available_categories, f"LLM 오류: {str(e)}")
+
+    supports_batch = True
+
+    def classify_files_batch(self, files: List[Dict],
+                             available_categories: List[str]) -> List[Dict[str, Any]]:
+        """여러 파일을 한 번의 요청으로 분류 (지시문 토큰과 왕복 지연을 파일 수만큼 나눔)"""
+        if not self.api_key:
+            raise ValueError("OpenAI API 키가 필요합니다")
+
+        files = files[:self.MAX_BATCH_FILES]
+        try:
+            client = self._get_client()
+            # json_object 모드는 최상위가 객체여야 하므로 배열을 "results"로 감쌈
+            prompt = (self._make_batch_prompt(files, available_categories)
+                      + '\n\n배열은 {"results": [...]} 형태의 JSON 객체로 감싸주세요.')
+            self._throttle(prompt)
+
+            response = self._with_retry(
+                client.chat.completions.create,
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=self.config.max_tokens * max(1, len(files)),
+                temperature=self.config.temperature,
+                response_format={"type": "json_object"}
+            )
+            data = _loads(response.choices[0].message.content)
+            return data["results"] if isinstance(data, dict) else data
+
+        except Exception as e:
+            return self._batch_fallback(files, available_categories, e)
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini 제공자"""
@@ -159,34 +782,30 @@ class GeminiProvider(LLMProvider):
         self.config = config
         self.api_key = config.api_key or os.getenv("GOOGLE_API_KEY")
         self.model = config.model or "gemini-1.5-flash"
-        
+        # GenerativeModel (첫 호출 때 만들고 재사용)
+        self._model = None
+
+    def _get_model(self):
+        """GenerativeModel (최초 1회 설정/생성)"""
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel(self.model)
+        return self._model
+
     def classify_file(self, filename: str, content_preview: str,
                      available_categories: List[str]) -> Dict[str, Any]:
         if not self.api_key:
             raise ValueError("Gemini API 키가 필요합니다")
             
         try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=self.api_key)
-            model = genai.GenerativeModel(self.model)
-            
-            prompt = f"""다음 파일을 분류해주세요.
+            model = self._get_model()
 
-파일명: {filename}
-내용 미리보기:
-{content_preview[:1000]}
-
-사용 가능한 카테고리: {', '.join(available_categories)}
+            prompt = self._build_prompt(filename, content_preview, available_categories)
 
-JSON 형식으로 응답해주세요:
-{{
-    "category": "가장 적합한 카테고리",
-    "confidence": 0.0-1.0 사이의 확신도,
-    "reasoning": "분류 이유 (한 문장)"
-}}"""
-
-            response = model.generate_content(
+            self._throttle(prompt)
+            response = self._with_retry(
+                model.generate_content,
                 prompt,
                 generation_config={
                     "temperature": self.config.temperature,
@@ -194,7 +813,7 @@ JSON 형식으로 응답해주세요:
                 }
             )
             
-            return json.loads(response.text)
+            return _loads(response.text)
             
         except Exception as e:
             return {
@@ -226,45 +845,149 @@ class GeminiCLIProvider(LLMProvider):
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
-    def classify_file(self, filename: str, content_preview: str,
-                     available_categories: List[str]) -> Dict[str, Any]:
-        import subprocess
-        import tempfile
-
-        prompt = f"""다음 파일을 분류해주세요.
+    PROMPT_TEMPLATE = """다음 파일을 분류해주세요.
 
-파일명: {filename}
+파일명: %s
 내용 미리보기:
-{content_preview[:2000]}
+%s
 
-사용 가능한 카테고리: {', '.join(available_categories)}
+사용 가능한 카테고리:
+%s
 
-반드시 아래 JSON 형식으로만 응답해주세요 (다른 텍스트 없이):
-{{"category": "가장 적합한 카테고리", "confidence": 0.0-1.0, "reasoning": "분류 이유"}}"""
+반드시 아래 JSON 형식으로만 응답해주세요 (다른 텍스트 없이, id는 카테고리 번호):
+{"id": 1, "confidence": 0.0-1.0, "reasoning": "분류 이유"}"""
 
-        try:
-            # gemini CLI 호출
-            result = subprocess.run(
+    PREVIEW_TOKENS = 600
+
+    @staticmethod
+    def _parse_json_object(response_text: str) -> Dict[str, Any]:
+        """CLI 출력에서 첫 JSON 객체만 파싱"""
+        return _extract_first_json(response_text)
+
+    def _run_cli(self, prompt: str, timeout: float) -> str:
+        """
+        gemini CLI 실행
+
+        Returns:
+            표준 출력 (앞뒤 공백 제거)
+
+        Raises:
+            CLIError: 비정상 종료 (일시적 오류로 보이면 재시도)
+            subprocess.TimeoutExpired: 시간 초과
+        """
+        result = subprocess.run(
+            ["gemini", "-m", self.model, prompt],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            encoding='utf-8'
+        )
+        if result.returncode != 0:
+            raise CLIError(result.returncode, "gemini", result.stdout, result.stderr)
+        return result.stdout.strip()
+
+    def _stream_cli_object(self, prompt: str, timeout: float) -> Dict[str, Any]:
+        """
+        gemini CLI 출력을 줄 단위로 읽다가 JSON 객체가 완성되면 프로세스를 끝내고 반환
+
+        Raises:
+            CLIError: JSON 없이 비정상 종료 (일시적 오류로 보이면 재시도)
+            subprocess.TimeoutExpired: 시간 초과
+        """
+        # stderr는 파일로 받아 stdout을 읽는 동안 파이프가 차서 멈추지 않도록 함
+        with tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(
                 ["gemini", "-m", self.model, prompt],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=err,
                 text=True,
-                timeout=60,
-                encoding='utf-8'
+                encoding='utf-8',
+                bufsize=1
             )
+            timed_out = threading.Event()
 
-            if result.returncode != 0:
-                raise Exception(f"Gemini CLI 오류: {result.stderr}")
+            def on_timeout():
+                timed_out.set()
+                proc.kill()
 
-            response_text = result.stdout.strip()
+            timer = threading.Timer(timeout, on_timeout)
+            timer.start()
+            try:
+                parts = []
+                for line in proc.stdout:
+                    parts.append(line)
+                    if '}' in line:
+                        result = _decode_first_object("".join(parts))
+                        if result is not None:
+                            return result
+
+                proc.wait()
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired("gemini", timeout)
+                output = "".join(parts)
+                if proc.returncode != 0:
+                    err.seek(0)
+                    raise CLIError(proc.returncode, "gemini", output,
+                                   err.read().decode('utf-8', errors='replace'))
+                return self._parse_json_object(output.strip())
+            finally:
+                timer.cancel()
+                if proc.poll() is None:
+                    # 응답을 얻었으면 나머지 생성은 중단
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+    async def _stream_cli_object_async(self, prompt: str, timeout: float) -> Dict[str, Any]:
+        """_stream_cli_object의 비동기 버전"""
+        proc = await asyncio.create_subprocess_exec(
+            "gemini", "-m", self.model, prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+        async def read_until_object():
+            parts = []
+            while True:
+                line = await proc.stdout.readline()
+                if not line:
+                    return None, "".join(parts)
+                parts.append(line.decode('utf-8', errors='replace'))
+                if b'}' in line:
+                    result = _decode_first_object("".join(parts))
+                    if result is not None:
+                        return result, None
 
-            # JSON 추출 (응답에서 JSON 부분만 파싱)
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                raise Exception("JSON 응답을 찾을 수 없음")
+        try:
+            try:
+                result, output = await asyncio.wait_for(read_until_object(), timeout=timeout)
+            except asyncio.TimeoutError:
+                raise subprocess.TimeoutExpired("gemini", timeout)
+            if result is not None:
+                return result
+
+            await proc.wait()
+            if proc.returncode != 0:
+                stderr = await stderr_task
+                raise CLIError(proc.returncode, "gemini", output,
+                               stderr.decode('utf-8', errors='replace'))
+            return self._parse_json_object(output.strip())
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_task.cancel()
+
+    def classify_file(self, filename: str, content_preview: str,
+                     available_categories: List[str]) -> Dict[str, Any]:
+        prompt = self._build_prompt(filename, content_preview, available_categories)
+
+        try:
+            # gemini CLI 호출
+            self._throttle(prompt)
+            # 출력에서 JSON 객체가 닫히는 즉시 반환
+            return self._with_retry(self._stream_cli_object, prompt, 60)
 
         except subprocess.TimeoutExpired:
             return {
@@ -279,8 +1002,24 @@ class GeminiCLIProvider(LLMProvider):
                 "reasoning": f"Gemini CLI 오류: {str(e)}"
             }
 
+    async def classify_file_async(self, filename: str, content_preview: str,
+                                  available_categories: List[str]) -> Dict[str, Any]:
+        """CLI 프로세스를 비동기로 실행하여 여러 파일을 동시에 분류"""
+        prompt = self._build_prompt(filename, content_preview, available_categories)
+
+        try:
+            await self._throttle_async(prompt)
+            return await self._with_retry_async(self._stream_cli_object_async, prompt, 60)
+
+        except subprocess.TimeoutExpired:
+            return _fallback_result(available_categories, "Gemini CLI 타임아웃")
+        except Exception as e:
+            return _fallback_result(available_categories, f"Gemini CLI 오류: {str(e)}")
+
+    supports_batch = True
+
     def classify_files_batch(self, files: List[Dict],
-                            available_categories: List[str]) -> List[Dict[str, Any]]:
+                             available_categories: List[str]) -> List[Dict[str, Any]]:
         """
         여러 파일을 한 번에 분류 (배치 처리)
 
@@ -291,70 +1030,114 @@ class GeminiCLIProvider(LLMProvider):
         Returns:
             분류 결과 리스트
         """
-        import subprocess
-
-        # 배치 프롬프트 생성
-        file_list = "\n\n".join([
-            f"[파일 {i+1}]\n파일명: {f['filename']}\n내용: {f['content_preview'][:500]}"
-            for i, f in enumerate(files[:20])  # 최대 20개
-        ])
-
-        prompt = f"""다음 파일들을 분류해주세요.
-
-{file_list}
-
-사용 가능한 카테고리: {', '.join(available_categories)}
-
-각 파일에 대해 JSON 배열로 응답해주세요:
-[{{"filename": "파일명", "category": "카테고리", "confidence": 0.0-1.0, "reasoning": "이유"}}, ...]"""
+        prompt = self._make_batch_prompt(files, available_categories)
 
         try:
-            result = subprocess.run(
-                ["gemini", "-m", self.model, prompt],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                encoding='utf-8'
-            )
-
-            if result.returncode != 0:
-                raise Exception(f"Gemini CLI 오류: {result.stderr}")
-
-            response_text = result.stdout.strip()
+            self._throttle(prompt)
+            response_text = self._with_retry(self._run_cli, prompt, 120)
 
             # JSON 배열 추출
-            json_start = response_text.find('[')
-            json_end = response_text.rfind(']') + 1
-            if json_start >= 0 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                return json.loads(json_str)
-            else:
-                raise Exception("JSON 배열을 찾을 수 없음")
+            return self._parse_json_array(response_text)
 
         except Exception as e:
             # 실패 시 개별 파일 기본값 반환
-            return [{
-                "filename": f["filename"],
-                "category": available_categories[0] if available_categories else "기타",
-                "confidence": 0.1,
-                "reasoning": f"배치 처리 실패: {str(e)}"
-            } for f in files]
+            return self._batch_fallback(files, available_categories, e)
 
 
 class OllamaProvider(LLMProvider):
-    """Ollama 로컬 LLM 제공자"""
+    """
+    Ollama 로컬 LLM 제공자
+
+    비동기 분류(classify_files_async)는 요청을 동시에 보내지만, Ollama 서버는
+    OLLAMA_NUM_PARALLEL(모델당 동시 처리 요청 수) 만큼만 병렬로 생성하고 나머지는
+    대기열에 둠. 동시 요청 수를 늘릴 때는 서버의 OLLAMA_NUM_PARALLEL도 함께 올릴 것
+    """
+
+    PROMPT_TEMPLATE = LLMProvider.PROMPT_TEMPLATE.replace(
+        "JSON 형식으로 응답해주세요", "JSON 형식으로만 응답해주세요")
 
     def __init__(self, config: LLMConfig):
         self.config = config
         self.base_url = config.base_url or "http://localhost:11434"
         self.model = config.model or "llama3.2"
+
+    # 모든 인스턴스와 정적 메서드가 함께 쓰는 keep-alive 세션 (첫 요청 때 생성)
+    _session = None
+    _session_lock = threading.Lock()
+
+    @classmethod
+    def _get_session(cls):
+        """
+        공유 requests 세션 (최초 1회 생성)
+
+        연결 풀은 동시 분류 요청 수만큼 유지하고, 연결 실패와 GET 요청의
+        429/502/503은 어댑터에서 재시도 (생성 POST의 상태 코드 재시도는 _with_retry가 담당)
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=50,
+                        max_retries=Retry(total=3, backoff_factor=0.5,
+                                          status_forcelist=[429, 502, 503],
+                                          raise_on_status=False)
+                    )
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    cls._session = _close_at_exit(session)
+        return cls._session
     
+    def _generate(self, url: str, **kwargs):
+        """
+        생성 요청 (200이 아니면 HTTPError, 429/503 등은 재시도 대상)
+
+        Returns:
+            requests.Response
+        """
+        response = self._get_session().post(url, **kwargs)
+        if response.status_code != 200:
+            import requests
+            raise requests.HTTPError(f"Ollama API 오류: {response.status_code}", response=response)
+        return response
+
+    @staticmethod
+    def _read_streamed_object(response) -> Dict[str, Any]:
+        """
+        스트리밍 응답 조각을 모으다가 JSON 객체가 완성되면 연결을 닫고 반환
+        (연결을 닫으면 Ollama는 남은 생성을 중단)
+
+        Args:
+            response: stream=True로 받은 requests.Response
+        """
+        try:
+            parts = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _loads(line)
+                piece = chunk.get("response", "")
+                parts.append(piece)
+                if '}' in piece:
+                    result = _decode_first_object("".join(parts))
+                    if result is not None:
+                        return result
+                if chunk.get("done"):
+                    break
+            return _loads("".join(parts))
+        finally:
+            response.close()
+
     @staticmethod
     def list_models(base_url: str = "http://localhost:11434") -> List[str]:
         """사용 가능한 Ollama 모델 목록"""
         try:
-            import requests
-            response = requests.get(f"{base_url}/api/tags", timeout=5)
+            response = OllamaProvider._get_session().get(f"{base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 return [model["name"] for model in data.get("models", [])]
@@ -366,8 +1149,7 @@ class OllamaProvider(LLMProvider):
     def pull_model(model_name: str, base_url: str = "http://localhost:11434") -> bool:
         """모델 다운로드"""
         try:
-            import requests
-            response = requests.post(
+            response = OllamaProvider._get_session().post(
                 f"{base_url}/api/pull",
                 json={"name": model_name},
                 timeout=300  # 5분
@@ -379,29 +1161,17 @@ class OllamaProvider(LLMProvider):
     def classify_file(self, filename: str, content_preview: str,
                      available_categories: List[str]) -> Dict[str, Any]:
         try:
-            import requests
-            
-            prompt = f"""다음 파일을 분류해주세요.
+            prompt = self._build_prompt(filename, content_preview, available_categories)
 
-파일명: {filename}
-내용 미리보기:
-{content_preview[:1000]}
-
-사용 가능한 카테고리: {', '.join(available_categories)}
-
-JSON 형식으로만 응답해주세요:
-{{
-    "category": "가장 적합한 카테고리",
-    "confidence": 0.0-1.0 사이의 확신도,
-    "reasoning": "분류 이유 (한 문장)"
-}}"""
-
-            response = requests.post(
+            self._throttle(prompt)
+            response = self._with_retry(
+                self._generate,
                 f"{self.base_url}/api/generate",
+                stream=True,
                 json={
                     "model": self.model,
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
                     "options": {
                         "temperature": self.config.temperature,
                         "num_predict": self.config.max_tokens,
@@ -410,11 +1180,7 @@ JSON 형식으로만 응답해주세요:
                 timeout=30
             )
             
-            if response.status_code == 200:
-                result = response.json()
-                return json.loads(result["response"])
-            else:
-                raise Exception(f"Ollama API 오류: {response.status_code}")
+            return self._read_streamed_object(response)
                 
         except Exception as e:
             return {
@@ -435,7 +1201,13 @@ class LLMClassifier:
         "ollama": OllamaProvider,
     }
     
-    def __init__(self, config: LLMConfig):
+    def __init__(self, config: LLMConfig, logger=None, log_dir: Optional[Path] = None):
+        """
+        Args:
+            config: LLM 설정
+            logger: 재시도 경고 등을 남길 로거 (None이면 기록하지 않음)
+            log_dir: 캐시 파일을 둘 로그 폴더 (cache_path와 둘 다 None이면 메모리 캐시만 사용)
+        """
         self.config = config
         self.provider: Optional[LLMProvider] = None
         
@@ -443,13 +1215,83 @@ class LLMClassifier:
             try:
                 provider_class = self.PROVIDERS[config.provider]
                 self.provider = provider_class(config)
+                self.provider.logger = logger
+                if config.rpm > 0:
+                    self.provider.rpm_bucket = TokenBucket(config.rpm)
+                if config.tpm > 0:
+                    self.provider.tpm_bucket = TokenBucket(config.tpm)
             except Exception as e:
                 print(f"LLM 제공자 초기화 실패 ({config.provider}): {e}")
                 self.provider = None
+
+        self.cache: Optional[ClassificationCache] = None
+        if self.provider is not None and config.use_cache:
+            cache_path = config.cache_path
+            if cache_path is None and log_dir is not None:
+                cache_path = Path(log_dir) / CACHE_FILENAME
+            self.cache = ClassificationCache(cache_path, ttl_sec=config.cache_ttl_sec)
+
+        rules = DEFAULT_EXTENSION_RULES if config.extension_rules is None else config.extension_rules
+        self._ext_rules: Dict[str, Tuple[str, ...]] = {
+            ext.lower(): (cats,) if isinstance(cats, str) else tuple(cats)
+            for ext, cats in rules.items()
+        }
+
+        # 처리 경로별 파일 수 (rule: 확장자 규칙, cache: 캐시, llm: LLM 요청)
+        self._stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, kind: str, n: int = 1):
+        """처리 경로별 파일 수 누적"""
+        with self._stats_lock:
+            self._stats[kind] += n
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        처리 경로별 통계
+
+        Returns:
+            {"rule": n, "cache": n, "llm": n, "rule_ratio": 0.0-1.0}
+        """
+        with self._stats_lock:
+            stats = {kind: self._stats[kind] for kind in ("rule", "cache", "llm")}
+        total = sum(stats.values())
+        stats["rule_ratio"] = stats["rule"] / total if total else 0.0
+        return stats
+
+    def _classify_by_rule(self, filename: str,
+                          available_categories: List[str]) -> Optional[Dict[str, Any]]:
+        """확장자 규칙으로 분류 (규칙이 없거나 후보가 사용 가능한 카테고리에 없으면 None)"""
+        candidates = self._ext_rules.get(os.path.splitext(filename)[1].lower())
+        if not candidates:
+            return None
+        for category in candidates:
+            if category in available_categories:
+                return {"category": category, "confidence": 0.99, "reasoning": "확장자 규칙"}
+        return None
+
+    def _cache_key(self, filename: str, content_preview: str,
+                   available_categories: List[str]) -> Optional[str]:
+        """캐시 키 (캐시 미사용 시 None)"""
+        if self.cache is None:
+            return None
+        model = f"{self.config.provider}:{getattr(self.provider, 'model', self.config.model)}"
+        return ClassificationCache.make_key(model, filename, content_preview, available_categories)
+
+    def _store(self, key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """분류 결과를 캐시에 저장 (실패 시의 기본값 결과는 저장하지 않음)"""
+        if key is not None and isinstance(result, dict) and result.get("confidence", 0) > 0.1:
+            self.cache.put(key, result)
+        return result
     
     def is_available(self) -> bool:
         """LLM 사용 가능 여부"""
         return self.provider is not None
+
+    def close(self):
+        """분류 결과 캐시 파일 닫기"""
+        if self.cache is not None:
+            self.cache.close()
     
     def classify_file(self, filename: str, content_preview: str,
                      available_categories: List[str]) -> Dict[str, Any]:
@@ -471,8 +1313,24 @@ class LLMClassifier:
                 "reasoning": "LLM 사용 불가"
             }
         
+        by_rule = self._classify_by_rule(filename, available_categories)
+        if by_rule is not None:
+            self._count("rule")
+            return by_rule
+
+        key = self._cache_key(filename, content_preview, available_categories)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count("cache")
+                return cached
+
+        self._count("llm")
+
         try:
-            return self.provider.classify_file(filename, content_preview, available_categories)
+            return self._store(key, _resolve_category(self.provider.classify_file(
+                filename, content_preview, available_categories
+            ), available_categories))
         except Exception as e:
             return {
                 "category": available_categories[0] if available_categories else "기타",
@@ -480,6 +1338,185 @@ class LLMClassifier:
                 "reasoning": f"분류 실패: {str(e)}"
             }
 
+    async def classify_file_async(self, filename: str, content_preview: str,
+                                  available_categories: List[str]) -> Dict[str, Any]:
+        """
+        파일 분류 (비동기, classify_file과 같은 결과 형식)
+
+        Args:
+            filename: 파일명
+            content_preview: 파일 내용 미리보기
+            available_categories: 사용 가능한 카테고리 목록
+
+        Returns:
+            분류 결과 딕셔너리
+        """
+        if not self.provider:
+            return {
+                "category": "기타",
+                "confidence": 0.0,
+                "reasoning": "LLM 사용 불가"
+            }
+
+        by_rule = self._classify_by_rule(filename, available_categories)
+        if by_rule is not None:
+            self._count("rule")
+            return by_rule
+
+        key = self._cache_key(filename, content_preview, available_categories)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count("cache")
+                return cached
+
+        self._count("llm")
+
+        try:
+            return self._store(key, _resolve_category(await self.provider.classify_file_async(
+                filename, content_preview, available_categories
+            ), available_categories))
+        except Exception as e:
+            return _fallback_result(available_categories, f"분류 실패: {str(e)}", confidence=0.0)
+
+    async def classify_files_async(self, items: List[Dict], available_categories: List[str],
+                                   max_concurrent: int = 10) -> List[Any]:
+        """
+        여러 파일을 동시에 분류 (최대 max_concurrent개 요청을 겹쳐서 실행)
+
+        Args:
+            items: [{"filename": "...", "content_preview": "..."}] 리스트
+            available_categories: 사용 가능한 카테고리 목록
+            max_concurrent: 동시에 진행할 최대 요청 수
+
+        Returns:
+            items와 같은 순서의 분류 결과 리스트 (처리 중 예외가 나면 해당 자리에 예외 객체)
+        """
+        sem = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def classify_one(filename: str, content_preview: str):
+            async with sem:
+                return await self.classify_file_async(
+                    filename, content_preview, available_categories
+                )
+
+        # 파일명과 내용이 같은 항목은 한 번만 요청 (동시에 보내면 캐시로도 걸러지지 않음)
+        unique = list(dict.fromkeys((item["filename"], item["content_preview"]) for item in items))
+        results = await asyncio.gather(*(classify_one(*u) for u in unique),
+                                       return_exceptions=True)
+        by_item = dict(zip(unique, results))
+        return [by_item[(item["filename"], item["content_preview"])] for item in items]
+
+    def classify_files(self, items: List[Dict], available_categories: List[str],
+                       batch_size: int = LLMProvider.MAX_BATCH_FILES,
+                       max_concurrent: int = 10) -> List[Dict[str, Any]]:
+        """
+        여러 파일 분류
+
+        제공자가 배치를 지원하면 batch_size개씩 한 요청으로, 아니면 파일별 요청을
+        동시에 보냄. 확장자 규칙에 맞거나 캐시에 있는 파일은 요청하지 않음
+
+        Args:
+            items: [{"filename": "...", "content_preview": "..."}] 리스트
+            available_categories: 사용 가능한 카테고리 목록
+            batch_size: 배치 요청당 파일 수
+            max_concurrent: 파일별 요청 시 동시 요청 수
+
+        Returns:
+            items와 같은 순서의 분류 결과 리스트
+        """
+        if not self.provider or not self.provider.supports_batch:
+            return self.classify_files_concurrent(items, available_categories, max_concurrent)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        keys = [self._cache_key(item["filename"], item["content_preview"], available_categories)
+                for item in items]
+
+        pending = []
+        for i, key in enumerate(keys):
+            by_rule = self._classify_by_rule(items[i]["filename"], available_categories)
+            if by_rule is not None:
+                self._count("rule")
+                results[i] = by_rule
+                continue
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                self._count("cache")
+                results[i] = cached
+            else:
+                pending.append(i)
+        self._count("llm", len(pending))
+
+        batch_size = max(1, min(batch_size, LLMProvider.MAX_BATCH_FILES))
+        for start in range(0, len(pending), batch_size):
+            indices = pending[start:start + batch_size]
+            chunk = [items[i] for i in indices]
+            try:
+                batch = self.provider.classify_files_batch(chunk, available_categories)
+            except Exception as e:
+                batch = LLMProvider._batch_fallback(chunk, available_categories, e)
+
+            for n, i in enumerate(indices):
+                result = batch[n] if n < len(batch) and isinstance(batch[n], dict) else None
+                if result is None:
+                    result = _fallback_result(available_categories, "배치 응답에 결과 없음")
+                results[i] = self._store(keys[i], _resolve_category(result, available_categories))
+
+        return results
+
+    def classify_files_concurrent(self, items: List[Dict], available_categories: List[str],
+                                  max_concurrent: int = 10) -> List[Dict[str, Any]]:
+        """
+        classify_files_async의 동기 래퍼 (이벤트 루프 밖에서 호출)
+
+        Args:
+            items: [{"filename": "...", "content_preview": "..."}] 리스트
+            available_categories: 사용 가능한 카테고리 목록
+            max_concurrent: 동시에 진행할 최대 요청 수
+
+        Returns:
+            items와 같은 순서의 분류 결과 리스트 (예외는 기본 결과로 대체)
+        """
+        results = asyncio.run(
+            self.classify_files_async(items, available_categories, max_concurrent)
+        )
+        return [
+            _fallback_result(available_categories, f"분류 실패: {r}", confidence=0.0)
+            if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
+
+    def classify_files_parallel(self, items: List[Dict], available_categories: List[str],
+                                max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        여러 파일을 스레드 풀에서 파일별로 분류
+
+        비동기 SDK가 없는 제공자(Gemini CLI 프로세스, Ollama HTTP 등)는 대기 중에
+        GIL을 놓으므로 스레드만으로도 요청 지연을 겹칠 수 있음.
+        rpm/tpm 설정 시 요청 속도는 토큰 버킷이 계속 제한함
+
+        Args:
+            items: [{"filename": "...", "content_preview": "..."}] 리스트
+            available_categories: 사용 가능한 카테고리 목록
+            max_workers: 최대 동시 요청 수 (32 이하로 제한)
+
+        Returns:
+            items와 같은 순서의 분류 결과 리스트
+        """
+        # 파일명과 내용이 같은 항목은 한 번만 요청
+        unique = list(dict.fromkeys((item["filename"], item["content_preview"]) for item in items))
+        if not unique:
+            return []
+
+        workers = max(1, min(max_workers, 32, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda u: self.classify_file(u[0], u[1], available_categories), unique
+            )
+            by_item = dict(zip(unique, results))
+        return [by_item[(item["filename"], item["content_preview"])] for item in items]
+
 
 def create_llm_classifier(
     provider: str = "none",
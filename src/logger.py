@@ -2,30 +2,130 @@
 로깅 모듈: 파일 정리 작업의 상세 로깅
 """
 
+import gzip
 import logging
+import logging.handlers
 import json
+import queue
+import time
+from collections import Counter, deque
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """한 줄 JSON 직렬화 (orjson 사용)"""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj: Any) -> bytes:
+        """한 줄 JSON 직렬화"""
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+
+
+if msgspec is not None:
+    class LogEntry(msgspec.Struct):
+        """로그 항목 (msgspec: dict 변환 없이 바로 JSON 인코딩)"""
+        timestamp: str
+        level: str
+        action: str
+        source: Optional[str] = None
+        destination: Optional[str] = None
+        status: str = ""
+        details: Optional[Dict] = None
+        error: Optional[str] = None
+
+    # Path 등 JSON 기본 타입이 아닌 값은 문자열로 기록
+    _encode_entry = msgspec.json.Encoder(enc_hook=str).encode
+else:
+    @dataclass(slots=True)
+    class LogEntry:
+        """로그 항목"""
+        timestamp: str
+        level: str
+        action: str
+        source: Optional[str] = None
+        destination: Optional[str] = None
+        status: str = ""
+        details: Optional[Dict] = None
+        error: Optional[str] = None
+
+    def _encode_entry(entry: "LogEntry") -> bytes:
+        """로그 항목 JSON 인코딩"""
+        return _dumps(asdict(entry))
+
+
+class _GzipRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    gzip으로 압축해 기록하고, 압축 전 크기가 maxBytes를 넘으면 새 파일로 교체하는 핸들러
+
+    백업 파일 이름: organizer_X.log.gz -> organizer_X.1.log.gz, organizer_X.2.log.gz ...
+    """
 
-@dataclass
-class LogEntry:
-    """로그 항목"""
-    timestamp: str
-    level: str
-    action: str
-    source: Optional[str] = None
-    destination: Optional[str] = None
-    status: str = ""
-    details: Optional[Dict] = None
-    error: Optional[str] = None
+    # 압축 스트림을 동기화(Z_SYNC_FLUSH)하는 최소 간격 (초)
+    SYNC_INTERVAL_SEC = 5.0
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: str = 'utf-8', compresslevel: int = 1):
+        # 압축 수준 1: CPU 비용은 거의 없고 크기는 대부분 줄어듦
+        self.compresslevel = compresslevel
+        self._written = 0
+        self._last_sync = time.monotonic()
+        super().__init__(filename, mode='a', maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding, delay=True)
+        self.namer = self._backup_name
+
+    @staticmethod
+    def _backup_name(default_name: str) -> str:
+        """"X.log.gz.1" 형식의 기본 백업 이름을 "X.1.log.gz"로 변경"""
+        base, _, index = default_name.rpartition('.')
+        if base.endswith('.log.gz') and index.isdigit():
+            return f"{base[:-len('.log.gz')]}.{index}.log.gz"
+        return default_name
+
+    def _open(self):
+        self._written = 0
+        return gzip.open(self.baseFilename, 'at', encoding=self.encoding,
+                         compresslevel=self.compresslevel)
+
+    def format(self, record) -> str:
+        msg = super().format(record)
+        # 압축 스트림은 끝으로 seek할 수 없으므로 기록한 바이트 수를 직접 셈
+        self._written += len(msg.encode(self.encoding or 'utf-8')) + 1
+        return msg
+
+    def flush(self):
+        # 기록마다 동기화하면 압축률이 크게 떨어지므로 일정 간격으로만 동기화
+        # (교체/종료 시에는 스트림을 닫으면서 남은 데이터가 모두 기록됨)
+        now = time.monotonic()
+        if now - self._last_sync >= self.SYNC_INTERVAL_SEC:
+            self._last_sync = now
+            super().flush()
+
+    def shouldRollover(self, record) -> bool:
+        return 0 < self.maxBytes <= self._written
 
 
 class FileOrganizerLogger:
     """파일 정리 전용 로거"""
 
+    # 텍스트 로그 교체 기준 (압축 전 크기)과 보관할 이전 파일 수
+    TEXT_LOG_MAX_BYTES = 64 * 1024 * 1024
+    TEXT_LOG_BACKUP_COUNT = 5
+
+    # 메모리에 유지할 최근 로그 항목 수
+    MAX_RECENT_ENTRIES = 10_000
+
     def __init__(self, log_dir: Path, session_name: str = None):
         """
         Args:
@@ -39,14 +139,20 @@ class FileOrganizerLogger:
         self.session_name = session_name or self.session_id
 
         # 로그 파일 경로
-        self.log_file = self.log_dir / f"organizer_{self.session_id}.log"
-        self.json_log_file = self.log_dir / f"organizer_{self.session_id}.json"
+        self.log_file = self.log_dir / f"organizer_{self.session_id}.log.gz"
+        self.json_log_file = self.log_dir / f"organizer_{self.session_id}.jsonl"
 
         # Python 표준 로거 설정
         self._setup_logger()
 
-        # JSON 로그 저장용 리스트
-        self.entries: List[LogEntry] = []
+        # 최근 로그 항목 (전체 기록은 JSON 로그 파일에 있으므로 개수 제한)
+        self.entries: Deque[LogEntry] = deque(maxlen=self.MAX_RECENT_ENTRIES)
+
+        # 항목 생성 시점에 갱신하는 통계
+        self._total_entries = 0
+        self._by_level: Counter = Counter()
+        self._by_action: Counter = Counter()
+        self._errors: List[Dict] = []
 
         # 세션 시작 기록
         self.info("세션 시작", details={"session_id": self.session_id})
@@ -59,8 +165,12 @@ class FileOrganizerLogger:
         # 기존 핸들러 제거
         self.logger.handlers = []
 
-        # 파일 핸들러
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        # 파일 핸들러 (gzip 압축, 크기 기준 교체)
+        file_handler = _GzipRotatingFileHandler(
+            self.log_file,
+            maxBytes=self.TEXT_LOG_MAX_BYTES,
+            backupCount=self.TEXT_LOG_BACKUP_COUNT
+        )
         file_handler.setLevel(logging.DEBUG)
 
         # 콘솔 핸들러
@@ -77,8 +187,39 @@ class FileOrganizerLogger:
         file_handler.setFormatter(file_format)
         console_handler.setFormatter(console_format)
 
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # 로거에는 큐 핸들러만 달고 실제 파일/콘솔 출력은 백그라운드 스레드에서 처리
+        # (호출 스레드는 큐에 넣기만 하므로 디스크/터미널 쓰기를 기다리지 않음)
+        self._handlers = [file_handler, console_handler]
+        self._log_q = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(self._log_q))
+        self._listener = logging.handlers.QueueListener(
+            self._log_q, *self._handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+        # JSON 로그 (한 줄에 항목 하나씩 추가, 중단되어도 기록된 부분은 남음)
+        # 첫 줄은 세션 정보, 마지막 줄(save_json_log)은 종료 정보
+        self._json_fh = open(self.json_log_file, 'ab', buffering=1 << 16)
+        self._write_json_line({
+            "session_id": self.session_id,
+            "session_name": self.session_name,
+            "start_time": datetime.now().isoformat(),
+        })
+
+    def _write_json_line(self, record: Union[LogEntry, Dict]):
+        """
+        JSON 로그에 한 줄 추가 (실패해도 호출한 작업은 계속 진행)
+
+        Args:
+            record: 로그 항목 또는 세션 정보 딕셔너리
+        """
+        if self._json_fh is None:
+            return
+        try:
+            data = _encode_entry(record) if isinstance(record, LogEntry) else _dumps(record)
+            self._json_fh.write(data + b"\n")
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"JSON 로그 기록 실패: {e}")
 
     def _create_entry(self, level: str, action: str, **kwargs) -> LogEntry:
         """로그 항목 생성"""
@@ -89,6 +230,19 @@ class FileOrganizerLogger:
             **kwargs
         )
         self.entries.append(entry)
+
+        self._total_entries += 1
+        self._by_level[level] += 1
+        self._by_action[action] += 1
+        if level == "ERROR":
+            self._errors.append({
+                "timestamp": entry.timestamp,
+                "action": action,
+                "source": entry.source,
+                "error": entry.error,
+            })
+
+        self._write_json_line(entry)
         return entry
 
     def _format_message(self, action: str, source: str = None,
@@ -158,6 +312,45 @@ class FileOrganizerLogger:
             }
         )
 
+    def log_duplicate_batch(self, groups: List[Dict]):
+        """
+        중복 파일 그룹 일괄 로그 (그룹마다 항목을 쓰는 대신 JSON 로그에 한 줄로 기록)
+
+        Args:
+            groups: {"group_id", "files", "hash"} 딕셔너리 리스트
+        """
+        if not groups:
+            return
+        file_count = sum(len(g["files"]) for g in groups)
+        self._create_entry("INFO", "중복 파일 그룹 발견", details={
+            "group_count": len(groups),
+            "file_count": file_count,
+            "groups": groups,
+        })
+        # 텍스트 로그에는 요약만 기록
+        self.logger.info(self._format_message(
+            "중복 파일 그룹 발견", details={"groups": len(groups), "files": file_count}
+        ))
+
+    def log_version_batch(self, groups: List[Dict]):
+        """
+        버전 그룹 일괄 로그
+
+        Args:
+            groups: {"base_name", "files"} 딕셔너리 리스트
+        """
+        if not groups:
+            return
+        file_count = sum(len(g["files"]) for g in groups)
+        self._create_entry("INFO", "버전 그룹 발견", details={
+            "group_count": len(groups),
+            "file_count": file_count,
+            "groups": groups,
+        })
+        self.logger.info(self._format_message(
+            "버전 그룹 발견", details={"groups": len(groups), "files": file_count}
+        ))
+
     def log_classification(self, file_path: str, category: str,
                            confidence: float, keywords: List[str] = None):
         """파일 분류 로그"""
@@ -207,34 +400,37 @@ class FileOrganizerLogger:
         self.info("=" * 50)
 
     def save_json_log(self):
-        """JSON 형식 로그 저장"""
+        """JSON 로그 파일 닫기 (항목은 생성 시점에 이미 기록됨)"""
+        if self._json_fh is None:
+            return
+        self._write_json_line({
+            "session_id": self.session_id,
+            "session_name": self.session_name,
+            "end_time": datetime.now().isoformat(),
+            "total_entries": self._total_entries,
+        })
         try:
-            log_data = {
-                "session_id": self.session_id,
-                "session_name": self.session_name,
-                "start_time": self.entries[0].timestamp if self.entries else None,
-                "end_time": datetime.now().isoformat(),
-                "total_entries": len(self.entries),
-                "entries": [asdict(entry) for entry in self.entries],
-            }
-
-            with open(self.json_log_file, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, ensure_ascii=False, indent=2)
-
+            self._json_fh.close()
             self.logger.info(f"JSON 로그 저장: {self.json_log_file}")
-
         except Exception as e:
             self.logger.error(f"JSON 로그 저장 실패: {e}")
+        finally:
+            self._json_fh = None
 
     def finalize(self):
         """세션 종료 및 로그 저장"""
-        self.info("세션 종료", details={"total_entries": len(self.entries)})
+        self.info("세션 종료", details={"total_entries": self._total_entries})
         self.save_json_log()
 
+        # 큐에 남은 기록을 모두 출력한 뒤 리스너 종료
+        self._listener.stop()
+
         # 핸들러 정리
         for handler in self.logger.handlers[:]:
             handler.close()
             self.logger.removeHandler(handler)
+        for handler in self._handlers:
+            handler.close()
 
     def get_log_paths(self) -> Dict[str, Path]:
         """로그 파일 경로 반환"""
@@ -244,35 +440,14 @@ class FileOrganizerLogger:
         }
 
     def get_statistics(self) -> Dict:
-        """로그 통계 반환"""
-        stats = {
-            "total_entries": len(self.entries),
-            "by_level": {},
-            "by_action": {},
-            "errors": [],
+        """로그 통계 반환 (항목 생성 시 누적한 값)"""
+        return {
+            "total_entries": self._total_entries,
+            "by_level": dict(self._by_level),
+            "by_action": dict(self._by_action),
+            "errors": list(self._errors),
         }
 
-        for entry in self.entries:
-            # 레벨별 카운트
-            level = entry.level
-            stats["by_level"][level] = stats["by_level"].get(level, 0) + 1
-
-            # 액션별 카운트
-            action = entry.action
-            stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-
-            # 오류 수집
-            if entry.level == "ERROR":
-                stats["errors"].append({
-                    "timestamp": entry.timestamp,
-                    "action": entry.action,
-                    "source": entry.source,
-                    "error": entry.error,
-                })
-
-        return stats
-
-
 def create_session_logger(base_dir: Path = None, session_name: str = None) -> FileOrganizerLogger:
     """
     새 세션 로거 생성 헬퍼 함수
@@ -2,8 +2,10 @@
 메인 애플리케이션 모듈: 모든 기능을 통합한 FileOrganizer 클래스
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from dataclasses import dataclass
 
 from .config import OrganizerConfig
@@ -34,7 +36,7 @@ class FileOrganizer:
         # 모듈 초기화
         self.duplicate_finder = DuplicateFinder(self.config)
         self.version_manager = VersionManager(self.config)
-        self.classifier = FileClassifier(self.config, llm_config=llm_config)
+        self.classifier = FileClassifier(self.config, llm_config=llm_config, logger=self.logger)
         self.file_mover = FileMover(self.config, self.logger)
 
         # 스캔된 파일 캐시
@@ -43,6 +45,10 @@ class FileOrganizer:
         self._version_groups: List[VersionGroup] = []
         self._classifications: List[ClassificationResult] = []
 
+        # 요약 캐시 (get_statistics 반복 호출 시 재계산 방지, 결과 목록이 바뀌면 무효화)
+        self._duplicates_summary: Optional[Dict] = None
+        self._classifications_summary: Optional[Dict] = None
+
     def scan_directories(self, directories: List[Path] = None) -> List[FileInfo]:
         """
         지정된 디렉토리들의 파일 스캔
@@ -56,52 +62,71 @@ class FileOrganizer:
         if directories is None:
             directories = self.config.target_directories
 
-        self._scanned_files = []
-
         self.logger.info(f"디렉토리 스캔 시작", details={"count": len(directories)})
 
-        for directory in directories:
-            if directory.exists() and directory.is_dir():
-                files = self.duplicate_finder.scan_directory(directory)
-                self._scanned_files.extend(files)
-                self.logger.info(f"디렉토리 스캔 완료",
-                                details={"path": str(directory), "files": len(files)})
+        self._scanned_files = list(self.iter_scanned_files(directories))
 
         self.logger.info(f"전체 스캔 완료", details={"total_files": len(self._scanned_files)})
 
         return self._scanned_files
 
-    def find_duplicates(self, parallel: bool = False) -> List[DuplicateGroup]:
+    def iter_scanned_files(self, directories: List[Path] = None) -> Iterator[FileInfo]:
+        """
+        스캔되는 파일을 하나씩 차례로 반환 (전체 목록을 _scanned_files에 보관하지 않음)
+
+        Args:
+            directories: 스캔할 디렉토리 리스트 (None이면 config에서 가져옴)
+
+        Yields:
+            FileInfo
+        """
+        if directories is None:
+            directories = self.config.target_directories
+
+        for directory in directories:
+            if directory.exists() and directory.is_dir():
+                count = 0
+                for file_info in self.duplicate_finder.iter_scan_directory(directory):
+                    count += 1
+                    yield file_info
+                self.logger.info(f"디렉토리 스캔 완료",
+                                details={"path": str(directory), "files": count})
+
+    def find_duplicates(self, parallel: bool = False,
+                        should_stop: Callable[[], bool] = None) -> List[DuplicateGroup]:
         """
         중복 파일 탐지
 
         Args:
-            parallel: 병렬 처리 여부
+            parallel: 병렬 처리 여부 (해시 계산을 프로세스 풀로 분산)
+            should_stop: 중단 여부를 반환하는 함수 (병렬 처리 시에만 사용)
 
         Returns:
             DuplicateGroup 리스트
         """
         self.logger.info("중복 파일 탐지 시작")
 
+        # scan_directories()로 이미 스캔했다면 그 결과를 재사용
+        scanned = self._scanned_files or None
+
         if parallel:
             self._duplicates = self.duplicate_finder.find_duplicates_parallel(
-                self.config.target_directories
+                self.config.target_directories, should_stop=should_stop, files=scanned
             )
         else:
             self._duplicates = self.duplicate_finder.find_duplicates(
-                self.config.target_directories
+                self.config.target_directories, files=scanned
             )
 
         summary = self.duplicate_finder.get_summary(self._duplicates)
+        self._duplicates_summary = summary
         self.logger.info("중복 파일 탐지 완료", details=summary)
 
-        # 각 그룹 로깅
-        for i, group in enumerate(self._duplicates):
-            self.logger.log_duplicate_found(
-                group_id=i,
-                files=[str(f.path) for f in group.files],
-                hash_value=group.hash
-            )
+        # 전체 그룹을 한 번에 로깅
+        self.logger.log_duplicate_batch([
+            {"group_id": i, "files": [str(f.path) for f in group.files], "hash": group.hash}
+            for i, group in enumerate(self._duplicates)
+        ])
 
         return self._duplicates
 
@@ -122,40 +147,59 @@ class FileOrganizer:
 
         self.logger.info("버전 그룹 탐지 시작", details={"files": len(files)})
 
-        self._version_groups = self.version_manager.find_version_groups(files)
+        return self._set_version_groups(self.version_manager.find_version_groups(files))
 
-        self.logger.info("버전 그룹 탐지 완료", details={"groups": len(self._version_groups)})
+    def _set_version_groups(self, groups: List[VersionGroup]) -> List[VersionGroup]:
+        """버전 그룹 탐지 결과 저장 및 로깅 (로거는 호출한 스레드에서만 사용)"""
+        self._version_groups = groups
 
-        for group in self._version_groups:
-            self.logger.log_version_group_found(
-                group.base_name,
-                [str(f.path) for f in group.files]
-            )
+        self.logger.info("버전 그룹 탐지 완료", details={"groups": len(groups)})
+
+        self.logger.log_version_batch([
+            {"base_name": group.base_name, "files": [str(f.path) for f in group.files]}
+            for group in groups
+        ])
 
-        return self._version_groups
+        return groups
 
     def classify_files(self, files: List[FileInfo] = None,
                        by_content: bool = True,
                        by_date: bool = True,
                        exclude_duplicates: bool = True,
-                       keep_strategy: str = "newest") -> List[ClassificationResult]:
+                       keep_strategy: str = "newest",
+                       batch_size: int = 1000) -> List[ClassificationResult]:
         """
         파일 분류
 
         Args:
-            files: 분류할 파일 리스트 (None이면 스캔된 파일 사용)
+            files: 분류할 파일 리스트 (None이면 스캔된 파일 사용, 스캔 전이면 스캔하면서 batch_size개씩 분류)
             by_content: 내용 기반 분류 여부
             by_date: 날짜 기반 분류 여부
             exclude_duplicates: 중복 파일 제외 여부 (보존 대상만 포함)
             keep_strategy: 중복 보존 전략 ('newest', 'oldest', 'largest', 'smallest')
+            batch_size: 스캔하면서 분류할 때 한 번에 분류할 파일 수
 
         Returns:
             ClassificationResult 리스트
         """
+        streaming = False
         if files is None:
-            if not self._scanned_files:
-                self.scan_directories()
-            files = self._scanned_files
+            if self._scanned_files:
+                files = self._scanned_files
+            elif self.classifier.llm_classifier is not None:
+                # LLM 파일 수 제한은 전체 파일 수 기준이므로 목록을 만들어 한 번에 분류
+                files = self.scan_directories()
+            else:
+                # 스캔하면서 분류하되, 다른 단계와 통계에서 쓰도록 스캔 결과는 모아 둠
+                scanned: List[FileInfo] = []
+
+                def collect(it: Iterator[FileInfo]) -> Iterator[FileInfo]:
+                    for file_info in it:
+                        scanned.append(file_info)
+                        yield file_info
+
+                files = collect(self.iter_scanned_files())
+                streaming = True
 
         # 중복 파일 제외 처리: 중복 그룹에서 제외 대상 파일만 분류에서 제외
         if exclude_duplicates and self._duplicates:
@@ -163,38 +207,51 @@ class FileOrganizer:
             exclude_paths = set()
 
             for group in self._duplicates:
-                files_sorted = group.files
-                if keep_strategy == "newest":
-                    files_sorted = sorted(group.files, key=lambda f: f.modified_time, reverse=True)
-                elif keep_strategy == "oldest":
-                    files_sorted = sorted(group.files, key=lambda f: f.modified_time)
-                elif keep_strategy == "largest":
-                    files_sorted = sorted(group.files, key=lambda f: f.size, reverse=True)
-                elif keep_strategy == "smallest":
-                    files_sorted = sorted(group.files, key=lambda f: f.size)
-
-                # 첫 번째 파일은 보존, 나머지는 제외
-                if files_sorted:
-                    for f in files_sorted[1:]:
-                        exclude_paths.add(f.path)
+                # 보존 파일 하나만 남기고 나머지는 제외 (plan_duplicate_cleanup과 같은 선택)
+                # Path 해시는 매번 경로 요소 튜플을 해싱하므로 해시가 캐시되는 str로 비교
+                keep = group.get_keep_file(keep_strategy)
+                exclude_paths.update(str(f.path) for f in group.files if f is not keep)
 
             # 실제 분류 대상 필터링 (제외 대상만 걸러냄)
-            files = [f for f in files if f.path not in exclude_paths]
-
-        self.logger.info("파일 분류 시작",
-                        details={"files": len(files), "by_content": by_content, "by_date": by_date})
-
-        self._classifications = self.classifier.classify_files(files, by_content, by_date)
+            files = (f for f in files if str(f.path) not in exclude_paths)
+            if not streaming:
+                files = list(files)
+
+        if streaming:
+            self.logger.info("파일 분류 시작 (스캔하면서 분류)",
+                            details={"batch_size": batch_size, "by_content": by_content, "by_date": by_date})
+            self._classifications = []
+            for batch in self._iter_batches(files, batch_size):
+                self._classifications.extend(self.classifier.classify_files(batch, by_content, by_date))
+            # 스캔이 끝까지 진행된 경우에만 스캔 결과로 저장
+            self._scanned_files = scanned
+            self.logger.info("전체 스캔 완료", details={"total_files": len(scanned)})
+        else:
+            self.logger.info("파일 분류 시작",
+                            details={"files": len(files), "by_content": by_content, "by_date": by_date})
+            self._classifications = self.classifier.classify_files(files, by_content, by_date)
+        self._classifications_summary = None
 
         # 대상 경로 생성
         for result in self._classifications:
             self.classifier.generate_target_path(result, self.config.organized_archive)
 
         summary = self.classifier.get_classification_summary(self._classifications)
+        self._classifications_summary = summary
         self.logger.info("파일 분류 완료", details={"categories": len(summary["by_category"])})
 
         return self._classifications
 
+    @staticmethod
+    def _iter_batches(files: Iterable[FileInfo], batch_size: int) -> Iterator[List[FileInfo]]:
+        """이터러블을 batch_size개씩 나눈 리스트로 반환"""
+        it = iter(files)
+        while True:
+            batch = list(islice(it, max(1, batch_size)))
+            if not batch:
+                return
+            yield batch
+
     def plan_cleanup(self, duplicates: bool = True,
                      versions: bool = False,
                      organize: bool = False,
@@ -225,11 +282,11 @@ class FileOrganizer:
             keep_paths = []
             archive_paths = []
             for group in self._version_groups:
-                analysis = self.version_manager.analyze_version_group(group)
-                if analysis['recommended_keep']:
-                    keep_paths.append(Path(analysis['recommended_keep']))
-                for path in analysis['recommended_archive']:
-                    archive_paths.append(Path(path))
+                # 계획에는 추천 결과만 필요하므로 파일별 상세 분석은 생략
+                keep, archive = self.version_manager.recommend_keep(group)
+                if keep is not None:
+                    keep_paths.append(keep.path)
+                archive_paths.extend(f.path for f in archive)
 
             ops = self.file_mover.plan_version_cleanup(keep_paths, archive_paths)
             operations.extend(ops)
@@ -272,6 +329,10 @@ class FileOrganizer:
         """드라이 런 보고서 반환"""
         return self.file_mover.get_dry_run_report()
 
+    def iter_dry_run_report(self) -> Iterator[str]:
+        """드라이 런 보고서를 항목별로 반환"""
+        return self.file_mover.iter_dry_run_report()
+
     def get_execution_report(self, results: Dict) -> str:
         """실행 결과 보고서 반환"""
         return self.file_mover.get_execution_report(results)
@@ -289,17 +350,25 @@ class FileOrganizer:
         }
 
         if self._duplicates:
-            dup_summary = self.duplicate_finder.get_summary(self._duplicates)
-            stats["duplicates"] = dup_summary
+            if self._duplicates_summary is None:
+                self._duplicates_summary = self.duplicate_finder.get_summary(self._duplicates)
+            stats["duplicates"] = self._duplicates_summary
 
         if self._classifications:
-            class_summary = self.classifier.get_classification_summary(self._classifications)
-            stats["classifications"] = class_summary
+            if self._classifications_summary is None:
+                self._classifications_summary = self.classifier.get_classification_summary(
+                    self._classifications
+                )
+            stats["classifications"] = self._classifications_summary
 
         return stats
 
     def finalize(self):
         """세션 종료 및 리소스 정리"""
+        if self.classifier.llm_classifier is not None:
+            self.classifier.llm_classifier.close()
+        self.duplicate_finder.close()
+        self.version_manager.close()
         self.logger.finalize()
 
 
@@ -328,11 +397,27 @@ def quick_scan(directory: Path, find_duplicates: bool = True,
         files = organizer.scan_directories()
         results["scanned_files"] = len(files)
 
-        if find_duplicates:
+        if find_duplicates and find_versions:
+            # 버전 탐지는 스캔 결과만 필요하므로 해시 계산(I/O 대기 중 GIL 해제)과 겹쳐 실행
+            def detect_versions() -> List[VersionGroup]:
+                # 퍼지 해시 캐시(SQLite 연결)는 연 스레드에서만 닫을 수 있으므로 작업 스레드에서 닫음
+                try:
+                    return organizer.version_manager.find_version_groups(files)
+                finally:
+                    organizer.version_manager.close()
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                version_future = executor.submit(detect_versions)
+                duplicates = organizer.find_duplicates()
+                results["duplicates"] = organizer.duplicate_finder.get_summary(duplicates)
+                versions = organizer._set_version_groups(version_future.result())
+            results["version_groups"] = len(versions)
+
+        elif find_duplicates:
             duplicates = organizer.find_duplicates()
             results["duplicates"] = organizer.duplicate_finder.get_summary(duplicates)
 
-        if find_versions:
+        elif find_versions:
             versions = organizer.find_version_groups()
             results["version_groups"] = len(versions)
 
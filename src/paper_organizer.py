@@ -5,7 +5,11 @@
 논문 제목으로 파일명을 변경하는 기능 제공
 """
 
+import mmap
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
@@ -17,6 +21,85 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# 메타데이터 추출용 정규식 (모듈 로드 시 한 번만 컴파일)
+_AUTHOR_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+(?:, [A-Z][a-z]+ [A-Z][a-z]+)*)')
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+_PDF_DATE_RE = re.compile(r'D:(\d{4})')
+
+# 파일명 생성용 정규식
+_NONWORD_RE = re.compile(r'[^\w]')
+_NONWORD_SPACE_RE = re.compile(r'[^\w\s]')
+_SPACE_RE = re.compile(r'\s+')
+
+# 주요 주제 패턴 (앞에 있는 주제가 우선)
+TOPIC_PATTERNS: Dict[str, List[str]] = {
+    "Machine Learning": ['machine learning', 'deep learning', 'neural network', 'ai', 'artificial intelligence'],
+    "Computer Vision": ['computer vision', 'image recognition', 'object detection', 'cv'],
+    "Natural Language Processing": ['nlp', 'natural language', 'text processing', 'language model'],
+    "Quantum Computing": ['quantum', 'qubit', 'quantum computing'],
+    "Database": ['database', 'sql', 'nosql', 'data management'],
+    "Security": ['security', 'cryptography', 'encryption', 'vulnerability'],
+    "Networks": ['network', 'protocol', 'tcp', 'routing'],
+    "Software Engineering": ['software engineering', 'programming', 'development'],
+    "Algorithms": ['algorithm', 'optimization', 'complexity'],
+}
+
+
+def _build_topic_automaton():
+    """모든 주제 패턴을 담은 Aho-Corasick 오토마톤 (pyahocorasick 없으면 None)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (topic, patterns) in enumerate(TOPIC_PATTERNS.items()):
+        for pattern in patterns:
+            # 같은 패턴이 여러 주제에 있으면 앞쪽 주제 유지
+            if pattern not in automaton:
+                automaton.add_word(pattern, (priority, topic))
+    automaton.make_automaton()
+    return automaton
+
+
+_TOPIC_AUTOMATON = _build_topic_automaton()
+
+
+@lru_cache(maxsize=1024)
+def _match_topic(text: str) -> Optional[str]:
+    """
+    소문자 텍스트에 포함된 패턴 중 가장 앞쪽 주제 반환
+
+    오토마톤이 있으면 패턴 수와 무관하게 텍스트를 한 번만 훑음
+
+    Returns:
+        주제 이름 또는 None (매칭 없음)
+    """
+    if _TOPIC_AUTOMATON is None:
+        for topic, patterns in TOPIC_PATTERNS.items():
+            if any(pattern in text for pattern in patterns):
+                return topic
+        return None
+
+    best = None
+    for _, (priority, topic) in _TOPIC_AUTOMATON.iter(text):
+        if best is None or priority < best[0]:
+            best = (priority, topic)
+            if priority == 0:
+                break
+    return best[1] if best else None
+
+
+# 이 개수 미만이면 프로세스 풀 생성 비용이 더 크므로 순차 처리
+_MIN_PDFS_FOR_POOL = 8
+
+# 이보다 큰 PDF는 첫 페이지 텍스트를 추출하지 않음 (문서 정보만 사용)
+_MAX_TEXT_EXTRACT_BYTES = 100 * 1024 * 1024
+
 
 @dataclass
 class PaperMetadata:
@@ -67,55 +150,87 @@ class PaperOrganizer:
             return None
 
         try:
-            reader = PdfReader(str(pdf_path))
-            metadata = reader.metadata
-
-            if not metadata:
-                # 메타데이터 없으면 텍스트에서 추출 시도
-                return self._extract_from_text(pdf_path, reader)
-
-            # 메타데이터에서 정보 추출
-            title = metadata.get('/Title', '').strip()
-            author_str = metadata.get('/Author', '').strip()
-            subject = metadata.get('/Subject', '').strip()
-            keywords_str = metadata.get('/Keywords', '').strip()
-
-            # 저자 파싱
-            authors = self._parse_authors(author_str)
-
-            # 키워드 파싱
-            keywords = self._parse_keywords(keywords_str)
-            if subject:
-                keywords.append(subject)
-
-            # 연도 추출 (제목, 파일명, 생성일에서)
-            year = self._extract_year(title, pdf_path.name)
-            if not year and metadata.get('/CreationDate'):
-                year = self._parse_pdf_date(metadata['/CreationDate'])
-
-            # 제목이 없으면 텍스트에서 추출
-            if not title:
-                text_metadata = self._extract_from_text(pdf_path, reader)
-                if text_metadata and text_metadata.title:
-                    title = text_metadata.title
-
-            paper_meta = PaperMetadata(
-                file_path=pdf_path,
-                title=title if title else None,
-                authors=authors,
-                year=year,
-                keywords=keywords,
-            )
-
-            # 주제 추론 (키워드 기반)
-            paper_meta.topic = self._infer_topic(keywords, title)
-
-            return paper_meta
+            # 경로를 넘기면 PyPDF2가 파일 전체를 메모리로 읽으므로 mmap을 넘겨
+            # xref와 첫 페이지 등 실제로 참조하는 부분만 읽게 함
+            with open(pdf_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                reader = PdfReader(mm)
+                # 너무 큰 PDF는 본문 텍스트 추출 없이 문서 정보만 사용
+                allow_text = len(mm) <= _MAX_TEXT_EXTRACT_BYTES
+                metadata = reader.metadata
+
+                if not metadata:
+                    # 메타데이터 없으면 텍스트에서 추출 시도
+                    if not allow_text:
+                        return None
+                    return self._extract_from_text(pdf_path, reader)
+
+                # 메타데이터에서 정보 추출
+                title = metadata.get('/Title', '').strip()
+                author_str = metadata.get('/Author', '').strip()
+                subject = metadata.get('/Subject', '').strip()
+                keywords_str = metadata.get('/Keywords', '').strip()
+
+                # 저자 파싱
+                authors = self._parse_authors(author_str)
+
+                # 키워드 파싱
+                keywords = self._parse_keywords(keywords_str)
+                if subject:
+                    keywords.append(subject)
+
+                # 연도 추출 (제목, 파일명, 생성일에서)
+                year = self._extract_year(title, pdf_path.name)
+                if not year and metadata.get('/CreationDate'):
+                    year = self._parse_pdf_date(metadata['/CreationDate'])
+
+                # 제목이 없으면 텍스트에서 추출
+                if not title and allow_text:
+                    text_metadata = self._extract_from_text(pdf_path, reader)
+                    if text_metadata and text_metadata.title:
+                        title = text_metadata.title
+
+                paper_meta = PaperMetadata(
+                    file_path=pdf_path,
+                    title=title if title else None,
+                    authors=authors,
+                    year=year,
+                    keywords=keywords,
+                )
+
+                # 주제 추론 (키워드 기반)
+                paper_meta.topic = self._infer_topic(keywords, title)
+
+                return paper_meta
 
         except Exception as e:
             print(f"⚠️ PDF 메타데이터 추출 실패 ({pdf_path.name}): {e}")
             return None
 
+    def extract_metadata_batch(self, pdf_paths: List[Path],
+                               max_workers: int = None) -> List[Optional[PaperMetadata]]:
+        """
+        여러 PDF의 메타데이터를 프로세스 풀에서 병렬 추출
+
+        PDF 파싱(압축 해제, 텍스트 배치)은 CPU 작업이라 스레드로는 빨라지지 않음
+
+        Args:
+            pdf_paths: PDF 파일 경로 리스트
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+
+        Returns:
+            pdf_paths와 같은 순서의 PaperMetadata (실패한 항목은 None)
+        """
+        if not PDF_AVAILABLE:
+            return [None] * len(pdf_paths)
+
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pdf_paths))
+        if len(pdf_paths) < _MIN_PDFS_FOR_POOL or max_workers <= 1:
+            return [self.extract_metadata(path) for path in pdf_paths]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.extract_metadata, pdf_paths, chunksize=8))
+
     def _extract_from_text(self, pdf_path: Path, reader: 'PdfReader') -> Optional[PaperMetadata]:
         """
         PDF 텍스트에서 메타데이터 추출 (메타데이터가 없을 때)
@@ -150,8 +265,7 @@ class PaperOrganizer:
                     break
 
             # 저자 추출 (이메일, 대학명 등으로 패턴 인식)
-            author_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+(?:, [A-Z][a-z]+ [A-Z][a-z]+)*)'
-            author_matches = re.findall(author_pattern, first_page_text[:1000])
+            author_matches = _AUTHOR_RE.findall(first_page_text[:1000])
             if author_matches:
                 authors = [m.strip() for m in author_matches[:5]]  # 최대 5명
 
@@ -204,27 +318,37 @@ class PaperOrganizer:
 
         return [k for k in keywords if k]
 
-    def _extract_year(self, *texts: str) -> Optional[int]:
-        """텍스트에서 연도 추출"""
+    def _extract_year(self, *texts: str, max_scan: int = 2048) -> Optional[int]:
+        """
+        텍스트에서 연도 추출 (앞쪽 텍스트부터 확인, 텍스트 안에서는 가장 최근 연도)
+
+        Args:
+            texts: 제목, 첫 페이지 텍스트, 파일명 등
+            max_scan: 텍스트마다 앞에서부터 확인할 최대 글자 수
+                (첫 페이지 전체 대신 머리 부분의 발행 연도만 확인)
+
+        Returns:
+            연도 또는 None
+        """
+        max_year = datetime.now().year + 1
         for text in texts:
             if not text:
                 continue
             # 4자리 연도 패턴 (1900-2099)
-            matches = re.findall(r'\b(19\d{2}|20\d{2})\b', text)
-            if matches:
+            valid_years = [
+                year for year in map(int, _YEAR_RE.findall(text, 0, max_scan))
+                if year <= max_year
+            ]
+            if valid_years:
                 # 가장 최근 연도 반환
-                years = [int(y) for y in matches]
-                current_year = datetime.now().year
-                valid_years = [y for y in years if 1900 <= y <= current_year + 1]
-                if valid_years:
-                    return max(valid_years)
+                return max(valid_years)
         return None
 
     def _parse_pdf_date(self, date_str: str) -> Optional[int]:
         """PDF 날짜 형식 파싱 (D:20210101...)"""
         try:
             # D:YYYYMMDDHHmmSS 형식
-            match = re.match(r'D:(\d{4})', date_str)
+            match = _PDF_DATE_RE.match(date_str)
             if match:
                 return int(match.group(1))
         except:
@@ -238,28 +362,15 @@ class PaperOrganizer:
         Returns:
             추론된 주제 (예: "Machine Learning", "Quantum Computing")
         """
-        # 주요 주제 패턴 정의
-        topic_patterns = {
-            "Machine Learning": ['machine learning', 'deep learning', 'neural network', 'ai', 'artificial intelligence'],
-            "Computer Vision": ['computer vision', 'image recognition', 'object detection', 'cv'],
-            "Natural Language Processing": ['nlp', 'natural language', 'text processing', 'language model'],
-            "Quantum Computing": ['quantum', 'qubit', 'quantum computing'],
-            "Database": ['database', 'sql', 'nosql', 'data management'],
-            "Security": ['security', 'cryptography', 'encryption', 'vulnerability'],
-            "Networks": ['network', 'protocol', 'tcp', 'routing'],
-            "Software Engineering": ['software engineering', 'programming', 'development'],
-            "Algorithms": ['algorithm', 'optimization', 'complexity'],
-        }
-
         # 키워드와 제목을 합쳐서 검사
         text = ' '.join(keywords).lower()
         if title:
             text += ' ' + title.lower()
 
         # 매칭되는 주제 찾기
-        for topic, patterns in topic_patterns.items():
-            if any(pattern in text for pattern in patterns):
-                return topic
+        topic = _match_topic(text)
+        if topic is not None:
+            return topic
 
         # 매칭 안 되면 첫 키워드 반환
         if keywords:
@@ -282,7 +393,7 @@ class PaperOrganizer:
             name_parts = metadata.first_author.split()
             last_name = name_parts[-1] if name_parts else metadata.first_author
             # 특수문자 제거
-            last_name = re.sub(r'[^\w]', '', last_name)
+            last_name = _NONWORD_RE.sub('', last_name)
             parts.append(last_name)
 
         # 연도
@@ -293,8 +404,8 @@ class PaperOrganizer:
         if metadata.title:
             title = metadata.title
             # 특수문자 제거 및 공백을 언더스코어로
-            title = re.sub(r'[^\w\s]', '', title)
-            title = re.sub(r'\s+', '_', title)
+            title = _NONWORD_SPACE_RE.sub('', title)
+            title = _SPACE_RE.sub('_', title)
             # 길이 제한
             words = title.split('_')[:5]
             title_part = '_'.join(words)
@@ -311,6 +422,22 @@ class PaperOrganizer:
 
         return filename
 
+    def generate_filenames_batch(self, metas: List[PaperMetadata]) -> List[str]:
+        """
+        여러 논문의 파일명을 한 번에 생성
+
+        정규식은 모듈 로드 시 컴파일되어 있고 파일명 생성은 짧은 문자열 처리라
+        스레드/프로세스로 나누면 작업 분배 비용이 더 큼
+
+        Args:
+            metas: PaperMetadata 리스트
+
+        Returns:
+            metas와 같은 순서의 파일명 리스트
+        """
+        generate = self.generate_paper_filename
+        return [generate(metadata) for metadata in metas]
+
     def classify_by_author(self, metadata: PaperMetadata) -> str:
         """저자별 분류 (첫 저자 성 기준)"""
         if metadata.first_author:
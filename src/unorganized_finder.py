@@ -4,14 +4,27 @@
 폴더 구조 없이 루트에 있는 파일들을 찾아서 재정리
 """
 
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import List, Set, Dict, FrozenSet, Tuple
 from dataclasses import dataclass
 
 from .duplicate_finder import FileInfo
 from .config import OrganizerConfig
 
 
+# 설정에 없는 확장자 그룹 (카테고리 제안용)
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov'})
+_AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac'})
+_ARCHIVE_EXTENSIONS = frozenset({'.zip', '.rar', '.7z', '.tar', '.gz'})
+
+# 확장자 규칙에 맞는 카테고리가 없을 때의 후보
+_FALLBACK_CATEGORIES = ('기타', 'Others', 'Misc')
+
+
 @dataclass
 class UnorganizedFile:
     """미분류 파일 정보"""
@@ -25,6 +38,11 @@ class UnorganizedFinder:
 
     def __init__(self, config: OrganizerConfig):
         self.config = config
+        # 탐색 중 폴더 제외 판정용 (설정이 리스트로 교체돼도 해시 조회가 되도록 검색마다 갱신)
+        self._excluded_dirs: FrozenSet[str] = frozenset(config.excluded_dirs)
+        # 카테고리 제안용 확장자 -> 후보 표 (처음 필요할 때 생성)
+        self._ext_candidates: Dict[str, Tuple[str, ...]] = {}
+        self._ext_candidates_source = None
 
     def find_unorganized_files(
         self,
@@ -48,33 +66,51 @@ class UnorganizedFinder:
         if not search_directory.exists():
             return unorganized
 
-        # 루트 레벨 파일 찾기
-        for item in search_directory.iterdir():
-            if item.is_file():
-                # 제외 패턴 체크
-                if self._should_exclude(item):
+        # 제외 파일 패턴은 config.is_excluded가 하나의 정규식으로 미리 컴파일해 둠
+        self._excluded_dirs = excluded_dirs = frozenset(self.config.excluded_dirs)
+        is_excluded = self.config.is_excluded
+
+        # 루트 레벨 파일 찾기 (DirEntry가 파일 종류를 캐시하므로 판별에 stat 호출 없음)
+        subdirs = []
+        with os.scandir(search_directory) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file() and not is_excluded(entry.name):
+                        unorganized.append(UnorganizedFile(
+                            file_info=self._file_info(entry),
+                            is_root_level=True,
+                            depth_from_root=0
+                        ))
+                except OSError:
                     continue
 
-                file_info = FileInfo(path=item, size=0)
-                unorganized.append(UnorganizedFile(
-                    file_info=file_info,
-                    is_root_level=True,
-                    depth_from_root=0
-                ))
-
         # 하위 폴더 포함 시
         if include_subfolders and max_depth > 1:
-            for item in search_directory.iterdir():
-                if item.is_dir() and not self._should_exclude_dir(item):
-                    sub_files = self._find_files_in_depth(
-                        item,
-                        current_depth=1,
-                        max_depth=max_depth
-                    )
-                    unorganized.extend(sub_files)
+            if self.config.scan_backend == "threaded" and len(subdirs) > 1:
+                # 최상위 하위 폴더별로 스레드에서 탐색 (scandir/stat은 GIL을 해제, map이라 순서 유지)
+                with ThreadPoolExecutor(max_workers=self.config.scan_workers) as executor:
+                    for sub_files in executor.map(
+                        lambda subdir: self._find_files_in_depth(subdir, 1, max_depth), subdirs
+                    ):
+                        unorganized.extend(sub_files)
+            else:
+                for subdir in subdirs:
+                    unorganized.extend(self._find_files_in_depth(subdir, 1, max_depth))
 
         return unorganized
 
+    @staticmethod
+    def _file_info(entry: os.DirEntry) -> FileInfo:
+        """DirEntry에서 FileInfo 생성 (stat 실패 시 FileInfo가 직접 조회)"""
+        try:
+            stat = entry.stat()
+        except OSError:
+            stat = None
+        return FileInfo(path=Path(entry.path), size=stat.st_size if stat else 0, stat_result=stat)
+
     def _find_files_in_depth(
         self,
         directory: Path,
@@ -84,57 +120,53 @@ class UnorganizedFinder:
         """
         지정된 깊이까지 파일 찾기
 
+        재귀 대신 명시적 스택으로 탐색. 한 폴더의 파일을 모두 모은 뒤 하위 폴더를
+        scandir 순서대로 내려가므로, 파일과 하위 폴더 내용을 iterdir 순서로 섞던
+        재귀 구현과는 결과 순서가 다름
+
         Args:
-            directory: 현재 디렉토리
-            current_depth: 현재 깊이
+            directory: 시작 디렉토리
+            current_depth: 시작 디렉토리의 깊이
             max_depth: 최대 깊이
 
         Returns:
             파일 리스트
         """
         files = []
-
-        if current_depth > max_depth:
-            return files
-
-        try:
-            for item in directory.iterdir():
-                if item.is_file():
-                    if not self._should_exclude(item):
-                        file_info = FileInfo(path=item, size=0)
-                        files.append(UnorganizedFile(
-                            file_info=file_info,
-                            is_root_level=False,
-                            depth_from_root=current_depth
-                        ))
-                elif item.is_dir() and not self._should_exclude_dir(item):
-                    # 재귀적으로 탐색
-                    sub_files = self._find_files_in_depth(
-                        item,
-                        current_depth + 1,
-                        max_depth
-                    )
-                    files.extend(sub_files)
-        except (PermissionError, OSError):
-            pass
+        excluded_dirs = self._excluded_dirs
+        is_excluded = self.config.is_excluded
+        file_info = self._file_info
+
+        stack = [(directory, current_depth)]
+        while stack:
+            path, depth = stack.pop()
+            if depth > max_depth:
+                continue
+
+            subdirs = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in excluded_dirs:
+                                    subdirs.append(entry.path)
+                            elif entry.is_file() and not is_excluded(entry.name):
+                                files.append(UnorganizedFile(
+                                    file_info=file_info(entry),
+                                    is_root_level=False,
+                                    depth_from_root=depth
+                                ))
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+
+            # 스택이므로 역순으로 넣어야 scandir 순서대로 방문 (폴더 핸들을 닫은 뒤)
+            stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
 
         return files
 
-    def _should_exclude(self, file_path: Path) -> bool:
-        """파일 제외 여부 확인"""
-        import fnmatch
-
-        # 파일 패턴 체크
-        for pattern in self.config.excluded_patterns:
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return True
-
-        return False
-
-    def _should_exclude_dir(self, dir_path: Path) -> bool:
-        """폴더 제외 여부 확인"""
-        return dir_path.name in self.config.excluded_dirs
-
     def find_existing_categories(
         self,
         organized_dir: Path
@@ -154,14 +186,54 @@ class UnorganizedFinder:
             return categories
 
         try:
-            for item in organized_dir.iterdir():
-                if item.is_dir():
-                    categories[item.name] = item
+            with os.scandir(organized_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        categories[entry.name] = Path(entry.path)
         except (PermissionError, OSError):
             pass
 
         return categories
 
+    def _category_rules(self) -> List[Tuple[FrozenSet[str], Tuple[str, ...]]]:
+        """확장자 집합 -> 후보 카테고리명 목록 (앞쪽 규칙 우선)"""
+        return [
+            (self.config.document_extensions, ('문서', '업무', '업무_문서', 'Documents')),
+            (self.config.image_extensions, ('이미지', '사진', '미디어', 'Images', 'Photos')),
+            (_VIDEO_EXTENSIONS, ('영상', '비디오', 'Videos')),
+            (_AUDIO_EXTENSIONS, ('음악', '오디오', 'Music', 'Audio')),
+            (_ARCHIVE_EXTENSIONS, ('압축파일', 'Archives')),
+        ]
+
+    def _candidates_by_extension(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        확장자 -> 우선순위 순 후보 카테고리명 (확장자가 여러 규칙에 속하면 규칙 순서대로 이어 붙임)
+
+        설정의 확장자 집합이 교체되었을 때만 다시 만듦
+        """
+        source = (self.config.document_extensions, self.config.image_extensions)
+        if self._ext_candidates_source is None or any(
+            a is not b for a, b in zip(source, self._ext_candidates_source)
+        ):
+            table: Dict[str, Tuple[str, ...]] = {}
+            for extensions, candidates in self._category_rules():
+                for ext in extensions:
+                    table[ext] = table.get(ext, ()) + candidates
+            self._ext_candidates = table
+            self._ext_candidates_source = source
+        return self._ext_candidates
+
+    @staticmethod
+    def _pick_category(candidates: Tuple[str, ...], existing_categories: Dict[str, Path]) -> str:
+        """후보 중 이미 있는 첫 카테고리, 없으면 기타 계열, 그것도 없으면 새 카테고리"""
+        for cat in candidates:
+            if cat in existing_categories:
+                return cat
+        for cat in _FALLBACK_CATEGORIES:
+            if cat in existing_categories:
+                return cat
+        return "미분류"
+
     def suggest_category_for_file(
         self,
         file_path: Path,
@@ -177,48 +249,40 @@ class UnorganizedFinder:
         Returns:
             추천 카테고리명
         """
-        # 확장자 기반 매칭
-        ext = file_path.suffix.lower()
-
-        # 문서
-        if ext in self.config.document_extensions:
-            for cat in ['문서', '업무', '업무_문서', 'Documents']:
-                if cat in existing_categories:
-                    return cat
-
-        # 이미지
-        if ext in self.config.image_extensions:
-            for cat in ['이미지', '사진', '미디어', 'Images', 'Photos']:
-                if cat in existing_categories:
-                    return cat
-
-        # 기타 확장자별
-        video_exts = {'.mp4', '.avi', '.mkv', '.mov'}
-        audio_exts = {'.mp3', '.wav', '.flac'}
-        archive_exts = {'.zip', '.rar', '.7z', '.tar', '.gz'}
-
-        if ext in video_exts:
-            for cat in ['영상', '비디오', 'Videos']:
-                if cat in existing_categories:
-                    return cat
-
-        if ext in audio_exts:
-            for cat in ['음악', '오디오', 'Music', 'Audio']:
-                if cat in existing_categories:
-                    return cat
-
-        if ext in archive_exts:
-            for cat in ['압축파일', 'Archives']:
-                if cat in existing_categories:
-                    return cat
-
-        # 매칭 안 되면 기타
-        for cat in ['기타', 'Others', 'Misc']:
-            if cat in existing_categories:
-                return cat
+        # 확장자 기반 매칭 (확장자별 후보 목록을 한 번 조회)
+        candidates = self._candidates_by_extension().get(file_path.suffix.lower(), ())
+        return self._pick_category(candidates, existing_categories)
 
-        # 아무것도 없으면 새 카테고리
-        return "미분류"
+    def classify_files_batch(
+        self,
+        paths: List[Path],
+        existing_categories: Dict[str, Path]
+    ) -> List[str]:
+        """
+        여러 파일의 카테고리를 한 번에 제안 (suggest_category_for_file과 같은 결과)
+
+        카테고리 목록은 모든 파일에 공통이므로 확장자별 결과를 한 번만 계산하고
+        같은 확장자의 파일은 딕셔너리 조회 한 번으로 처리
+
+        Args:
+            paths: 파일 경로 리스트
+            existing_categories: 기존 카테고리 딕셔너리
+
+        Returns:
+            paths와 같은 순서의 추천 카테고리명 리스트
+        """
+        candidates_by_ext = self._candidates_by_extension()
+        resolved: Dict[str, str] = {}
+        results = []
+        for path in paths:
+            ext = path.suffix.lower()
+            cat = resolved.get(ext)
+            if cat is None:
+                cat = resolved[ext] = self._pick_category(
+                    candidates_by_ext.get(ext, ()), existing_categories
+                )
+            results.append(cat)
+        return results
 
     def get_summary(self, unorganized_files: List[UnorganizedFile]) -> Dict:
         """
@@ -230,17 +294,17 @@ class UnorganizedFinder:
         Returns:
             요약 딕셔너리
         """
-        summary = {
+        # 크기와 확장자는 스캔 때 채운 FileInfo 값을 그대로 사용 (stat/Path 연산 없음)
+        # Counter와 sum은 C 루프로 집계
+        file_infos = [unorg.file_info for unorg in unorganized_files]
+        root_level = sum(unorg.is_root_level for unorg in unorganized_files)
+        total_size = sum(map(attrgetter('size'), file_infos))
+        by_extension = dict(Counter(f.suffix_lower or '.none' for f in file_infos))
+
+        return {
             "total_files": len(unorganized_files),
-            "root_level_files": sum(1 for f in unorganized_files if f.is_root_level),
-            "nested_files": sum(1 for f in unorganized_files if not f.is_root_level),
-            "by_extension": {},
-            "total_size": 0,
+            "root_level_files": root_level,
+            "nested_files": len(unorganized_files) - root_level,
+            "by_extension": by_extension,
+            "total_size": total_size,
         }
-
-        for unorg in unorganized_files:
-            ext = unorg.file_info.path.suffix.lower() or '.none'
-            summary["by_extension"][ext] = summary["by_extension"].get(ext, 0) + 1
-            summary["total_size"] += unorg.file_info.size
-
-        return summary
@@ -2,16 +2,23 @@
 파일 버전 관리 모듈: 파일명 유사성 및 메타데이터 기반 버전 그룹화
 """
 
+import mmap
+import os
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
 from difflib import SequenceMatcher
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter, itemgetter
 
 from .config import OrganizerConfig
 from .duplicate_finder import FileInfo
+from .hash_cache import HashCache, DEFAULT_FUZZY_CACHE_PATH
 
 try:
     import ssdeep
@@ -19,6 +26,206 @@ try:
 except ImportError:
     SSDEEP_AVAILABLE = False
 
+# rapidfuzz는 선택적 의존성 (없으면 difflib.SequenceMatcher 사용)
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+
+# 버전 패턴 제거 후 연속 구분자 정리용
+# '_', '-'를 공백으로 바꾼 뒤 str.split()으로 나누면 [_\-\s]+ 치환 + 양끝 정리와 같은 결과
+# (str.split()의 공백 판정은 정규식 \s와 동일)
+_SEPARATORS_TO_SPACE = str.maketrans('_-', '  ')
+
+
+@lru_cache(maxsize=8192)
+def _strip_version_info(filename: str, pattern: re.Pattern) -> str:
+    """
+    파일명에서 버전 정보를 제거한 기본 이름 (파일명별로 캐시)
+
+    버전 그룹 탐지와 그룹 병합의 유사도 비교에서 같은 파일명이 반복해서 들어오므로
+    정규식 치환은 파일명마다 한 번만 수행
+
+    Args:
+        filename: 확장자 제외 파일명
+        pattern: 모든 버전 패턴을 합친 정규식 (캐시 키에 포함)
+
+    Returns:
+        버전 정보가 제거된 기본 파일명
+    """
+    # 모든 버전 패턴을 한 번의 스캔으로 제거
+    base_name = pattern.sub('', filename)
+
+    # 연속된 구분자를 '_' 하나로 합치고 양끝 구분자 제거 (정규식 없이 한 번에 처리)
+    base_name = '_'.join(base_name.translate(_SEPARATORS_TO_SPACE).split())
+
+    return base_name if base_name else filename
+
+
+@lru_cache(maxsize=8192)
+def _base_name_key(filename: str, pattern: re.Pattern) -> str:
+    """유사도 비교용 소문자 기본 이름 (파일명별로 캐시)"""
+    return _strip_version_info(filename, pattern).lower()
+
+
+def _key_similarity(base1: str, base2: str, threshold: float = 0.0) -> float:
+    """
+    _base_name_key로 정리된 두 이름의 유사도 (0.0 ~ 1.0)
+
+    Args:
+        base1: 첫 번째 기본 이름 키
+        base2: 두 번째 기본 이름 키
+        threshold: 이 값에 못 미칠 것이 길이만으로 확실하면 비교 없이 0.0 반환
+
+    Returns:
+        유사도 점수
+    """
+    # 두 지표 모두 2*일치 길이/(길이 합)이므로 2*짧은 길이/(길이 합)을 넘을 수 없음
+    total_len = len(base1) + len(base2)
+    if total_len and 2 * min(len(base1), len(base2)) < threshold * total_len:
+        return 0.0
+
+    # rapidfuzz(C 구현)가 있으면 사용, 없으면 SequenceMatcher로 유사도 계산
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.ratio(base1, base2) / 100.0
+    return SequenceMatcher(None, base1, base2).ratio()
+
+
+# ssdeep은 비교 전에 같은 문자가 4번 이상 반복되면 3번으로 줄이고,
+# 두 서명에 길이 7(롤링 해시 창 크기)인 공통 부분 문자열이 없으면 0점을 반환
+_SSDEEP_RUN_RE = re.compile(r'(.)\1{3,}')
+_SSDEEP_NGRAM = 7
+
+
+def _ssdeep_index_keys(fuzzy_hash: str) -> Set[Tuple]:
+    """
+    ssdeep 서명의 후보 색인 키 ((블록 크기, 7-gram) 집합 + 정규화한 서명 전체)
+
+    블록 크기 b인 서명은 앞부분을 b, 뒷부분을 2b 블록 크기로 기록하므로
+    두 서명이 키를 하나라도 공유해야 ssdeep.compare가 0보다 큰 점수를 줄 수 있음
+    (블록 크기가 같거나 2배 차이일 때만 비교하는 ssdeep 규칙과 같음).
+    7자보다 짧은 서명도 정규화 후 완전히 같으면 100점이므로 서명 전체도 키로 넣음
+
+    Args:
+        fuzzy_hash: "블록크기:서명1:서명2" 형식의 ssdeep 해시
+
+    Returns:
+        색인 키 집합 (형식이 잘못되었으면 빈 집합)
+    """
+    try:
+        block_size, sig1, sig2 = fuzzy_hash.split(':', 2)
+        block_size = int(block_size)
+    except ValueError:
+        return set()
+
+    sig1 = _SSDEEP_RUN_RE.sub(r'\1\1\1', sig1)
+    sig2 = _SSDEEP_RUN_RE.sub(r'\1\1\1', sig2.split(',', 1)[0])
+
+    keys = {(block_size, sig1, sig2)}
+    for size, sig in ((block_size, sig1), (block_size * 2, sig2)):
+        for i in range(len(sig) - _SSDEEP_NGRAM + 1):
+            keys.add((size, sig[i:i + _SSDEEP_NGRAM]))
+    return keys
+
+
+# 이보다 파일이 적으면 스레드 풀 없이 순서대로 퍼지 해시 계산
+_MIN_FILES_FOR_FUZZY_POOL = 8
+
+# 이 크기 이상인 파일은 mmap으로 매핑해 큰 조각 단위로 ssdeep에 전달
+# (hash_from_file은 stdio 버퍼 크기로 잘게 읽어 read 호출이 많음)
+_FUZZY_MMAP_MIN_SIZE = 1024 * 1024
+_FUZZY_CHUNK_SIZE = 1024 * 1024
+
+
+def _ssdeep_hash_file(file_path: Path) -> str:
+    """
+    파일의 ssdeep 해시 계산 (작은 파일은 한 번에 읽고, 큰 파일은 mmap + 스트리밍 API)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        ssdeep 해시 문자열 (hash_from_file과 같은 값)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _FUZZY_MMAP_MIN_SIZE:
+            return ssdeep.hash(f.read())
+
+        hasher = ssdeep.Hash()
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # 32비트 주소 공간 부족, 특수 파일 등은 read로 처리
+            for chunk in iter(lambda: f.read(_FUZZY_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+            return hasher.digest()
+
+        with mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(0, len(mm), _FUZZY_CHUNK_SIZE):
+                hasher.update(mm[offset:offset + _FUZZY_CHUNK_SIZE])
+        return hasher.digest()
+
+
+def _content_identity(file_info: FileInfo) -> Tuple:
+    """
+    내용이 같음이 이미 알려진 파일끼리 같은 값을 갖는 키
+
+    중복 탐지에서 전체 해시가 채워졌으면 그 해시, 아니면 (장치, inode), 둘 다 없으면 경로
+    """
+    if file_info.hash:
+        return ('hash', file_info.hash)
+    if file_info.inode:
+        return ('inode', file_info.device, file_info.inode)
+    return ('path', file_info.path)
+
+
+# 최종본 표시 (파일명 기준)
+_FINAL_STATUS_RE = re.compile(r'(최종|final|완료|완성)', re.IGNORECASE)
+
+# 버전 정보 추출용 (_extract_version_info)
+_NUMERIC_VERSION_RE = re.compile(r'[_\-\s]?v(\d+)', re.IGNORECASE)
+_PAREN_NUMBER_RE = re.compile(r'\((\d+)\)')
+_DATE_VERSION_RE = re.compile(r'(\d{4})[-_]?(\d{2})[-_]?(\d{2})')
+_STATUS_RE = re.compile(
+    r'(?P<final>최종|final|완료|완성)|(?P<draft>초안|draft|임시|temp)|(?P<backup>백업|backup|bak)',
+    re.IGNORECASE
+)
+_STATUS_PRIORITY = ('final', 'draft', 'backup')
+_COPY_RE = re.compile(r'(복사본|copy|사본|\(\d+\))', re.IGNORECASE)
+# 위 패턴 중 하나라도 있는지 한 번에 확인 (없으면 개별 검색 생략)
+# 개별 패턴끼리 겹쳐 일치할 수 있으므로 값 추출은 패턴별 search로 처리
+_ANY_VERSION_INFO_RE = re.compile(
+    '|'.join(f'(?:{regex.pattern})' for regex in (
+        _NUMERIC_VERSION_RE, _PAREN_NUMBER_RE, _DATE_VERSION_RE, _STATUS_RE, _COPY_RE
+    )),
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=8192)
+def _format_mtime(seconds: int) -> str:
+    """
+    수정 시각 표시 문자열 (초 단위로 캐시, 같은 초에 저장된 파일은 strftime 재사용)
+
+    Args:
+        seconds: 유닉스 시각 (초 단위로 내림)
+
+    Returns:
+        'YYYY-MM-DD HH:MM:SS' 형식 문자열
+    """
+    return datetime.fromtimestamp(seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# 정렬/최솟값·최댓값 키 (lambda 대신 C 구현 attrgetter)
+_MODIFIED_TIME = attrgetter('modified_time')
+
 
 @dataclass
 class VersionGroup:
@@ -26,30 +233,41 @@ class VersionGroup:
     base_name: str  # 기준 파일명 (버전 정보 제거)
     files: List[FileInfo] = field(default_factory=list)
     extension: str = ""
+    # VersionManager가 계산한 분석/보존 추천 결과 (파일이 추가되면 비움)
+    analysis: Optional[Dict] = field(default=None, repr=False, compare=False)
+    keep_recommendation: Optional[Tuple[Optional[FileInfo], List[FileInfo]]] = field(
+        default=None, repr=False, compare=False
+    )
+    # 마지막 sort_by_date 방향 (None: 정렬 후 파일이 추가됨)
+    _date_order: Optional[bool] = field(default=None, repr=False, compare=False)
 
     def add_file(self, file_info: FileInfo):
         """파일 추가"""
         self.files.append(file_info)
         if not self.extension and file_info.path.suffix:
             self.extension = file_info.path.suffix
+        self.analysis = None
+        self.keep_recommendation = None
+        self._date_order = None
 
     def sort_by_date(self, newest_first: bool = True):
-        """수정일 기준 정렬"""
-        self.files.sort(key=lambda f: f.modified_time, reverse=newest_first)
+        """수정일 기준 정렬 (이미 같은 방향으로 정렬된 뒤 파일이 추가되지 않았으면 생략)"""
+        if self._date_order is newest_first:
+            return
+        self.files.sort(key=_MODIFIED_TIME, reverse=newest_first)
+        self._date_order = newest_first
 
     def get_latest(self) -> Optional[FileInfo]:
-        """가장 최신 파일 반환"""
+        """가장 최신 파일 반환 (정렬 없이 한 번 순회, 파일 순서는 그대로)"""
         if not self.files:
             return None
-        self.sort_by_date(newest_first=True)
-        return self.files[0]
+        return max(self.files, key=_MODIFIED_TIME)
 
     def get_oldest(self) -> Optional[FileInfo]:
-        """가장 오래된 파일 반환"""
+        """가장 오래된 파일 반환 (정렬 없이 한 번 순회, 파일 순서는 그대로)"""
         if not self.files:
             return None
-        self.sort_by_date(newest_first=False)
-        return self.files[0]
+        return min(self.files, key=_MODIFIED_TIME)
 
     @property
     def count(self) -> int:
@@ -82,9 +300,44 @@ class VersionManager:
     # 컴파일된 패턴
     COMPILED_PATTERNS = [re.compile(p, re.IGNORECASE) for p in VERSION_PATTERNS]
 
+    # 모든 버전 패턴을 하나로 합친 정규식 (문자열을 한 번만 스캔, 위치마다 앞쪽 패턴 우선)
+    COMBINED_PATTERN = re.compile(
+        '|'.join(f'(?:{p})' for p in VERSION_PATTERNS), re.IGNORECASE
+    )
+
     def __init__(self, config: OrganizerConfig):
         self.config = config
         self._fuzzy_hash_cache: Dict[Path, str] = {}
+        # 파일명 -> 버전 정보 (한 파일이 파일명/내용 그룹 양쪽에 들어가도 한 번만 분석)
+        self._version_info_cache: Dict[str, Dict] = {}
+        # 실행 간 유지되는 퍼지 해시 캐시 (처음 필요할 때 열림, 호출한 스레드에서만 사용)
+        self._persistent_cache: Optional[HashCache] = None
+        self._persistent_cache_failed = False
+
+    def _get_persistent_cache(self) -> Optional[HashCache]:
+        """영구 퍼지 해시 캐시 반환 (비활성화되었거나 열 수 없으면 None)"""
+        if self._persistent_cache is not None:
+            return self._persistent_cache
+        if not self.config.use_hash_cache or self._persistent_cache_failed:
+            return None
+
+        try:
+            self._persistent_cache = HashCache(
+                self.config.fuzzy_hash_cache_path or DEFAULT_FUZZY_CACHE_PATH, "ssdeep"
+            )
+        except (sqlite3.Error, OSError):
+            # 캐시를 쓸 수 없어도 퍼지 해시 계산은 계속 진행
+            self._persistent_cache_failed = True
+        return self._persistent_cache
+
+    def close(self):
+        """영구 퍼지 해시 캐시 기록 후 닫기"""
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.close()
+            except sqlite3.Error:
+                pass
+            self._persistent_cache = None
 
     def _extract_base_name(self, filename: str) -> str:
         """
@@ -96,42 +349,28 @@ class VersionManager:
         Returns:
             버전 정보가 제거된 기본 파일명
         """
-        base_name = filename
-
-        # 모든 버전 패턴 제거
-        for pattern in self.COMPILED_PATTERNS:
-            base_name = pattern.sub('', base_name)
-
-        # 연속된 구분자 정리
-        base_name = re.sub(r'[_\-\s]+', '_', base_name)
-        base_name = base_name.strip('_- ')
-
-        return base_name if base_name else filename
+        return _strip_version_info(filename, self.COMBINED_PATTERN)
 
-    def _calculate_similarity(self, name1: str, name2: str) -> float:
+    def _calculate_similarity(self, name1: str, name2: str, threshold: float = 0.0) -> float:
         """
         두 파일명의 유사도 계산 (0.0 ~ 1.0)
 
         Args:
             name1: 첫 번째 파일명
             name2: 두 번째 파일명
+            threshold: 이 값에 못 미칠 것이 길이만으로 확실하면 비교 없이 0.0 반환
 
         Returns:
             유사도 점수
         """
-        # 기본 이름 추출
-        base1 = self._extract_base_name(name1).lower()
-        base2 = self._extract_base_name(name2).lower()
-
-        # SequenceMatcher로 유사도 계산
-        return SequenceMatcher(None, base1, base2).ratio()
+        # 기본 이름 추출 (소문자 변환까지 파일명별로 캐시)
+        base1 = _base_name_key(name1, self.COMBINED_PATTERN)
+        base2 = _base_name_key(name2, self.COMBINED_PATTERN)
+        return _key_similarity(base1, base2, threshold)
 
     def _has_version_indicator(self, filename: str) -> bool:
         """파일명에 버전 표시가 있는지 확인"""
-        for pattern in self.COMPILED_PATTERNS:
-            if pattern.search(filename):
-                return True
-        return False
+        return self.COMBINED_PATTERN.search(filename) is not None
 
     def _extract_version_info(self, filename: str) -> Dict:
         """
@@ -141,8 +380,12 @@ class VersionManager:
             filename: 파일명
 
         Returns:
-            버전 정보 딕셔너리
+            버전 정보 딕셔너리 (파일명별로 캐시한 결과의 사본)
         """
+        cached = self._version_info_cache.get(filename)
+        if cached is not None:
+            return dict(cached)
+
         info = {
             'numeric_version': None,
             'date_version': None,
@@ -150,18 +393,23 @@ class VersionManager:
             'is_copy': False,
         }
 
+        # 버전 표시가 전혀 없는 파일명(대부분)은 한 번의 스캔으로 끝냄
+        if _ANY_VERSION_INFO_RE.search(filename) is None:
+            self._version_info_cache[filename] = info
+            return dict(info)
+
         # 숫자 버전
-        numeric_match = re.search(r'[_\-\s]?v(\d+)', filename, re.IGNORECASE)
+        numeric_match = _NUMERIC_VERSION_RE.search(filename)
         if numeric_match:
             info['numeric_version'] = int(numeric_match.group(1))
 
         # 괄호 안 숫자
-        paren_match = re.search(r'\((\d+)\)', filename)
+        paren_match = _PAREN_NUMBER_RE.search(filename)
         if paren_match and info['numeric_version'] is None:
             info['numeric_version'] = int(paren_match.group(1))
 
         # 날짜 버전
-        date_match = re.search(r'(\d{4})[-_]?(\d{2})[-_]?(\d{2})', filename)
+        date_match = _DATE_VERSION_RE.search(filename)
         if date_match:
             try:
                 year, month, day = map(int, date_match.groups())
@@ -170,19 +418,19 @@ class VersionManager:
             except ValueError:
                 pass
 
-        # 상태 표시
-        if re.search(r'(최종|final|완료|완성)', filename, re.IGNORECASE):
-            info['status'] = 'final'
-        elif re.search(r'(초안|draft|임시|temp)', filename, re.IGNORECASE):
-            info['status'] = 'draft'
-        elif re.search(r'(백업|backup|bak)', filename, re.IGNORECASE):
-            info['status'] = 'backup'
+        # 상태 표시 (한 번 스캔, 여러 개면 final > draft > backup 순으로 우선)
+        statuses = {match.lastgroup for match in _STATUS_RE.finditer(filename)}
+        for status in _STATUS_PRIORITY:
+            if status in statuses:
+                info['status'] = status
+                break
 
         # 복사본 여부
-        if re.search(r'(복사본|copy|사본|\(\d+\))', filename, re.IGNORECASE):
+        if _COPY_RE.search(filename):
             info['is_copy'] = True
 
-        return info
+        self._version_info_cache[filename] = info
+        return dict(info)
 
     def _calculate_fuzzy_hash(self, file_path: Path) -> Optional[str]:
         """
@@ -202,12 +450,73 @@ class VersionManager:
             return self._fuzzy_hash_cache[file_path]
 
         try:
-            fuzzy_hash = ssdeep.hash_from_file(str(file_path))
+            fuzzy_hash = _ssdeep_hash_file(file_path)
             self._fuzzy_hash_cache[file_path] = fuzzy_hash
             return fuzzy_hash
         except (IOError, OSError, PermissionError):
             return None
 
+    def _calculate_fuzzy_hashes(self, paths: List[Path]) -> List[Optional[str]]:
+        """
+        여러 파일의 ssdeep 퍼지 해시를 스레드 풀에서 계산
+
+        Args:
+            paths: 파일 경로 리스트
+
+        Returns:
+            paths와 같은 순서의 해시 (실패한 항목은 None)
+        """
+        if not SSDEEP_AVAILABLE:
+            return [None] * len(paths)
+
+        results: List[Optional[str]] = [None] * len(paths)
+        missing: List[int] = []
+
+        # 영구 캐시: 파일이 바뀌지 않았으면 stat 한 번으로 해시 재사용 (SQLite는 이 스레드에서만)
+        cache = self._get_persistent_cache()
+        stats: Dict[int, os.stat_result] = {}
+        for i, path in enumerate(paths):
+            cached = self._fuzzy_hash_cache.get(path)
+            if cached is None and cache is not None:
+                try:
+                    stats[i] = os.stat(path)
+                except OSError:
+                    continue
+                digest = cache.get(stats[i])
+                if digest is not None:
+                    cached = self._fuzzy_hash_cache[path] = digest.decode('ascii')
+            if cached is None:
+                missing.append(i)
+            else:
+                results[i] = cached
+
+        max_workers = self.config.hash_workers or min(os.cpu_count() or 1, 8)
+        missing_paths = [paths[i] for i in missing]
+        if len(missing) < _MIN_FILES_FOR_FUZZY_POOL or max_workers <= 1:
+            computed = map(self._calculate_fuzzy_hash, missing_paths)
+            executor = None
+        else:
+            # 캐시 딕셔너리에는 키 하나씩 대입만 하므로 CPython에서 별도 잠금 불필요
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            computed = executor.map(self._calculate_fuzzy_hash, missing_paths)
+
+        try:
+            for i, fuzzy_hash in zip(missing, computed):
+                results[i] = fuzzy_hash
+                if fuzzy_hash and i in stats:
+                    cache.put(stats[i], fuzzy_hash.encode('ascii'))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+        if cache is not None:
+            try:
+                cache.flush()
+            except sqlite3.Error:
+                pass
+
+        return results
+
     def _calculate_fuzzy_similarity(self, hash1: str, hash2: str) -> int:
         """
         두 ssdeep 해시 간 유사도 계산
@@ -227,35 +536,35 @@ class VersionManager:
         except Exception:
             return 0
 
-    def find_version_groups(self, files: List[FileInfo]) -> List[VersionGroup]:
+    def find_version_groups(self, files: Iterable[FileInfo]) -> List[VersionGroup]:
         """
         파일 목록에서 버전 그룹 탐지 (파일명 유사도 + 내용 유사도 기반)
 
         Args:
-            files: FileInfo 리스트
+            files: FileInfo 리스트 또는 이터러블 (한 번만 순회)
 
         Returns:
             VersionGroup 리스트
         """
-        # 확장자별로 그룹화
-        by_extension: Dict[str, List[FileInfo]] = defaultdict(list)
-        for file_info in files:
-            ext = file_info.path.suffix.lower()
-            by_extension[ext].append(file_info)
+        # (확장자, 기본 이름) 키로 한 번 정렬한 뒤 groupby로 선형 탐색
+        keyed = [
+            (file_info.suffix_lower, _base_name_key(file_info.path.stem, self.COMBINED_PATTERN), file_info)
+            for file_info in files
+        ]
+        keyed.sort(key=itemgetter(0, 1))
 
         all_groups: List[VersionGroup] = []
+        # 내용 유사도 단계는 확장자마다 확인하지 않고 한 번만 결정
+        use_content_similarity = SSDEEP_AVAILABLE and self.config.enable_content_similarity
 
-        for ext, ext_files in by_extension.items():
-            # 1단계: 파일명 유사도 기반 그룹화
-            base_name_groups: Dict[str, List[FileInfo]] = defaultdict(list)
-
-            for file_info in ext_files:
-                stem = file_info.path.stem
-                base_name = self._extract_base_name(stem)
-                base_name_groups[base_name.lower()].append(file_info)
+        for ext, ext_items in groupby(keyed, key=itemgetter(0)):
+            # 확장자별 파일 목록은 내용 유사도 단계에서만 필요 (아니면 정렬 결과를 그대로 한 번 훑음)
+            if use_content_similarity:
+                ext_items = list(ext_items)
 
-            # 2개 이상 파일이 있는 그룹만 선택
-            for base_name, group_files in base_name_groups.items():
+            # 1단계: 파일명 유사도 기반 그룹화 (2개 이상 파일이 있는 그룹만 선택)
+            for base_name, base_items in groupby(ext_items, key=itemgetter(1)):
+                group_files = [item[2] for item in base_items]
                 if len(group_files) > 1:
                     group = VersionGroup(base_name=base_name, extension=ext)
                     for f in group_files:
@@ -264,8 +573,8 @@ class VersionManager:
                     all_groups.append(group)
 
             # 2단계: 내용 유사도 기반 그룹화 (ssdeep 사용)
-            if SSDEEP_AVAILABLE:
-                content_groups = self._find_content_similar_groups(ext_files)
+            if use_content_similarity:
+                content_groups = self._find_content_similar_groups([item[2] for item in ext_items])
                 all_groups.extend(content_groups)
 
         # 추가: 유사도 기반 그룹 병합 시도
@@ -286,19 +595,39 @@ class VersionManager:
         if not SSDEEP_AVAILABLE or len(files) < 2:
             return []
 
-        # 퍼지 해시 계산
-        file_hashes: List[Tuple[FileInfo, str]] = []
+        # 퍼지 해시 계산 (파일 읽기/해싱 중 GIL이 해제되므로 스레드로 병렬 처리)
+        # 내용이 같다고 이미 알려진 파일(중복 탐지 해시, 하드링크)은 한 번만 읽음
+        representative: Dict[Tuple, int] = {}
+        unique_paths: List[Path] = []
+        slots: List[int] = []
         for file_info in files:
-            fuzzy_hash = self._calculate_fuzzy_hash(file_info.path)
-            if fuzzy_hash:
-                file_hashes.append((file_info, fuzzy_hash))
+            key = _content_identity(file_info)
+            slot = representative.get(key)
+            if slot is None:
+                slot = representative[key] = len(unique_paths)
+                unique_paths.append(file_info.path)
+            slots.append(slot)
+
+        unique_hashes = self._calculate_fuzzy_hashes(unique_paths)
+        fuzzy_hashes = [unique_hashes[slot] for slot in slots]
+        file_hashes: List[Tuple[FileInfo, str]] = [
+            (file_info, fuzzy_hash)
+            for file_info, fuzzy_hash in zip(files, fuzzy_hashes)
+            if fuzzy_hash
+        ]
 
         if len(file_hashes) < 2:
             return []
 
-        # 내용 유사도 기반 그룹화
+        # 내용 유사도 기반 그룹화 (union-find로 유사 쌍의 전이적 묶음을 구함)
         content_groups: List[VersionGroup] = []
-        used_indices = set()
+        parent = list(range(len(file_hashes)))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
 
         # 유사도 임계값 (설정 가능, 기본 75% 유사도)
         similarity_threshold = getattr(
@@ -307,30 +636,45 @@ class VersionManager:
             75
         )
 
-        for i, (file1, hash1) in enumerate(file_hashes):
-            if i in used_indices:
-                continue
-
-            # 새 그룹 생성
-            similar_files = [file1]
-            used_indices.add(i)
-
-            # 다른 파일들과 비교
-            for j, (file2, hash2) in enumerate(file_hashes):
-                if j <= i or j in used_indices:
+        # 7-gram 역색인: 키를 공유하는 파일만 비교 후보
+        # (나머지 쌍은 ssdeep.compare가 0이므로 임계값이 양수면 결과가 같음)
+        index_keys = [_ssdeep_index_keys(fuzzy_hash) for _, fuzzy_hash in file_hashes]
+        postings: Dict[Tuple, List[int]] = {}
+        for idx, keys in enumerate(index_keys):
+            for key in keys:
+                postings.setdefault(key, []).append(idx)
+
+        for i, (_, hash1) in enumerate(file_hashes):
+            if similarity_threshold > 0 and index_keys[i]:
+                candidates = set()
+                for key in index_keys[i]:
+                    candidates.update(postings[key])
+                candidate_indices = sorted(candidates)
+            else:
+                candidate_indices = range(len(file_hashes))
+
+            for j in candidate_indices:
+                if j <= i:
+                    continue
+                root_i, root_j = find(i), find(j)
+                # 이미 같은 묶음이면 비교 생략
+                if root_i == root_j:
                     continue
-
-                similarity = self._calculate_fuzzy_similarity(hash1, hash2)
 
                 # 유사도가 임계값 이상이면 같은 그룹
-                if similarity >= similarity_threshold:
-                    similar_files.append(file2)
-                    used_indices.add(j)
+                if self._calculate_fuzzy_similarity(hash1, file_hashes[j][1]) >= similarity_threshold:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
 
+        # 대표(가장 앞 인덱스)별로 모으기 (dict는 삽입 순서 유지)
+        clusters: Dict[int, List[FileInfo]] = {}
+        for idx, (file_info, _) in enumerate(file_hashes):
+            clusters.setdefault(find(idx), []).append(file_info)
+
+        for similar_files in clusters.values():
             # 2개 이상 유사 파일이 있으면 버전 그룹 생성
             if len(similar_files) > 1:
                 # 기본 이름은 가장 최신 파일의 이름 사용
-                latest_file = max(similar_files, key=lambda f: f.modified_time)
+                latest_file = max(similar_files, key=_MODIFIED_TIME)
                 base_name = self._extract_base_name(latest_file.path.stem)
 
                 group = VersionGroup(
@@ -362,6 +706,23 @@ class VersionManager:
         merged = []
         used = set()
 
+        # 같은 확장자 그룹끼리만 비교하므로 확장자별 인덱스 목록을 미리 만듦
+        indices_by_ext: Dict[str, List[int]] = {}
+        for idx, group in enumerate(groups):
+            indices_by_ext.setdefault(group.extension, []).append(idx)
+
+        # 그룹별 비교 키는 한 번만 만들고 쌍마다 다시 정리하지 않음
+        keys = [_base_name_key(group.base_name, self.COMBINED_PATTERN) for group in groups]
+
+        threshold = self.config.filename_similarity_threshold
+        if RAPIDFUZZ_AVAILABLE:
+            keys_by_ext = {
+                ext: [keys[idx] for idx in indices]
+                for ext, indices in indices_by_ext.items()
+            }
+            # 부동소수점 오차로 경계값이 빠지지 않도록 약간 낮춰 거른 뒤 다시 확인
+            score_cutoff = threshold * 100 - 1e-6
+
         for i, group1 in enumerate(groups):
             if i in used:
                 continue
@@ -375,18 +736,25 @@ class VersionManager:
             used.add(i)
 
             # 같은 확장자의 다른 그룹과 유사도 비교
-            for j, group2 in enumerate(groups):
-                if j in used or j <= i:
-                    continue
-                if group1.extension != group2.extension:
-                    continue
-
-                similarity = self._calculate_similarity(
-                    group1.base_name, group2.base_name
+            candidates = indices_by_ext[group1.extension]
+            if RAPIDFUZZ_AVAILABLE:
+                # 확장자 버킷 전체와의 비교를 한 번의 C 호출로 처리하고 기준 이상만 받음
+                matches = process.extract(
+                    keys[i], keys_by_ext[group1.extension],
+                    scorer=fuzz.ratio, processor=None,
+                    score_cutoff=score_cutoff, limit=None
+                )
+                candidates = sorted(
+                    candidates[pos] for _, score, pos in matches
+                    if score / 100.0 >= threshold
                 )
 
-                if similarity >= self.config.filename_similarity_threshold:
-                    for f in group2.files:
+            for j in candidates:
+                if j in used or j <= i:
+                    continue
+                # rapidfuzz 후보는 이미 기준 이상인 것만 남아 있음
+                if RAPIDFUZZ_AVAILABLE or _key_similarity(keys[i], keys[j], threshold) >= threshold:
+                    for f in groups[j].files:
                         current_group.add_file(f)
                     used.add(j)
 
@@ -404,8 +772,11 @@ class VersionManager:
             group: 분석할 버전 그룹
 
         Returns:
-            분석 결과 딕셔너리
+            분석 결과 딕셔너리 (그룹에 캐시, 같은 그룹을 다시 분석하면 재사용)
         """
+        if group.analysis is not None:
+            return group.analysis
+
         group.sort_by_date(newest_first=True)
 
         analysis = {
@@ -417,38 +788,58 @@ class VersionManager:
             'recommended_archive': [],
         }
 
-        final_version = None
-        latest_version = group.files[0] if group.files else None
+        # 파일별 경로 문자열은 한 번만 만들어 보존/아카이브 추천에서도 재사용
+        path_strs: Dict[int, str] = {}
 
         for file_info in group.files:
             version_info = self._extract_version_info(file_info.path.stem)
-            modified_date = datetime.fromtimestamp(file_info.modified_time)
+            path_str = path_strs[id(file_info)] = str(file_info.path)
 
             file_analysis = {
-                'path': str(file_info.path),
+                'path': path_str,
                 'filename': file_info.path.name,
                 'size': file_info.size,
-                'modified': modified_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'modified': _format_mtime(int(file_info.modified_time // 1)),
                 'version_info': version_info,
             }
             analysis['files'].append(file_analysis)
 
-            # 'final' 상태 파일 찾기
-            if version_info['status'] == 'final':
-                final_version = file_info
+        keep, archive = self.recommend_keep(group)
+        if keep is not None:
+            analysis['recommended_keep'] = path_strs[id(keep)]
+        analysis['recommended_archive'] = [path_strs[id(f)] for f in archive]
+
+        group.analysis = analysis
+        return analysis
+
+    def recommend_keep(self, group: VersionGroup) -> Tuple[Optional[FileInfo], List[FileInfo]]:
+        """
+        보존/아카이브 추천만 계산 (analyze_version_group의 파일별 상세 분석 생략)
 
-        # 보존 추천: final 버전이 있으면 그것, 아니면 최신 파일
-        if final_version:
-            analysis['recommended_keep'] = str(final_version.path)
-        elif latest_version:
-            analysis['recommended_keep'] = str(latest_version.path)
+        final 표시가 있는 파일이 있으면 그것(여러 개면 가장 오래된 것), 없으면 최신 파일을 보존
 
-        # 나머지는 아카이브 추천
+        Args:
+            group: 버전 그룹
+
+        Returns:
+            (보존할 파일 또는 None, 아카이브할 파일 리스트) - 그룹에 캐시
+        """
+        if group.keep_recommendation is not None:
+            keep, archive = group.keep_recommendation
+            return keep, list(archive)
+
+        group.sort_by_date(newest_first=True)
+        if not group.files:
+            return None, []
+
+        keep = group.files[0]
         for file_info in group.files:
-            if str(file_info.path) != analysis['recommended_keep']:
-                analysis['recommended_archive'].append(str(file_info.path))
+            if _FINAL_STATUS_RE.search(file_info.path.stem):
+                keep = file_info
 
-        return analysis
+        archive = [f for f in group.files if f.path != keep.path]
+        group.keep_recommendation = (keep, archive)
+        return keep, list(archive)
 
     def suggest_consolidation(self, groups: List[VersionGroup]) -> List[Dict]:
         """